@@ -1,8 +1,15 @@
 import json
+import os
+import tempfile
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from api import app
 import unittest
 
+from packutils.data.article import Article
+from packutils.data.order import Order
+
+from v1.config_grid import ConfigGrid, get_direction_change_volumes
 from v1.models.variants_request_model import ArticleModel, OrderModel
 
 
@@ -30,6 +37,34 @@ class TestPackerAPI(unittest.TestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_metrics(self):
+        response = self.client.get(f"{self.base_endpoint}/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("# TYPE packutils_api_packing_seconds histogram", response.text)
+
+    def test_packing_variants_profile(self):
+        self.order["articles"] = [
+            {"id": "test1", "width": 26, "length": 10, "height": 16, "amount": 5},
+        ]
+        data = {"order": self.order, "num_variants": 1, "profile": True}
+
+        with patch("v1.api.ENV_ENABLE_PROFILING", False):
+            response = self.client.post(f"{self.base_endpoint}/variants", json=data)
+        self.assertEqual(response.status_code, 403)
+
+        with tempfile.TemporaryDirectory() as profile_dir, patch(
+            "v1.profiling.ENV_PROFILE_DIR", profile_dir
+        ), patch("v1.api.ENV_ENABLE_PROFILING", True):
+            response = self.client.post(f"{self.base_endpoint}/variants", json=data)
+            self.assertEqual(response.status_code, 200)
+
+            profile = response.json()["profile"]
+            self.assertTrue(os.path.exists(profile["path"]))
+            self.assertEqual(os.path.dirname(profile["path"]), profile_dir)
+            self.assertTrue(
+                any("pack_variant" in f["function"] for f in profile["top_functions"])
+            )
+
     def test_packing_variants_invalid_articles(self):
         num_variants = 2
         invalid_articles = [
@@ -89,5 +124,53 @@ class TestPackerAPI(unittest.TestCase):
             self.assertEqual(response.status_code, 422)
 
 
+class TestConfigGrid(unittest.TestCase):
+    def test_get_configs(self):
+        grid = ConfigGrid(
+            {
+                "DEFAULT_SELECT_STRATEGY": "largest_h_w_l",
+                "MIRROR_WALLS": "[false]",
+                "PADDING_X": "2",
+                "NUM_VARIANTS": "3",
+            }
+        )
+        self.assertEqual(grid.num_variants, 3)
+        # new layer strategies x allow item exceeds layer
+        self.assertEqual(len(grid.get_configs()), len(grid.new_layer_select_strategy) * 2)
+        self.assertIs(grid.get_configs(), grid.get_configs())
+
+        configs = grid.get_configs([0.1, 0.2])
+        self.assertEqual(len(configs), len(grid.get_configs()) * 2)
+        self.assertEqual(
+            [c.direction_change_min_volume for c in configs[:4]], [0.1, 0.1, 0.2, 0.2]
+        )
+        for config in configs:
+            self.assertEqual(config.padding_x, 2)
+            self.assertFalse(config.mirror_walls)
+            self.assertEqual(config.to_configuration().padding_x, 2)
+
+    def test_default_strategies(self):
+        grid = ConfigGrid({})
+        # the opt-in strategy is not part of the default grid
+        self.assertEqual(len(grid.default_select_strategy), 7)
+        self.assertEqual(len(grid.get_configs()), 7 * 7 * 2 * 2)
+
+        grid = ConfigGrid({"DEFAULT_SELECT_STRATEGY": '["best_w_to_fill"]'})
+        self.assertEqual(grid.default_select_strategy, ["best_w_to_fill"])
+
+    def test_get_direction_change_volumes(self):
+        order = Order(
+            "order",
+            articles=[
+                Article("1", width=2, length=1, height=5, amount=3),
+                Article("2", width=5, length=1, height=2, amount=1),
+                Article("3", width=1, length=1, height=1, amount=2),
+                Article("4", width=3, length=1, height=1, amount=1),
+                Article("5", width=0.1 * 3, length=1, height=10, amount=1),
+            ],
+        )
+        self.assertEqual(get_direction_change_volumes(order, 100), [0.01, 0.03, 0.1])
+
+
 if __name__ == "__main__":
     unittest.main()
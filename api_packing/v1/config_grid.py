@@ -0,0 +1,181 @@
+import functools
+import itertools
+import json
+import math
+import os
+from typing import Callable, List, Mapping
+
+from packutils.data.order import Order
+from packutils.data.packer_configuration import (
+    ItemSelectStrategy,
+    PackerConfigurationTuple,
+)
+
+# the select strategies of the default grid, opt-in strategies are only used if set in the env
+DEFAULT_SELECT_STRATEGIES = [
+    strategy
+    for strategy in ItemSelectStrategy.list()
+    if strategy != ItemSelectStrategy.BEST_W_TO_FILL
+]
+
+
+def parse_env_list(
+    environ: Mapping[str, str], name: str, cast: Callable, default: "list | None"
+) -> "list | None":
+    """
+    Parses an environment variable containing a single value or a JSON list of values.
+
+    Args:
+        environ (Mapping[str, str]): The environment variables.
+        name (str): The name of the variable.
+        cast (Callable): Converts each value.
+        default (list | None): The values if the variable is not set.
+
+    Returns:
+        list | None: The values.
+    """
+    value = environ.get(name, None)
+    if value is None:
+        return default
+    if value.startswith("["):
+        return [cast(v) for v in json.loads(value)]
+    return [cast(value)]
+
+
+def get_direction_change_volumes(order: Order, bin_volume: float) -> List[float]:
+    """
+    Returns the distinct direction change volumes of an order.
+
+    The snappoint direction changes after packing an item with item volume / bin volume
+    >= direction change volume, so each distinct volume ratio of the articles is one
+    behavior. Ratios differing only by rounding errors are merged, the smaller ratio is kept.
+
+    Args:
+        order (Order): The order.
+        bin_volume (float): The volume of the bins.
+
+    Returns:
+        List[float]: The sorted direction change volumes.
+    """
+    ratios = sorted({a.width * a.length * a.height / bin_volume for a in order.articles})
+    volumes = []
+    for ratio in ratios:
+        if len(volumes) < 1 or not math.isclose(ratio, volumes[-1]):
+            volumes.append(ratio)
+    return volumes
+
+
+class ConfigGrid:
+    """
+    The packer configurations of the environment.
+
+    The environment is parsed once, the configurations are stored as lightweight
+    PackerConfigurationTuple. The grid of the environment is created once, grids with other
+    direction change volumes (e.g. per order) only substitute the volumes and reuse the
+    combinations of the other parameters.
+    """
+
+    def __init__(self, environ: "Mapping[str, str] | None" = None):
+        environ = os.environ if environ is None else environ
+
+        self.default_select_strategy = parse_env_list(
+            environ, "DEFAULT_SELECT_STRATEGY", ItemSelectStrategy, DEFAULT_SELECT_STRATEGIES
+        )
+        self.new_layer_select_strategy = parse_env_list(
+            environ,
+            "NEW_LAYER_SELECT_STRATEGY",
+            ItemSelectStrategy,
+            DEFAULT_SELECT_STRATEGIES,
+        )
+        self.bin_stability_factor = parse_env_list(
+            environ, "BIN_STABILITY_FACTOR", float, [1.0]
+        )
+        self.allow_item_exceeds_layer = parse_env_list(
+            environ, "ALLOW_ITEM_EXCEEDS_LAYER", bool, [True, False]
+        )
+        self.mirror_walls = parse_env_list(environ, "MIRROR_WALLS", bool, [True, False])
+        self.direction_change_volume = parse_env_list(
+            environ, "DIRECTION_CHANGE_VOLUMES", float, None
+        )
+        self.padding_x = int(environ.get("PADDING_X", 0))
+
+        num_variants = environ.get("NUM_VARIANTS", None)
+        self.num_variants = int(num_variants) if num_variants is not None else None
+
+        # the combinations of the parameters before and after the direction change volume
+        self._prefixes = list(
+            itertools.product(
+                self.default_select_strategy, self.new_layer_select_strategy
+            )
+        )
+        self._suffixes = list(
+            itertools.product(
+                self.bin_stability_factor,
+                self.allow_item_exceeds_layer,
+                self.mirror_walls,
+                # add here other possible parameter
+            )
+        )
+        self.configs = self.get_configs(self.direction_change_volume or [1.0])
+
+    def get_configs(
+        self, change_volumes: "List[float] | None" = None
+    ) -> List[PackerConfigurationTuple]:
+        """
+        Returns the configurations of all parameter combinations.
+
+        Args:
+            change_volumes (List[float] | None, optional): The direction change volumes, the
+                grid of the environment is returned if None (must not be modified).
+
+        Returns:
+            List[PackerConfigurationTuple]: The configurations.
+        """
+        if change_volumes is None:
+            return self.configs
+
+        return [
+            PackerConfigurationTuple(
+                default_select_strategy,
+                new_layer_select_strategy,
+                change_volume,
+                bin_stability_factor,
+                allow_item_exceeds_layer,
+                mirror_walls,
+                self.padding_x,
+            )
+            for default_select_strategy, new_layer_select_strategy in self._prefixes
+            for change_volume in change_volumes
+            for bin_stability_factor, allow_item_exceeds_layer, mirror_walls in self._suffixes
+        ]
+
+    def get_params(self) -> dict:
+        return {
+            "default_select_strategy": self.default_select_strategy,
+            "new_layer_select_strategy": self.new_layer_select_strategy,
+            "direction_change_volume": self.direction_change_volume,
+            "bin_stability_factor": self.bin_stability_factor,
+            "allow_item_exceeds_layer": self.allow_item_exceeds_layer,
+            "mirror_walls": self.mirror_walls,
+            "padding_x": self.padding_x,
+            "num_variants": self.num_variants,
+            "num_combinations": len(self.configs),
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_grid() -> ConfigGrid:
+    """Returns the configuration grid of the environment, created on the first request."""
+    dotenv_path = os.path.join(os.getcwd(), ".env")
+    if os.path.exists(dotenv_path):
+        from dotenv import load_dotenv
+
+        print("Loading .env file")
+        load_dotenv(dotenv_path)
+
+    grid = ConfigGrid()
+    print("Used variables:")
+    for k, v in grid.get_params().items():
+        print(f"{k :<50}: {v}")
+    print("")
+    return grid
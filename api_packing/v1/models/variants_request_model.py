@@ -48,3 +48,7 @@ class VariantsRequestModel(BaseModel):
     config: Optional[PackerConfiguration] = Field(
         description="Configuration for the packing algorithm", default=None
     )
+    profile: bool = Field(
+        description="Profile the request and return the profile summary (requires ENABLE_PROFILING)",
+        default=False,
+    )
@@ -0,0 +1,83 @@
+import cProfile
+import os
+import pstats
+import re
+import tempfile
+import time
+from typing import Any, Callable, Tuple
+
+ENV_ENABLE_PROFILING = os.environ.get("ENABLE_PROFILING", "false").lower() in (
+    "1",
+    "true",
+)
+ENV_PROFILE_DIR = os.environ.get(
+    "PROFILE_DIR", os.path.join(tempfile.gettempdir(), "packing_profiles")
+)
+
+# number of functions listed in the profile summary of the response
+NUM_TOP_FUNCTIONS = 25
+
+
+def profile_call(
+    function: Callable,
+    *args,
+    name: str = "profile",
+    profile_dir: "str | None" = None,
+) -> Tuple[Any, dict]:
+    """
+    Runs a function under cProfile and stores the profile as pstats file.
+
+    Args:
+        function (Callable): The function to profile.
+        *args: The arguments of the function.
+        name (str, optional): The name of the profile (e.g. the order id), used in the file name.
+        profile_dir (str | None, optional): The directory of the pstats files, PROFILE_DIR
+            of the environment if None.
+
+    Returns:
+        Tuple[Any, dict]: The result of the function and the profile summary (path of the
+        pstats file, total duration and the functions with the highest cumulative time).
+    """
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    result = profiler.runcall(function, *args)
+    duration = time.perf_counter() - start
+
+    profile_dir = profile_dir if profile_dir is not None else ENV_PROFILE_DIR
+    os.makedirs(profile_dir, exist_ok=True)
+    file_name = "%s_%d.pstats" % (re.sub(r"[^\w.-]", "_", name), time.time_ns())
+    path = os.path.join(profile_dir, file_name)
+    profiler.dump_stats(path)
+
+    return result, {
+        "path": path,
+        "total_seconds": duration,
+        "top_functions": get_top_functions(pstats.Stats(profiler)),
+    }
+
+
+def get_top_functions(stats: pstats.Stats, limit: int = NUM_TOP_FUNCTIONS) -> list:
+    """
+    Returns the functions with the highest cumulative time of the profile.
+
+    Args:
+        stats (pstats.Stats): The profile statistics.
+        limit (int, optional): The number of functions.
+
+    Returns:
+        list: The functions as dicts (function, calls, total_seconds, cumulative_seconds).
+    """
+    rows = sorted(
+        stats.stats.items(), key=lambda function_stats: function_stats[1][3], reverse=True
+    )
+    return [
+        {
+            "function": "%s:%d(%s)" % (file_name, line, function_name),
+            "calls": calls,
+            "total_seconds": total_time,
+            "cumulative_seconds": cumulative_time,
+        }
+        for (file_name, line, function_name), (_, calls, total_time, cumulative_time, _) in rows[
+            :limit
+        ]
+    ]
@@ -3,12 +3,70 @@ from packutils.data.item import Item
 from typing import List, Tuple
 import numpy as np
 
+from packutils.data.extreme_points import ExtremePoints
+from packutils.data.packed_items import PackedItems
 from packutils.data.position import Position
 from packutils.data.snappoint import Snappoint, SnappointDirection
 
 # describes the percentage of the bottom area required to lay on top of other item
 DEFAULT_STABILITY_FACTOR = 0.75
 
+FINGERPRINT_MASK = (1 << 64) - 1
+
+
+def mix_fingerprint(value: int) -> int:
+    """
+    Spreads a hash value over 64 bits (splitmix64 finalizer).
+
+    Fingerprints of packed items are summed up, mixing the hash values first avoids that
+    different combinations of similar items produce the same sum.
+
+    Args:
+        value (int): The hash value to mix.
+
+    Returns:
+        int: The mixed 64 bit value.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & FINGERPRINT_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & FINGERPRINT_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & FINGERPRINT_MASK
+    return value ^ (value >> 31)
+
+
+def get_item_fingerprint(
+    item: Item, x: "int | None" = None, y: "int | None" = None
+) -> int:
+    """
+    Calculates the fingerprint of an item, which depends on its dimensions, weight and position.
+
+    Args:
+        item (Item): The item.
+        x (int, optional): Replaces the x-coordinate of the item position (used for mirrored bins).
+        y (int, optional): Replaces the y-coordinate of the item position (used for mirrored bins).
+
+    Returns:
+        int: The 64 bit fingerprint of the item.
+    """
+    # hash(None) differs between processes, so only hash numbers and tuples of numbers
+    # (items without weight weigh nothing)
+    weight = item.weight or 0.0
+    position = item.position
+    if position is None:
+        return mix_fingerprint(hash((item.dimensions, weight)))
+
+    return mix_fingerprint(
+        hash(
+            (
+                item.dimensions,
+                weight,
+                position.x if x is None else x,
+                position.y if y is None else y,
+                position.z,
+                position.rotation,
+            )
+        )
+    )
+
 
 class Bin:
     """
@@ -45,11 +103,118 @@ class Bin:
         )
 
         self.matrix = np.zeros((height, length, width), dtype=int)
-        self.packed_items: List[Item] = []
+
+        # maintained incrementally on pack_item and item removal
+        self._height_map = np.zeros((length, width), dtype=int)
+
+        # undo log: one entry per packed item (item, previous height map slice, generation)
+        self._change_log: List[Tuple[Item, "np.ndarray | None", int]] = []
+        self._change_log_generation = 0
+
+        self.packed_items = []
+
+    @property
+    def packed_items(self) -> List[Item]:
+        """
+        The packed items in the order they were packed.
+
+        Use pack_item, unpack_last and remove_item to change the packed items. Assigning a
+        new list is supported but does not update the occupancy matrix.
+        """
+        return self._packed_items
+
+    @packed_items.setter
+    def packed_items(self, items: List[Item]):
+        self._packed_items: List[Item] = items
+        # columnar view of the packed items
+        self.packed_columns = PackedItems.from_items(items)
+        # the logged height map slices are unknown for assigned items
+        self._change_log = [(item, None, -1) for item in items]
+        # extreme point index, created on first use
+        self._extreme_points: "ExtremePoints | None" = None
+
+        # running totals: used volume, weight and first moments of volume and weight
+        columns = self.packed_columns
+        centerpoints = columns.centerpoints
+        self._used_volume = int(np.sum(columns.volumes))
+        self._total_weight = float(np.sum(columns.weights))
+        self._volume_moment = (columns.volumes @ centerpoints).tolist()
+        self._weight_moment = (columns.weights @ centerpoints).tolist()
+        # order independent hashes of the packed items (sum of item fingerprints)
+        # for the bin itself and the bin mirrored along x, y and both axes
+        self._fingerprints = [0, 0, 0, 0]
+        for item in items:
+            self._update_fingerprints(item, 1)
+
+    def copy(self) -> "Bin":
+        """
+        Creates a snapshot of the bin.
+
+        The arrays (occupancy matrix, height map, packed columns, extreme points) and the
+        lists are copied, the packed items themselves are shared with the original bin.
+        This is much faster than copy.deepcopy and intended for solvers exploring
+        multiple partial packings.
+
+        Returns:
+            Bin: The snapshot.
+        """
+        # the scalar attributes are shared, the mutable containers are replaced
+        snapshot = copy.copy(self)
+        snapshot.matrix = self.matrix.copy()
+        snapshot._height_map = self._height_map.copy()
+        snapshot._change_log = list(self._change_log)
+        snapshot._packed_items = list(self._packed_items)
+        snapshot.packed_columns = self.packed_columns.copy()
+        snapshot._volume_moment = list(self._volume_moment)
+        snapshot._weight_moment = list(self._weight_moment)
+        snapshot._fingerprints = list(self._fingerprints)
+        snapshot._extreme_points = (
+            self._extreme_points.copy() if self._extreme_points is not None else None
+        )
+        return snapshot
+
+    def _update_totals(self, item: Item, sign: int):
+        # items without weight (None) weigh nothing
+        volume, weight = item.volume, item.weight or 0.0
+        centerpoint = (
+            item.position.x + item.width / 2,
+            item.position.y + item.length / 2,
+            item.position.z + item.height / 2,
+        )
+        self._used_volume += sign * volume
+        self._total_weight += sign * weight
+        for axis in range(3):
+            self._volume_moment[axis] += sign * volume * centerpoint[axis]
+            self._weight_moment[axis] += sign * weight * centerpoint[axis]
+        self._update_fingerprints(item, sign)
+
+    def _update_fingerprints(self, item: Item, sign: int):
+        mirrored_x = self.width - item.position.x - item.width
+        mirrored_y = self.length - item.position.y - item.length
+        item_fingerprints = (
+            get_item_fingerprint(item),
+            get_item_fingerprint(item, x=mirrored_x),
+            get_item_fingerprint(item, y=mirrored_y),
+            get_item_fingerprint(item, x=mirrored_x, y=mirrored_y),
+        )
+        for index, item_fingerprint in enumerate(item_fingerprints):
+            self._fingerprints[index] = (
+                self._fingerprints[index] + sign * item_fingerprint
+            ) & FINGERPRINT_MASK
 
     def can_item_be_packed(self, item: Item) -> Tuple[bool, "str | None"]:
         if not item.is_packed():
             return False, f"{item.id}: Position is None."
+
+        if (
+            self.max_weight is not None
+            and self._total_weight + (item.weight or 0.0) > self.max_weight
+        ):
+            return (
+                False,
+                f"{item.id}: Item exceeds the maximum weight of the bin (weight condition).",
+            )
+
         x, y, z = item.position.x, item.position.y, item.position.z
         if (
             x < 0
@@ -93,12 +258,111 @@ class Bin:
 
         if can_be_packed:
             self.packed_items.append(item)
+            self.packed_columns.append(item)
+            self._update_totals(item, 1)
             x, y, z = item.position.x, item.position.y, item.position.z
             self.matrix[
                 z : z + item.height, y : y + item.length, x : x + item.width
             ] = len(self.packed_items)
+
+            footprint = self._height_map[y : y + item.length, x : x + item.width]
+            self._change_log.append(
+                (item, footprint.copy(), self._change_log_generation)
+            )
+            np.maximum(footprint, z + item.height, out=footprint)
+
+            if self._extreme_points is not None:
+                columns = self.packed_columns
+                self._extreme_points.add_item(
+                    columns.positions[-1],
+                    columns.dimensions[-1],
+                    columns.positions,
+                    columns.dimensions,
+                )
         return can_be_packed, info
 
+    def unpack_last(self) -> "Item | None":
+        """
+        Removes the most recently packed item and restores the previous bin state.
+
+        The occupancy matrix and the height map (and therefore the used volume and the snappoints)
+        are restored incrementally using the change log written by pack_item.
+
+        Returns:
+            Item | None: The removed item or None if the bin is empty.
+        """
+        if len(self._change_log) < 1:
+            return None
+
+        item, previous_heights, generation = self._change_log.pop()
+        self.packed_items.pop()
+        self.packed_columns.remove(-1)
+        self._clear_item(item)
+        if self._extreme_points is not None:
+            self._extreme_points.undo()
+
+        x, y = item.position.x, item.position.y
+        footprint = self._height_map[y : y + item.length, x : x + item.width]
+        if previous_heights is not None and generation == self._change_log_generation:
+            footprint[:] = previous_heights
+        else:
+            # an item below was removed out of order, the logged slice is outdated
+            self._update_height_map(item)
+        return item
+
+    def remove_item(self, item: Item) -> Tuple[bool, "str | None"]:
+        """
+        Removes a packed item from the bin.
+
+        Removing the last packed item is equivalent to unpack_last. Removing any other item
+        recalculates the height map only below the footprint of the removed item.
+        Items on top of the removed item are not checked for stability.
+
+        Args:
+            item (Item): The item to be removed.
+
+        Returns:
+            Tuple[bool, str]: A tuple containing a boolean indicating if the item was removed
+            and a string message explaining the result.
+        """
+        try:
+            index = self.packed_items.index(item)
+        except ValueError:
+            return False, f"{item.id}: Item is not packed in this bin."
+
+        if index == len(self.packed_items) - 1:
+            self.unpack_last()
+            return True, None
+
+        packed = self.packed_items.pop(index)
+        self.packed_columns.remove(index)
+        self._change_log.pop(index)
+        # logged height map slices of the following items may contain the removed item
+        self._change_log_generation += 1
+
+        self._clear_item(packed)
+        # the matrix holds the 1-based placement index, renumber the following items
+        np.subtract(self.matrix, 1, out=self.matrix, where=self.matrix > index + 1)
+        self._update_height_map(packed)
+        self._extreme_points = None
+        return True, None
+
+    def _clear_item(self, item: Item):
+        self._update_totals(item, -1)
+        x, y, z = item.position.x, item.position.y, item.position.z
+        self.matrix[z : z + item.height, y : y + item.length, x : x + item.width] = 0
+
+    def _update_height_map(self, item: Item):
+        """
+        Recalculates the height map below the footprint of an item using the occupancy matrix.
+        """
+        x, y = item.position.x, item.position.y
+        columns = self.matrix[:, y : y + item.length, x : x + item.width] != 0
+        # index of the highest occupied cell per column (+1), 0 for empty columns
+        top = columns.shape[0] - np.argmax(columns[::-1], axis=0)
+        top[~np.any(columns, axis=0)] = 0
+        self._height_map[y : y + item.length, x : x + item.width] = top
+
     def _is_item_position_stable(self, item: Item) -> bool:
         """
         Check if an item's position is stable based on the already packed items below it.
@@ -189,7 +453,7 @@ class Bin:
         Returns:
         int: The maximum z value of the Bin.
         """
-        return int(np.max(self.get_height_map()))
+        return int(np.max(self._height_map))
 
     @property
     def volume(self) -> int:
@@ -212,7 +476,7 @@ class Bin:
         Returns:
             float: The used volume of the Bin.
         """
-        used_volume = sum([item.volume for item in self.packed_items])
+        used_volume = self._used_volume
 
         if use_percentage:
             return int(used_volume / self.volume * 100)
@@ -225,13 +489,8 @@ class Bin:
         Returns:
             numpy.ndarray: A 2D array representing the height map of the bin's packing matrix.
         """
-        height_matrix = np.zeros(self.matrix.shape)
-        for z in range(height_matrix.shape[0]):
-            height_matrix[z] = z + 1
-        height_matrix *= self.matrix != 0
-
-        height_map = np.max(height_matrix, axis=0)
-        return height_map
+        # the height map is maintained as int, the returned copy keeps the float dtype
+        return self._height_map.astype(float)
 
     def get_snappoints(self, min_z: "int | None" = None) -> List[Snappoint]:
         """
@@ -293,6 +552,33 @@ class Bin:
 
         return snappoints
 
+    @property
+    def extreme_points(self) -> ExtremePoints:
+        """
+        The extreme point index of the bin.
+
+        The index is created on first access and updated incrementally by pack_item and
+        unpack_last. Removing any other item discards the index, it is rebuilt on the next access.
+        """
+        if self._extreme_points is None:
+            self._extreme_points = ExtremePoints.from_packed_items(
+                self.width, self.length, self.height, self.packed_columns
+            )
+        return self._extreme_points
+
+    def get_extreme_points(self) -> np.ndarray:
+        """
+        Return the extreme points of the bin.
+
+        An extreme point is a corner position next to or on top of the packed items
+        (or the walls of the bin) where a new item can be placed. Unlike get_snappoints
+        this works for 2D and 3D packing.
+
+        Returns:
+            numpy.ndarray: The (x, y, z) extreme points with shape (k, 3).
+        """
+        return self.extreme_points.get_active_points()
+
     def get_center_of_gravity(self, use_volume=False) -> Position:
         """
         Calculate the center of gravity for the items packed in the bin.
@@ -304,39 +590,90 @@ class Bin:
         Returns:
             Position: The calculated center of gravity.
         """
-        m, x, y, z = [], [], [], []
+        if use_volume:
+            total, moment = self._used_volume, self._volume_moment
+        else:
+            total, moment = self._total_weight, self._weight_moment
 
-        for item in self.packed_items:
-            m.append(item.volume if use_volume else item.weight)
-            x.append(item.centerpoint().x)
-            y.append(item.centerpoint().y)
-            z.append(item.centerpoint().z)
+        if total == 0:
+            return Position(x=0, y=0, z=0)
 
-        m, x, y, z = np.array(m), np.array(x), np.array(y), np.array(z)
+        # the running moments drift by rounding errors (e.g. 4.9999999 instead of 5),
+        # round them off before truncating to the cell
+        cgx, cgy, cgz = [int(round(m / total, 6)) for m in moment]
+        return Position(x=cgx, y=cgy, z=cgz)
 
-        if np.sum(m) == 0:
-            return Position(x=0, y=0, z=0)
+    def get_total_weight(self) -> float:
+        """
+        Calculate the total weight of the items packed in the bin.
 
-        cgx = np.sum(x * m) / np.sum(m)
-        cgy = np.sum(y * m) / np.sum(m)
-        cgz = np.sum(z * m) / np.sum(m)
-        return Position(x=int(cgx), y=int(cgy), z=int(cgz))
+        Returns:
+            float: The total weight of the packed items.
+        """
+        return self._total_weight
 
     def __repr__(self):
         return (
             f"Bin: {self.width} {self.length} {self.height} - Items{self.packed_items}"
         )
 
+    @property
+    def fingerprint(self) -> int:
+        """
+        Order independent 64 bit hash of the packed items, updated on every packed or removed item.
+
+        Two bins with the same items at the same positions have the same fingerprint,
+        regardless of the order the items were packed in.
+
+        Returns:
+            int: The fingerprint of the packed items.
+        """
+        return self._fingerprints[0]
+
+    @property
+    def canonical_fingerprint(self) -> int:
+        """
+        Fingerprint of the packed items that is invariant under mirroring the bin along the x-axis
+        and the y-axis, i.e. a packing and its mirrored packing have the same canonical fingerprint.
+
+        Returns:
+            int: The smallest fingerprint of the bin and its mirrored versions.
+        """
+        return min(self._fingerprints)
+
     def __eq__(self, other):
         return (
             self.width == other.width
             and self.length == other.length
             and self.height == other.height
-            and self.packed_items == other.packed_items
+            and len(self.packed_items) == len(other.packed_items)
+            and self.fingerprint == other.fingerprint
+            # the fingerprints may collide, confirm with the packed items
+            and self.get_items_key() == other.get_items_key()
         )
 
+    def get_items_key(self) -> tuple:
+        """
+        Get a key of the packed items, which ignores the order in which the items were packed.
+
+        Returns:
+            tuple: The sorted (dimensions, weight, position, id) of the packed items.
+        """
+        keys = []
+        for item in self.packed_items:
+            position = item.position
+            keys.append(
+                (
+                    item.dimensions,
+                    item.weight or 0.0,
+                    (position.x, position.y, position.z, position.rotation),
+                    item.id,
+                )
+            )
+        return tuple(sorted(keys))
+
     def __hash__(self):
-        return hash((self.width, self.length, self.height, tuple(self.packed_items)))
+        return hash((self.width, self.length, self.height, self.fingerprint))
 
 
 if __name__ == "__main__":
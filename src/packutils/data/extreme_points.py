@@ -0,0 +1,244 @@
+import numpy as np
+
+from packutils.data.packed_items import PackedItems
+
+DEFAULT_CAPACITY = 64
+
+
+class ExtremePoints:
+    """
+    Incremental index of the extreme points (corner points) of a bin.
+
+    Extreme points are the positions where the next item can be placed with its
+    left-back-bottom corner. Each packed item adds the corners next to it (in front,
+    to the right and on top) and the projections of these corners onto the closest
+    item or bin wall along the negative axes. Points covered by a packed item are
+    deactivated.
+
+    The points are stored append-only, so the index of a point never changes. This allows
+    solvers to keep per point data (e.g. feasibility per item shape) in arrays aligned with
+    the points.
+
+    Attributes:
+        width (int): The width of the bin.
+        length (int): The length of the bin.
+        height (int): The height of the bin.
+    """
+
+    def __init__(self, width: int, length: int, height: int):
+        """
+        Initializes the index with the origin of the bin as only extreme point.
+
+        Args:
+            width (int): The width of the bin.
+            length (int): The length of the bin.
+            height (int): The height of the bin.
+        """
+        self.width = width
+        self.length = length
+        self.height = height
+
+        self._points = np.zeros((DEFAULT_CAPACITY, 3), dtype=int)
+        self._active = np.zeros(DEFAULT_CAPACITY, dtype=bool)
+        self._size = 0
+        self._append(np.zeros((1, 3), dtype=int))
+        # per added item: (size before the item, indices of the deactivated points)
+        self._history = []
+
+    @classmethod
+    def from_packed_items(
+        cls, width: int, length: int, height: int, columns: PackedItems
+    ) -> "ExtremePoints":
+        """
+        Creates the index for a bin by replaying the placements of the packed items.
+
+        Args:
+            width (int): The width of the bin.
+            length (int): The length of the bin.
+            height (int): The height of the bin.
+            columns (PackedItems): The packed items of the bin.
+
+        Returns:
+            ExtremePoints: The created index.
+        """
+        points = cls(width, length, height)
+        for index in range(len(columns)):
+            points.add_item(
+                columns.positions[index],
+                columns.dimensions[index],
+                columns.positions[: index + 1],
+                columns.dimensions[: index + 1],
+            )
+        return points
+
+    def copy(self) -> "ExtremePoints":
+        """
+        Creates an independent copy of the index.
+
+        Returns:
+            ExtremePoints: The copy.
+        """
+        points = ExtremePoints.__new__(ExtremePoints)
+        points.width, points.length, points.height = self.width, self.length, self.height
+        points._points = self._points.copy()
+        points._active = self._active.copy()
+        points._size = self._size
+        points._history = list(self._history)
+        return points
+
+    @property
+    def points(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: All points ever added with shape (n, 3), including inactive points.
+        """
+        return self._points[: self._size]
+
+    @property
+    def active(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: Boolean mask of the points that are still extreme points.
+        """
+        return self._active[: self._size]
+
+    def get_active_points(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The current extreme points with shape (k, 3).
+        """
+        return self.points[self.active]
+
+    def add_item(
+        self,
+        position: np.ndarray,
+        dimension: np.ndarray,
+        positions: np.ndarray,
+        dimensions: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Updates the extreme points after an item was packed.
+
+        Args:
+            position (numpy.ndarray): The (x, y, z) position of the packed item.
+            dimension (numpy.ndarray): The (width, length, height) of the packed item.
+            positions (numpy.ndarray): The positions of all packed items (including the new item).
+            dimensions (numpy.ndarray): The dimensions of all packed items (including the new item).
+
+        Returns:
+            numpy.ndarray: The indices of the added points.
+        """
+        x, y, z = (int(v) for v in position)
+        w, l, h = (int(v) for v in dimension)
+        ends = positions + dimensions
+
+        corners = np.array(((x + w, y, z), (x, y + l, z), (x, y, z + h)), dtype=int)
+        # each corner is projected along the two axes it was not moved along
+        projected = np.repeat(corners, 2, axis=0)
+        axes = np.array((1, 2, 0, 2, 0, 1))
+        projected[np.arange(6), axes] = _project(projected, axes, positions, ends)
+        candidates = np.concatenate((corners, projected))
+        candidates = np.array(
+            list(dict.fromkeys(map(tuple, candidates.tolist()))), dtype=int
+        )
+        candidates = candidates[
+            (candidates[:, 0] < self.width)
+            & (candidates[:, 1] < self.length)
+            & (candidates[:, 2] < self.height)
+        ]
+
+        # deactivate the points covered by the new item
+        points = self.points
+        covered = np.all(
+            (points >= (x, y, z)) & (points < (x + w, y + l, z + h)), axis=1
+        )
+        deactivated = np.flatnonzero(covered & self.active)
+        self._active[deactivated] = False
+
+        # skip candidates inside other items or already known as active point
+        if len(candidates) > 0:
+            inside = np.any(
+                np.all(
+                    (candidates[:, None, :] >= positions[None, :, :])
+                    & (candidates[:, None, :] < ends[None, :, :]),
+                    axis=2,
+                ),
+                axis=1,
+            )
+            active_points = points[self.active]
+            known = np.any(
+                np.all(candidates[:, None, :] == active_points[None, :, :], axis=2),
+                axis=1,
+            )
+            candidates = candidates[~inside & ~known]
+
+        start = self._size
+        self._append(candidates)
+        self._history.append((start, deactivated))
+        return np.arange(start, self._size)
+
+    def undo(self) -> bool:
+        """
+        Reverts the last add_item call.
+
+        Returns:
+            bool: True if an item was reverted, False if there is nothing to revert.
+        """
+        if len(self._history) < 1:
+            return False
+        start, deactivated = self._history.pop()
+        self._active[start : self._size] = False
+        self._size = start
+        self._active[deactivated] = True
+        return True
+
+    def _append(self, points: np.ndarray):
+        required = self._size + len(points)
+        if required > len(self._active):
+            capacity = max(2 * len(self._active), required)
+            resized_points = np.zeros((capacity, 3), dtype=int)
+            resized_points[: self._size] = self.points
+            resized_active = np.zeros(capacity, dtype=bool)
+            resized_active[: self._size] = self.active
+            self._points, self._active = resized_points, resized_active
+
+        self._points[self._size : required] = points
+        self._active[self._size : required] = True
+        self._size = required
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.active))
+
+    def __repr__(self):
+        return f"ExtremePoints({self.get_active_points().tolist()})"
+
+
+def _project(
+    points: np.ndarray, axes: np.ndarray, positions: np.ndarray, ends: np.ndarray
+) -> np.ndarray:
+    """
+    Projects each point along the negative direction of its axis onto the closest
+    item face (or the bin wall at 0).
+
+    Args:
+        points (numpy.ndarray): The points with shape (k, 3).
+        axes (numpy.ndarray): The axis to project along per point with shape (k,).
+        positions (numpy.ndarray): The positions of the packed items with shape (n, 3).
+        ends (numpy.ndarray): The positions plus dimensions of the packed items with shape (n, 3).
+
+    Returns:
+        numpy.ndarray: The projected coordinate per point with shape (k,).
+    """
+    # shape (points, items, axes)
+    spans = (positions[None, :, :] <= points[:, None, :]) & (
+        points[:, None, :] < ends[None, :, :]
+    )
+    behind = ends[None, :, :] <= points[:, None, :]
+
+    # items lying behind the point along its axis and spanning it in the two other axes
+    along_axis = np.zeros((len(points), 3), dtype=bool)
+    along_axis[np.arange(len(points)), axes] = True
+    mask = np.all(np.where(along_axis[:, None, :], behind, spans), axis=2)
+
+    faces = ends[:, axes].T
+    return np.max(np.where(mask, faces, 0), axis=1, initial=0)
@@ -1,5 +1,6 @@
-from ast import Tuple
-from typing import List
+import functools
+import itertools
+from typing import List, Tuple
 from packutils.data.article import Article
 from packutils.data.position import Position
 
@@ -31,6 +32,19 @@ class Item:
 
     """
 
+    # width, length, height and weight are exposed as properties to keep the cached values valid
+    __slots__ = (
+        "id",
+        "_width",
+        "_length",
+        "_height",
+        "_weight",
+        "position",
+        "_volume",
+        "_surface",
+        "_dimensions_hash",
+    )
+
     def __init__(
         self,
         id: str,
@@ -53,11 +67,55 @@ class Item:
 
         """
         self.id = id
-        self.width = width
-        self.length = length
-        self.height = height
-        self.weight = weight
+        self._width = width
+        self._length = length
+        self._height = height
+        self._weight = weight
         self.position = position
+        self._update_cache()
+
+    def _update_cache(self):
+        self._volume = int(self._width * self._length * self._height)
+        self._surface = int(self._width * self._length)
+        self._dimensions_hash = hash(
+            (self._width, self._length, self._height, self._weight)
+        )
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        self._update_cache()
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @length.setter
+    def length(self, value: int):
+        self._length = value
+        self._update_cache()
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, value: int):
+        self._height = value
+        self._update_cache()
+
+    @property
+    def weight(self) -> float:
+        return self._weight
+
+    @weight.setter
+    def weight(self, value: float):
+        self._weight = value
+        self._update_cache()
 
     def centerpoint(self) -> Position:
         """
@@ -102,21 +160,9 @@ class Item:
         if not self.is_packed():
             return self.width, self.length, self.height
 
-        rot_type = self.position.rotation
-        if rot_type == 1:
-            h, w, l = self.width, self.height, self.length
-        elif rot_type == 2:
-            l, w, h = self.width, self.height, self.length
-        elif rot_type == 3:
-            l, h, w = self.width, self.height, self.length
-        elif rot_type == 4:
-            h, l, w = self.width, self.height, self.length
-        elif rot_type == 5:
-            w, l, h = self.width, self.height, self.length
-        else:  # rotation None or 0
-            w, h, l = self.width, self.height, self.length
-
-        return w, l, h
+        return get_rotated_dimensions(
+            self.width, self.length, self.height, self.position.rotation
+        )
 
     def to_position_and_dimension_2d(self, dimensions: List[str]):
         """
@@ -170,7 +216,7 @@ class Item:
         Returns:
         int: The volume of the Item.
         """
-        return int(self.width * self.length * self.height)
+        return self._volume
 
     @property
     def surface(self) -> int:
@@ -180,7 +226,7 @@ class Item:
         Returns:
         int: The surface of the Item.
         """
-        return int(self.width * self.length)
+        return self._surface
 
     @property
     def dimensions(self) -> "Tuple[int, int, int]":
@@ -191,7 +237,7 @@ class Item:
             Tuple[int, int, int]: The dimensions of the item.
 
         """
-        return (self.width, self.length, self.height)
+        return (self._width, self._length, self._height)
 
     def __repr__(self) -> str:
         """
@@ -207,14 +253,29 @@ class Item:
         return self.__hash__() == other.__hash__()
 
     def __hash__(self):
-        return hash(
-            (
-                self.width,
-                self.length,
-                self.height,
-                self.weight,
-                self.position.__hash__(),
-            )
+        return hash((self._dimensions_hash, self.position.__hash__()))
+
+    def __copy__(self) -> "Item":
+        return Item(
+            self.id,
+            self._width,
+            self._length,
+            self._height,
+            self._weight,
+            self.position,
+        )
+
+    def __deepcopy__(self, memo) -> "Item":
+        position = self.position
+        if position is not None:
+            position = position.__copy__()
+        return Item(
+            self.id,
+            self._width,
+            self._length,
+            self._height,
+            self._weight,
+            position,
         )
 
     @classmethod
@@ -243,3 +304,135 @@ class Item:
             weight=article.weight,
             position=None,
         )
+
+
+# rotation types as used by Position.rotation (0 is the original orientation)
+ROTATION_TYPES = (0, 1, 2, 3, 4, 5)
+
+
+def get_rotated_dimensions(
+    width: int, length: int, height: int, rotation: "int | None"
+) -> "tuple[int, int, int]":
+    """
+    Returns the dimensions of an item rotated by the given rotation type.
+
+    Args:
+        width (int): The width of the item.
+        length (int): The length of the item.
+        height (int): The height of the item.
+        rotation (int | None): The rotation type (0-5), None is the original orientation.
+
+    Returns:
+        tuple[int, int, int]: The rotated (width, length, height).
+    """
+    if rotation == 1:
+        h, w, l = width, height, length
+    elif rotation == 2:
+        l, w, h = width, height, length
+    elif rotation == 3:
+        l, h, w = width, height, length
+    elif rotation == 4:
+        h, l, w = width, height, length
+    elif rotation == 5:
+        w, l, h = width, height, length
+    else:  # rotation None or 0
+        w, h, l = width, height, length
+
+    return w, l, h
+
+
+def get_rotated_padded_dimensions(
+    item: Item, rotation: int, padding_x: int = 0
+) -> "tuple[int, int, int]":
+    """
+    Returns the dimensions of an item rotated without its padding, the padding is added
+    to the rotated width.
+
+    Args:
+        item (Item): The item in its original orientation, the width includes the padding.
+        rotation (int): The rotation type.
+        padding_x (int, optional): The padding included in the width of the item. Default is 0.
+
+    Returns:
+        tuple[int, int, int]: The rotated (width, length, height).
+    """
+    width, length, height = get_rotated_dimensions(
+        item.width - padding_x, item.length, item.height, rotation
+    )
+    return width + padding_x, length, height
+
+
+def get_rotated_item(item: Item, rotation: int, padding_x: int = 0) -> Item:
+    """
+    Creates a copy of an unpacked item with rotated dimensions.
+
+    The rotation type is stored in the (placeholder) position of the copy and kept
+    when the item is packed on a snappoint. The padding stays on the width (x axis).
+
+    Args:
+        item (Item): The item in its original orientation, the width includes the padding.
+        rotation (int): The rotation type.
+        padding_x (int, optional): The padding included in the width of the item. Default is 0.
+
+    Returns:
+        Item: The rotated copy.
+    """
+    width, length, height = get_rotated_padded_dimensions(item, rotation, padding_x)
+    return Item(
+        id=item.id,
+        width=width,
+        length=length,
+        height=height,
+        weight=item.weight,
+        position=Position(0, 0, 0, rotation=rotation),
+    )
+
+
+def get_unrotated_dimensions(
+    dims: "tuple[int, int, int]", rotation: "int | None", padding_x: int = 0
+) -> "tuple[int, int, int]":
+    """
+    Returns the dimensions of an item in its original orientation (the inverse of
+    get_rotated_padded_dimensions).
+
+    Args:
+        dims (tuple[int, int, int]): The rotated (width, length, height), the width includes the padding.
+        rotation (int | None): The rotation type of the dimensions.
+        padding_x (int, optional): The padding included in the width. Default is 0.
+
+    Returns:
+        tuple[int, int, int]: The (width, length, height) in the original orientation, the width includes the padding.
+    """
+    if not rotation:
+        return tuple(dims)
+    raw = (dims[0] - padding_x, dims[1], dims[2])
+    for width, length, height in itertools.permutations(raw):
+        if get_rotated_dimensions(width, length, height, rotation) == raw:
+            return width + padding_x, length, height
+    raise ValueError(f"Invalid rotation type: {rotation}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_orientations(
+    width: int, length: int, height: int, padding_x: int = 0
+) -> "tuple[tuple[int, tuple[int, int, int]], ...]":
+    """
+    Get the distinct orientations of an item shape.
+
+    Rotations resulting in the same dimensions (e.g. for cube-like items) are only
+    returned once, the original orientation (rotation 0) is always the first.
+
+    Args:
+        width (int): The width of the item (without padding).
+        length (int): The length of the item.
+        height (int): The height of the item.
+        padding_x (int, optional): The padding added to the rotated width. Default is 0.
+
+    Returns:
+        tuple[tuple[int, tuple[int, int, int]]]: The rotation type and the rotated (padded) dimensions of each orientation.
+    """
+    orientations = {}
+    for rotation in ROTATION_TYPES:
+        w, l, h = get_rotated_dimensions(width, length, height, rotation)
+        orientations.setdefault((w + padding_x, l, h), rotation)
+    return tuple((rotation, dims) for dims, rotation in orientations.items())
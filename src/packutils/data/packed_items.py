@@ -0,0 +1,188 @@
+from typing import List
+import numpy as np
+
+from packutils.data.item import Item
+
+DEFAULT_CAPACITY = 16
+
+
+class PackedItems:
+    """
+    Columnar (struct of arrays) representation of the items packed into a bin.
+
+    The arrays grow by doubling their capacity, so appending an item is amortized O(1).
+    All array properties return views limited to the packed items, ordered like Bin.packed_items.
+
+    Attributes:
+        ids (List[str]): The IDs of the packed items.
+        rotations (List[int]): The rotations of the packed items.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initializes an empty PackedItems container.
+
+        Args:
+            capacity (int, optional): The initial number of rows of the arrays. Default is 16.
+        """
+        capacity = max(int(capacity), 1)
+        self.ids: List[str] = []
+        self.rotations: List[int] = []
+        self._positions = np.zeros((capacity, 3), dtype=int)
+        self._dimensions = np.zeros((capacity, 3), dtype=int)
+        self._weights = np.zeros(capacity, dtype=float)
+        self._order = np.zeros(capacity, dtype=int)
+        self._size = 0
+        self._placements = 0
+
+    def append(self, item: Item):
+        """
+        Appends a packed item.
+
+        Args:
+            item (Item): The packed item.
+        """
+        if self._size == len(self._order):
+            self._grow()
+
+        index = self._size
+        position = item.position
+        self._positions[index] = (position.x, position.y, position.z)
+        self._dimensions[index] = (item.width, item.length, item.height)
+        # items without weight (None) weigh nothing
+        self._weights[index] = item.weight or 0.0
+        self._order[index] = self._placements
+        self.ids.append(item.id)
+        self.rotations.append(position.rotation)
+
+        self._size += 1
+        self._placements += 1
+
+    def remove(self, index: int):
+        """
+        Removes the item at the given index and keeps the order of the remaining items.
+
+        Args:
+            index (int): The index of the item (same as in Bin.packed_items).
+        """
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("PackedItems index out of range")
+
+        last = self._size - 1
+        if index < last:
+            for array in (self._positions, self._dimensions, self._weights, self._order):
+                array[index:last] = array[index + 1 : self._size]
+        del self.ids[index]
+        del self.rotations[index]
+        self._size -= 1
+
+    def clear(self):
+        """
+        Removes all items.
+        """
+        self.ids = []
+        self.rotations = []
+        self._size = 0
+
+    def _grow(self):
+        capacity = 2 * len(self._order)
+        self._positions = _resize(self._positions, capacity)
+        self._dimensions = _resize(self._dimensions, capacity)
+        self._weights = _resize(self._weights, capacity)
+        self._order = _resize(self._order, capacity)
+
+    def copy(self) -> "PackedItems":
+        """
+        Creates an independent copy (the arrays are copied, the items are not needed).
+
+        Returns:
+            PackedItems: The copy.
+        """
+        packed = PackedItems.__new__(PackedItems)
+        packed.ids = list(self.ids)
+        packed.rotations = list(self.rotations)
+        packed._positions = self._positions.copy()
+        packed._dimensions = self._dimensions.copy()
+        packed._weights = self._weights.copy()
+        packed._order = self._order.copy()
+        packed._size = self._size
+        packed._placements = self._placements
+        return packed
+
+    @classmethod
+    def from_items(cls, items: List[Item]) -> "PackedItems":
+        """
+        Creates a PackedItems container from a list of packed items.
+
+        Args:
+            items (List[Item]): The packed items.
+
+        Returns:
+            PackedItems: The created container.
+        """
+        packed = cls(capacity=max(len(items), DEFAULT_CAPACITY))
+        for item in items:
+            packed.append(item)
+        return packed
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The (x, y, z) positions with shape (n, 3).
+        """
+        return self._positions[: self._size]
+
+    @property
+    def dimensions(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The (width, length, height) dimensions with shape (n, 3).
+        """
+        return self._dimensions[: self._size]
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The weights with shape (n,).
+        """
+        return self._weights[: self._size]
+
+    @property
+    def order(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The placement index of each item with shape (n,).
+        """
+        return self._order[: self._size]
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The volumes with shape (n,).
+        """
+        return np.prod(self.dimensions, axis=1)
+
+    @property
+    def centerpoints(self) -> np.ndarray:
+        """
+        Returns:
+            numpy.ndarray: The (x, y, z) centerpoints with shape (n, 3).
+        """
+        return self.positions + self.dimensions / 2
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self):
+        return f"PackedItems({self._size} items)"
+
+
+def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+    resized = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+    resized[: len(array)] = array
+    return resized
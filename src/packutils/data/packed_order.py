@@ -113,20 +113,25 @@ class PackedOrder:
             variant_data = []
 
             for idx, bin in enumerate(variant.bins):
-                positions = []
-                for item in bin.packed_items:
-                    positions.append(
-                        {
-                            "article_id": item.id,
-                            "x": item.position.x,
-                            "y": item.position.y,
-                            "z": item.position.z,
-                            "rotation": item.position.rotation,
-                            "centerpoint_x": item.centerpoint().x,
-                            "centerpoint_y": item.centerpoint().y,
-                            "centerpoint_z": item.centerpoint().z,
-                        }
+                columns = bin.packed_columns
+                positions = [
+                    {
+                        "article_id": article_id,
+                        "x": x,
+                        "y": y,
+                        "z": z,
+                        "rotation": rotation,
+                        "centerpoint_x": cx,
+                        "centerpoint_y": cy,
+                        "centerpoint_z": cz,
+                    }
+                    for article_id, rotation, (x, y, z), (cx, cy, cz) in zip(
+                        columns.ids,
+                        columns.rotations,
+                        columns.positions.tolist(),
+                        columns.centerpoints.tolist(),
                     )
+                ]
 
                 variant_data.append(
                     {
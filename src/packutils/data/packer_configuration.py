@@ -1,3 +1,4 @@
+import collections
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel
@@ -19,6 +20,9 @@ class ItemSelectStrategy(str, ExtendedEnum):
     LARGEST_W_TO_FILL = "largest_w_to_fill"
     LARGEST_W_H_TO_FILL = "largest_w_h_to_fill"
 
+    # exact subset sum over the item widths filling the remaining width of the layer
+    BEST_W_TO_FILL = "best_w_to_fill"
+
 
 class PackerConfiguration(BaseModel):
     default_select_strategy: Optional[
@@ -51,3 +55,27 @@ class PackerConfiguration(BaseModel):
                 self.mirror_walls,
             )
         )
+
+
+class PackerConfigurationTuple(
+    collections.namedtuple(
+        "PackerConfigurationTuple",
+        list(PackerConfiguration.model_fields),
+        defaults=[field.default for field in PackerConfiguration.model_fields.values()],
+    )
+):
+    """
+    Lightweight immutable PackerConfiguration (same fields and defaults) without validation,
+    for creating and passing many configurations in hot paths.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_configuration(
+        cls, config: PackerConfiguration
+    ) -> "PackerConfigurationTuple":
+        return cls(**dict(config))
+
+    def to_configuration(self) -> PackerConfiguration:
+        return PackerConfiguration(**self._asdict())
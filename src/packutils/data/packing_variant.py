@@ -1,6 +1,6 @@
 from typing import List
 from packutils.data.item import Item
-from packutils.data.bin import Bin
+from packutils.data.bin import FINGERPRINT_MASK, Bin, get_item_fingerprint
 
 
 class PackingVariant:
@@ -42,13 +42,73 @@ class PackingVariant:
     def __repr__(self):
         return f"Bins: {self.bins}, unpacked items: {self.unpacked_items}"
 
-    def __eq__(self, other):
-        return self.bins == other.bins and self.unpacked_items == other.unpacked_items
+    def get_fingerprint(self, canonical: bool = False) -> tuple:
+        """
+        Get a key identifying the packing variant, based on the fingerprints of the bins.
 
-    def __hash__(self):
-        return hash(
+        The key ignores the order in which the items were packed and the order of the unpacked items.
+
+        Args:
+            canonical (bool, optional): Whether to use the canonical fingerprints of the bins, so that
+                                        variants with mirrored bins get the same key. Defaults to False.
+
+        Returns:
+            tuple: The dimensions and fingerprint of each bin and the fingerprint of the unpacked items.
+        """
+        unpacked_fingerprint = (
+            sum(get_item_fingerprint(item) for item in self.unpacked_items)
+            & FINGERPRINT_MASK
+        )
+        return (
+            tuple(
+                (
+                    bin.width,
+                    bin.length,
+                    bin.height,
+                    len(bin.packed_items),
+                    bin.canonical_fingerprint if canonical else bin.fingerprint,
+                )
+                for bin in self.bins
+            ),
+            len(self.unpacked_items),
+            unpacked_fingerprint,
+        )
+
+    def get_items_key(self) -> tuple:
+        """
+        Get a key of the items of the packing variant, which ignores the order of the items.
+
+        Unlike the fingerprint the key cannot collide, it is used to confirm equal fingerprints.
+
+        Returns:
+            tuple: The sorted (dimensions, weight, position) of the packed items of each bin and
+            of the unpacked items.
+        """
+        return (
             tuple(
-                [hash(bin) for bin in self.bins]
-                + [hash(item) for item in self.unpacked_items]
-            )
+                tuple(sorted(_get_item_key(item) for item in bin.packed_items))
+                for bin in self.bins
+            ),
+            tuple(sorted(_get_item_key(item) for item in self.unpacked_items)),
         )
+
+    def __eq__(self, other):
+        # the fingerprints are compared first, the items only if the fingerprints are equal
+        return (
+            self.get_fingerprint() == other.get_fingerprint()
+            and self.get_items_key() == other.get_items_key()
+        )
+
+    def __hash__(self):
+        return hash(self.get_fingerprint())
+
+
+def _get_item_key(item: Item) -> tuple:
+    position = item.position
+    return (
+        item.dimensions,
+        item.weight or 0.0,
+        ()
+        if position is None
+        else (position.x, position.y, position.z, position.rotation),
+    )
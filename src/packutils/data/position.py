@@ -14,6 +14,8 @@ class Position:
 
     """
 
+    __slots__ = ("x", "y", "z", "rotation")
+
     def __init__(self, x: int, y: int, z: int, rotation: int = 0):
         """
         Initializes a Position object with the specified coordinates and rotation.
@@ -38,3 +40,10 @@ class Position:
 
     def __hash__(self):
         return hash((self.x, self.y, self.z, self.rotation))
+
+    def __copy__(self) -> "Position":
+        return Position(self.x, self.y, self.z, self.rotation)
+
+    def __deepcopy__(self, memo) -> "Position":
+        # all attributes are immutable values
+        return Position(self.x, self.y, self.z, self.rotation)
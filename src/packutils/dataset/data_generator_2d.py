@@ -8,9 +8,14 @@ from packutils.data.article import Article
 from packutils.data.bin import Bin
 
 from packutils.data.order import Order
-from packutils.solver.greedy_packer import GreedyPacker
-from packutils.solver.palletier_wish_packer import PalletierWishPacker
-from packutils.solver.py3dbp_packer import Py3dbpPacker
+from packutils.solver.registry import create_packer
+
+# packing solver -> registered packer name, the packers are imported on first use
+PACKING_SOLVERS = {
+    "greedy": "greedy",
+    "palletier": "palletier_wish",
+    "py3dbp": "py3dbp",
+}
 
 
 class DataGenerator2d:
@@ -60,20 +65,14 @@ class DataGenerator2d:
         self.equally_dist_seq_len = equally_dist_seq_len
 
         self.packing_solver = packing_solver
-        if packing_solver == "greedy":
-            self.solver = GreedyPacker(
-                bins=reference_bins, rotation=self.allow_rotation, **kwargs
-            )
-        elif packing_solver == "palletier":
-            self.solver = PalletierWishPacker(
-                bins=reference_bins, rotation=self.allow_rotation, **kwargs
-            )
-        elif packing_solver == "py3dbp":
-            self.solver = Py3dbpPacker(
-                bins=reference_bins, rotation=self.allow_rotation, **kwargs
-            )
-        else:
+        if packing_solver not in PACKING_SOLVERS:
             raise ValueError(f"Solver not supported: {packing_solver}")
+        self.solver = create_packer(
+            PACKING_SOLVERS[packing_solver],
+            bins=reference_bins,
+            rotation=self.allow_rotation,
+            **kwargs,
+        )
         self.date = datetime.datetime.now()
         date_str = self.date.strftime("%Y%m%d")
         dataset_name = f"data_{self.dimensionality}_{num_data}_{date_str}"
@@ -0,0 +1,175 @@
+import math
+from typing import List
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.order import Order
+from packutils.data.packing_variant import PackingVariant
+
+
+def get_lower_bound(
+    order: Order, bins: List[Bin], padding_x: int = 0, rotation: bool = False
+) -> int:
+    """
+    Returns a lower bound on the number of bins needed to pack all articles of the order.
+
+    The bound is the maximum of the continuous bounds (volume, weight) and the 1D L2 bounds
+    (Martello and Toth) along each axis. The bins are treated as copies of a bin with the
+    largest dimensions and weight of all bins, so the bound is valid for mixed bins too.
+
+    Args:
+        order (Order): The order.
+        bins (List[Bin]): The reference bins.
+        padding_x (int, optional): The padding added to the (rotated) width of each article.
+            Default is 0.
+        rotation (bool, optional): Whether the items may be rotated, only the continuous
+            bounds are used if True. Default is False.
+
+    Returns:
+        int: The lower bound on the number of bins.
+    """
+    dimensions, weights = _get_item_arrays(order, padding_x, rotation)
+    return _get_lower_bound(dimensions, weights, bins, rotation)
+
+
+def get_items_lower_bound(
+    items: List[Item], bins: List[Bin], rotation: bool = False, padding_x: int = 0
+) -> int:
+    """
+    Returns a lower bound on the number of bins needed to pack the items (see get_lower_bound).
+
+    Args:
+        items (List[Item]): The items.
+        bins (List[Bin]): The reference bins.
+        rotation (bool, optional): Whether the items may be rotated. Default is False.
+        padding_x (int, optional): The padding included in the width of the items, it is
+            added to the rotated width if rotation is True. Default is 0.
+
+    Returns:
+        int: The lower bound on the number of bins.
+    """
+    dimensions = _get_dimensions(
+        [(item.width - padding_x, item.length, item.height) for item in items],
+        padding_x,
+        rotation,
+    )
+    weights = np.array([item.weight or 0.0 for item in items], dtype=float)
+    return _get_lower_bound(dimensions, weights, bins, rotation)
+
+
+def _get_lower_bound(
+    dimensions: np.ndarray, weights: np.ndarray, bins: List[Bin], rotation: bool
+) -> int:
+    if len(dimensions) < 1:
+        return 0
+
+    bin_dimensions = np.array(
+        [
+            max(bin.width for bin in bins),
+            max(bin.length for bin in bins),
+            max(bin.height for bin in bins),
+        ]
+    )
+    max_weights = [bin.max_weight for bin in bins]
+    max_weight = None if None in max_weights else max(max_weights)
+
+    bound = get_volume_bound(dimensions, bin_dimensions)
+    if max_weight is not None and max_weight > 0:
+        bound = max(bound, math.ceil(weights.sum() / max_weight - 1e-9))
+    if rotation:
+        return bound
+
+    for axis in range(3):
+        others = [a for a in range(3) if a != axis]
+        # items larger than the half bin in both other dimensions can not be placed next to
+        # each other, they are stacked along the axis (one dimensional bin packing)
+        large = np.all(dimensions[:, others] > bin_dimensions[others] / 2, axis=1)
+        if np.any(large):
+            bound = max(bound, get_l2_bound(dimensions[large, axis], bin_dimensions[axis]))
+    return bound
+
+
+def get_volume_bound(dimensions: np.ndarray, bin_dimensions: np.ndarray) -> int:
+    """
+    Returns the continuous lower bound: the total item volume divided by the bin volume.
+
+    Args:
+        dimensions (np.ndarray): The dimensions (width, length, height) of the items, shape (n, 3).
+        bin_dimensions (np.ndarray): The dimensions of the bin.
+
+    Returns:
+        int: The lower bound on the number of bins.
+    """
+    volume = int(np.prod(dimensions, axis=1).sum())
+    return -(-volume // int(np.prod(bin_dimensions)))
+
+
+def get_l2_bound(sizes: np.ndarray, capacity: int) -> int:
+    """
+    Returns the L2 lower bound of Martello and Toth for one dimensional bin packing.
+
+    For each threshold K (0 and all sizes up to half the capacity) the items larger than
+    capacity - K need a bin each, the items larger than half the capacity too. The items
+    between K and half the capacity fill the remaining space of the bins of the latter.
+
+    Args:
+        sizes (np.ndarray): The item sizes, all sizes are at most the capacity.
+        capacity (int): The bin capacity.
+
+    Returns:
+        int: The lower bound on the number of bins.
+    """
+    sizes = np.asarray(sizes)
+    if len(sizes) < 1:
+        return 0
+    thresholds = np.unique(np.append(sizes[2 * sizes <= capacity], 0))
+
+    # shape (thresholds, items)
+    j1 = sizes[None, :] > capacity - thresholds[:, None]
+    j2 = ~j1 & (2 * sizes[None, :] > capacity)
+    j3 = (2 * sizes[None, :] <= capacity) & (sizes[None, :] >= thresholds[:, None])
+
+    num_j2 = np.count_nonzero(j2, axis=1)
+    free = num_j2 * capacity - (j2 * sizes).sum(axis=1)
+    overflow = np.maximum((j3 * sizes).sum(axis=1) - free, 0)
+    bounds = np.count_nonzero(j1, axis=1) + num_j2 + -(-overflow // capacity)
+    return int(bounds.max())
+
+
+def meets_lower_bound(variant: PackingVariant, lower_bound: int) -> bool:
+    """
+    Checks whether a variant packs all items into the minimum number of bins.
+
+    Args:
+        variant (PackingVariant): The packing variant.
+        lower_bound (int): The lower bound on the number of bins (see get_lower_bound).
+
+    Returns:
+        bool: True if no item is unpacked and no more bins than the lower bound are used.
+    """
+    return len(variant.unpacked_items) < 1 and len(variant.bins) <= lower_bound
+
+
+def _get_item_arrays(
+    order: Order, padding_x: int, rotation: bool = False
+) -> "tuple[np.ndarray, np.ndarray]":
+    articles = [a for a in order.articles if a.amount > 0]
+    amounts = np.array([a.amount for a in articles], dtype=int)
+    dimensions = _get_dimensions(
+        [(a.width, a.length, a.height) for a in articles], padding_x, rotation
+    )
+    weights = np.array([a.weight or 0.0 for a in articles], dtype=float)
+    return np.repeat(dimensions, amounts, axis=0), np.repeat(weights, amounts)
+
+
+def _get_dimensions(
+    shapes: "List[tuple[int, int, int]]", padding_x: int, rotation: bool
+) -> np.ndarray:
+    if rotation:
+        # the padding is added to the rotated width, the smallest padded volume has the
+        # largest dimension as width
+        shapes = [sorted(shape, reverse=True) for shape in shapes]
+    return np.array(
+        [(w + padding_x, l, h) for w, l, h in shapes], dtype=int
+    ).reshape(-1, 3)
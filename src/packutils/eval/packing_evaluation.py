@@ -1,3 +1,4 @@
+import collections
 from typing import List
 import numpy as np
 
@@ -5,6 +6,10 @@ from packutils.data.bin import Bin
 from packutils.data.item import Item
 from packutils.data.packer_configuration import PackerConfiguration
 from packutils.data.packing_variant import PackingVariant
+from packutils.monitoring import metrics
+
+# number of variants whose order independent scores are cached
+SCORE_CACHE_SIZE = 1024
 
 
 class PackingEvaluationWeights:
@@ -34,62 +39,114 @@ class PackingEvaluation:
     def __init__(self, weights: PackingEvaluationWeights):
         self.weights = weights
 
+        # order independent scores of the bins by canonical variant fingerprint (least recently
+        # used first), mirrored variants share the same scores
+        self._score_cache = collections.OrderedDict()
+
     def evaluate_packing_variants(
         self,
         variants: List[PackingVariant],
         configs: List[PackerConfiguration],
         return_scores_dict=False,
+        merge_mirrored=True,
     ):
-        unique_variants = list(set(variants))
-        grouped_configs = [[] for _ in range(len(unique_variants))]
+        """
+        Evaluate packing variants, variants created by multiple configurations are evaluated once.
+
+        Args:
+            variants (List[PackingVariant]): The packing variants.
+            configs (List[PackerConfiguration]): The configuration used for each variant.
+            return_scores_dict (bool, optional): Whether to return the score details too. Defaults to False.
+            merge_mirrored (bool, optional): Whether to treat variants with mirrored bins as duplicates. Defaults to True.
+
+        Returns:
+            Iterator of (score, (variant, configs)) for each unique variant.
+        """
+        variant_indices = {}
+        unique_variants = []
+        stacking_scores = []
+        grouped_configs = []
         for variant, config in zip(variants, configs):
-            grouped_configs[unique_variants.index(variant)].append(config)
+            # the stacking score depends on the placement order, which the fingerprint ignores
+            stacking = self._evaluate_stacking_scores(variant)
+            key = (variant.get_fingerprint(canonical=merge_mirrored), stacking)
+            if key not in variant_indices:
+                variant_indices[key] = len(unique_variants)
+                unique_variants.append(variant)
+                stacking_scores.append(stacking)
+                grouped_configs.append([])
+            grouped_configs[variant_indices[key]].append(config)
+        metrics.VARIANTS_EVALUATED.inc(len(unique_variants))
+        metrics.VARIANTS_DEDUPLICATED.inc(len(variants) - len(unique_variants))
 
-        if return_scores_dict:
-            scores = [self.evaluate_packing_variant(v) for v in unique_variants]
-        else:
-            scores = [self.evaluate_packing_variant(v)[0] for v in unique_variants]
+        scores = [
+            self._evaluate_packing_variant(v, stacking)
+            for v, stacking in zip(unique_variants, stacking_scores)
+        ]
+        if not return_scores_dict:
+            scores = [score for score, _ in scores]
 
         scored_variants = zip(scores, zip(unique_variants, grouped_configs))
         return scored_variants
 
     def evaluate_packing_variant(self, variant: PackingVariant):
-        scores = [self.evaluate_bin(bin) for bin in variant.bins]
+        return self._evaluate_packing_variant(
+            variant, self._evaluate_stacking_scores(variant)
+        )
+
+    def _evaluate_packing_variant(self, variant: PackingVariant, stacking_scores: tuple):
+        key = variant.get_fingerprint(canonical=True)
+        bin_details = self._score_cache.get(key, None)
+        if bin_details is None:
+            bin_details = [self._evaluate_order_independent(bin) for bin in variant.bins]
+            self._score_cache[key] = bin_details
+            if len(self._score_cache) > SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+        else:
+            self._score_cache.move_to_end(key)
+
+        scores = [
+            self._get_bin_score(details, stacking)
+            for details, stacking in zip(bin_details, stacking_scores)
+        ]
         score = np.mean([s[0] for s in scores])
         score_details = {}
         for idx, (_, s) in enumerate(scores):
             score_details[f"Bin {idx+1}"] = s
         return score, score_details
 
-    def evaluate_bin(self, bin: Bin):
-        score = 0
-        details = {}
-
-        item_distribution_score = (
-            self.weights.item_distribution * self._evaluate_item_distribution(bin)
-        )
-        details["item_distribution"] = item_distribution_score
-        score += item_distribution_score
-
-        item_stacking_score = self.weights.item_stacking * self._evaluate_item_stacking(
-            bin
-        )
-        details["item_stacking"] = item_stacking_score
-        score += item_stacking_score
-
-        item_grouping_score = self.weights.item_grouping * self._evaluate_item_grouping(
-            bin
-        )
-        details["item_grouping"] = item_grouping_score
-        score += item_grouping_score
+    def _evaluate_stacking_scores(self, variant: PackingVariant) -> tuple:
+        return tuple(self._evaluate_item_stacking(bin) for bin in variant.bins)
 
-        utilized_space_score = (
-            self.weights.utilized_space * bin.get_used_volume() / bin.volume
+    def evaluate_bin(self, bin: Bin):
+        return self._get_bin_score(
+            self._evaluate_order_independent(bin), self._evaluate_item_stacking(bin)
         )
 
-        details["utilized_space"] = utilized_space_score
-        score += utilized_space_score
-
+    def _evaluate_order_independent(self, bin: Bin) -> dict:
+        """
+        Evaluates the weighted scores of the bin that do not depend on the placement order.
+        """
+        return {
+            "item_distribution": self.weights.item_distribution
+            * self._evaluate_item_distribution(bin),
+            "item_grouping": self.weights.item_grouping
+            * self._evaluate_item_grouping(bin),
+            "utilized_space": self.weights.utilized_space
+            * bin.get_used_volume()
+            / bin.volume,
+        }
+
+    def _get_bin_score(self, order_independent: dict, item_stacking: float):
+        details = {
+            "item_distribution": order_independent["item_distribution"],
+            "item_stacking": self.weights.item_stacking * item_stacking,
+            "item_grouping": order_independent["item_grouping"],
+            "utilized_space": order_independent["utilized_space"],
+        }
+        score = 0
+        for value in details.values():
+            score += value
         score /= self.weights.total
         return score, details
 
@@ -98,48 +155,50 @@ class PackingEvaluation:
         The goal is to put larger items on the sides of the pallet and to center the smaller items.
         This metric calculates the distance of the items to the center and scores it depending on the item volume.
         """
-        scores = [
+        columns = bin.packed_columns
+        x = columns.positions[:, 0]
+        width = columns.dimensions[:, 0]
+
+        distance_to_side = np.minimum(x, bin.width - x - width)
+        scores = (
             1
-            - (
-                min(item.position.x, bin.width - item.position.x - item.width)
-                / (bin.width / 2)
-            )
-            * item.volume
+            - (distance_to_side / (bin.width / 2))
+            * columns.volumes
             / bin.get_used_volume()
-            for item in bin.packed_items
-        ]
+        )
         return np.mean(scores)
 
     def _evaluate_item_stacking(self, bin: Bin):
         """
         The goal is to put smaller items on top of larger items. Therefore the distance
         """
+        columns = bin.packed_columns
+        center = columns.centerpoints
+        dims = columns.dimensions
+        volumes = columns.volumes
+        num_items = len(columns)
+
+        if num_items < 1:
+            return np.mean([])
+
+        # below[i, j]: item j was packed before item i and is (partially) below it
+        below = (
+            np.abs(center[:, None, 0] - center[None, :, 0])
+            < np.maximum(dims[:, None, 0], dims[None, :, 0]) / 2
+        ) & (
+            np.abs(center[:, None, 1] - center[None, :, 1])
+            < np.maximum(dims[:, None, 1], dims[None, :, 1]) / 2
+        )
+        below &= np.tri(num_items, k=-1, dtype=bool)
 
-        seen_items = []
-        scores = []
-
-        for item in bin.packed_items:
-            items_below = [
-                other
-                for other in seen_items
-                if (
-                    abs(other.centerpoint().x - item.centerpoint().x)
-                    < max(item.width, other.width) / 2
-                    and abs(other.centerpoint().y - item.centerpoint().y)
-                    < max(item.length, other.length) / 2
-                )
-            ]
-            seen_items.append(item)
-
-            if len(items_below) < 1:
-                scores.append(1)
-                continue
-
-            smaller_items_below = [
-                other for other in items_below if (other.volume < item.volume)
-            ]
-            scores.append(1 - len(smaller_items_below) / len(items_below))
+        num_below = np.count_nonzero(below, axis=1)
+        num_smaller_below = np.count_nonzero(
+            below & (volumes[None, :] < volumes[:, None]), axis=1
+        )
 
+        scores = np.ones(num_items)
+        has_below = num_below > 0
+        scores[has_below] = 1 - num_smaller_below[has_below] / num_below[has_below]
         return np.mean(scores)
 
     def _distance_between_items(self, item1: Item, item2: Item):
@@ -158,41 +217,31 @@ class PackingEvaluation:
         """
         The goal is to group items of same type. The score is calculated by counting touching items (direct neighbors). This number is divided by the number of other items in the group or by 4 if more than 5 items are in the group.
         """
+        columns = bin.packed_columns
+        if len(columns) < 1:
+            return 1
 
         scores = []
 
-        groups = set(
-            [(item.width, item.length, item.height) for item in bin.packed_items]
+        groups, group_indices = np.unique(
+            columns.dimensions, axis=0, return_inverse=True
         )
+        group_indices = group_indices.reshape(-1)
 
-        for group in groups:
-            group_items = [
-                item
-                for item in bin.packed_items
-                if (item.width, item.length, item.height) == group
-            ]
-
-            group_scores = []
-            if len(group_items) < 2:
+        for group_index, group in enumerate(groups):
+            positions = columns.positions[group_indices == group_index]
+            if len(positions) < 2:
                 continue
-            for item in group_items:
-                touching_items = [
-                    other
-                    for other in group_items
-                    if (
-                        abs(item.position.x - other.position.x),
-                        abs(item.position.y - other.position.y),
-                        abs(item.position.z - other.position.z),
-                    )
-                    in [
-                        (item.width, 0, 0),
-                        (0, item.length, 0),
-                        (0, 0, item.height),
-                    ]
-                ]
-                group_scores.append(
-                    len(touching_items) / min(max(len(group_items) - 1, 1), 4)
-                )
 
+            distances = np.abs(positions[:, None, :] - positions[None, :, :])
+            zero = distances == 0
+            touching = (
+                ((distances[:, :, 0] == group[0]) & zero[:, :, 1] & zero[:, :, 2])
+                | (zero[:, :, 0] & (distances[:, :, 1] == group[1]) & zero[:, :, 2])
+                | (zero[:, :, 0] & zero[:, :, 1] & (distances[:, :, 2] == group[2]))
+            )
+            group_scores = np.count_nonzero(touching, axis=1) / min(
+                max(len(positions) - 1, 1), 4
+            )
             scores.append(np.mean(group_scores))
         return np.mean(scores) if len(scores) > 0 else 1
@@ -0,0 +1,226 @@
+import bisect
+import contextlib
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Tuple
+
+# the metrics are only recorded if enabled, disabled metrics cost a single flag check
+_enabled = os.environ.get("ENABLE_METRICS", "false").lower() in ("1", "true")
+
+# upper bounds of the histogram buckets in seconds (see Prometheus default buckets)
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+# upper bounds of the histogram buckets for counts (e.g. items per order)
+COUNT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool):
+    """
+    Enables or disables recording the metrics (the environment variable ENABLE_METRICS
+    sets the initial state).
+    """
+    global _enabled
+    _enabled = enabled
+
+
+class Counter:
+    """
+    A monotonically increasing value.
+    """
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        if not _enabled:
+            return
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0.0
+
+    def get_samples(self) -> List[Tuple[str, float]]:
+        return [(self.name, self.value)]
+
+    def to_text(self) -> str:
+        return _format_metric(self, "counter")
+
+
+class Histogram:
+    """
+    Counts observations (e.g. durations) in buckets, including the sum of the observations.
+    """
+
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float):
+        if not _enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        """
+        Observes the duration of the block in seconds.
+        """
+        if not _enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            # the last bucket counts the observations above the largest bound (+Inf)
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+            self.sum = 0.0
+            self.count = 0
+
+    def get_samples(self) -> List[Tuple[str, float]]:
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ("+Inf",), self.bucket_counts):
+            cumulative += count
+            samples.append((f'{self.name}_bucket{{le="{_format_value(bound)}"}}', cumulative))
+        samples.append((f"{self.name}_sum", self.sum))
+        samples.append((f"{self.name}_count", self.count))
+        return samples
+
+    def to_text(self) -> str:
+        return _format_metric(self, "histogram")
+
+
+class MetricsRegistry:
+    """
+    Collects the metrics of the process and exports them in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self.metrics: "Dict[str, Counter | Histogram]" = {}
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter(name, help))
+
+    def histogram(
+        self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, help, buckets))
+
+    def reset(self):
+        for metric in self.metrics.values():
+            metric.reset()
+
+    def to_text(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        return "".join(metric.to_text() for metric in self.metrics.values())
+
+    def _register(self, metric: "Counter | Histogram") -> "Counter | Histogram":
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+
+def _format_metric(metric: "Counter | Histogram", metric_type: str) -> str:
+    lines = [
+        f"# HELP {metric.name} {metric.help}",
+        f"# TYPE {metric.name} {metric_type}",
+    ]
+    lines += [f"{name} {_format_value(value)}" for name, value in metric.get_samples()]
+    return "\n".join(lines) + "\n"
+
+
+def _format_value(value) -> str:
+    if isinstance(value, str):
+        return value
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+# api
+API_REQUESTS = REGISTRY.counter(
+    "packutils_api_requests_total", "Number of packing variant requests."
+)
+API_ITEMS_PER_ORDER = REGISTRY.histogram(
+    "packutils_api_items_per_order", "Number of items of the requested orders.", COUNT_BUCKETS
+)
+API_CONFIG_SECONDS = REGISTRY.histogram(
+    "packutils_api_config_generation_seconds", "Duration of selecting the configurations."
+)
+API_PACKING_SECONDS = REGISTRY.histogram(
+    "packutils_api_packing_seconds", "Duration of packing the variants of all configurations."
+)
+API_EVALUATION_SECONDS = REGISTRY.histogram(
+    "packutils_api_evaluation_seconds", "Duration of evaluating the variants."
+)
+API_SORTING_SECONDS = REGISTRY.histogram(
+    "packutils_api_sorting_seconds", "Duration of sorting the variants by score."
+)
+API_SERIALIZATION_SECONDS = REGISTRY.histogram(
+    "packutils_api_serialization_seconds", "Duration of serializing the response."
+)
+
+# solver
+CONFIGS_PACKED = REGISTRY.counter(
+    "packutils_configs_packed_total", "Number of configurations packed."
+)
+CONFIG_PACKING_SECONDS = REGISTRY.histogram(
+    "packutils_config_packing_seconds", "Duration of packing a variant of a configuration."
+)
+SNAPPOINTS_EVALUATED = REGISTRY.counter(
+    "packutils_snappoints_evaluated_total", "Number of snappoints an item was selected for."
+)
+FEASIBILITY_CHECKS = REGISTRY.counter(
+    "packutils_feasibility_checks_total", "Number of feasibility checks of item candidates on snappoints."
+)
+
+# evaluation
+VARIANTS_EVALUATED = REGISTRY.counter(
+    "packutils_variants_evaluated_total", "Number of unique variants evaluated."
+)
+VARIANTS_DEDUPLICATED = REGISTRY.counter(
+    "packutils_variants_deduplicated_total",
+    "Number of variants skipped as duplicates of another variant.",
+)
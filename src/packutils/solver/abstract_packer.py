@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 import logging
+import multiprocessing
+import os
+from typing import Callable, Iterable, Iterator, Tuple
 from packutils.data.bin import Bin
 
 from packutils.data.order import Order
@@ -8,6 +11,9 @@ from packutils.data.packing_variant import PackingVariant
 
 default_bin = Bin(width=10, length=10, height=10, max_weight=None)
 
+# packer of the worker process (see pack_orders)
+_worker_packer: "AbstractPacker | None" = None
+
 
 class AbstractPacker(ABC):
     def __init__(self, *args, **kwargs):
@@ -25,6 +31,50 @@ class AbstractPacker(ABC):
         packed.add_packing_variant(variant)
         return packed
 
+    def pack_orders(
+        self,
+        orders: Iterable[Order],
+        workers: "int | None" = None,
+        chunksize: int = 1,
+        ordered: bool = True,
+        on_error: "Callable[[Order, str], None] | None" = None,
+    ) -> Iterator[PackedOrder]:
+        """
+        Packs multiple orders in a process pool.
+
+        The packer is sent to each worker process once (pool initializer), only the orders
+        and packed orders are transferred per task. Orders that can not be packed are
+        logged and reported to on_error, the remaining orders are packed anyway.
+
+        Args:
+            orders (Iterable[Order]): The orders to pack.
+            workers (int | None, optional): The number of processes, the number of CPUs if
+                None. A single worker packs the orders in the current process.
+            chunksize (int, optional): The number of orders sent to a worker at once. Default is 1.
+            ordered (bool, optional): Whether to yield the packed orders in the order of the
+                orders, otherwise in completion order. Default is True.
+            on_error (Callable[[Order, str], None] | None, optional): Called with the order
+                and the error message if packing an order fails.
+
+        Yields:
+            PackedOrder: The packed orders.
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        orders = list(orders)
+        if workers <= 1:
+            results = (_pack_order(self, task) for task in enumerate(orders))
+            yield from _handle_results(results, orders, on_error)
+            return
+
+        with multiprocessing.Pool(
+            min(workers, max(len(orders), 1)), initializer=_init_worker, initargs=(self,)
+        ) as pool:
+            map_function = pool.imap if ordered else pool.imap_unordered
+            results = map_function(
+                _pack_order_in_worker, enumerate(orders), chunksize=chunksize
+            )
+            yield from _handle_results(results, orders, on_error)
+
     @abstractmethod
     def get_params(self) -> dict:
         return {}
@@ -36,3 +86,38 @@ class AbstractPacker(ABC):
     @abstractmethod
     def is_packer_available(self) -> bool:
         pass
+
+
+def _init_worker(packer: AbstractPacker):
+    global _worker_packer
+    _worker_packer = packer
+
+
+def _pack_order_in_worker(
+    task: "Tuple[int, Order]",
+) -> "Tuple[int, PackedOrder | None, str | None]":
+    return _pack_order(_worker_packer, task)
+
+
+def _pack_order(
+    packer: AbstractPacker, task: "Tuple[int, Order]"
+) -> "Tuple[int, PackedOrder | None, str | None]":
+    index, order = task
+    try:
+        return index, packer.pack_order(order), None
+    except Exception as e:
+        return index, None, repr(e)
+
+
+def _handle_results(
+    results: "Iterable[Tuple[int, PackedOrder | None, str | None]]",
+    orders: "list[Order]",
+    on_error: "Callable[[Order, str], None] | None",
+) -> Iterator[PackedOrder]:
+    for index, packed, error in results:
+        if error is None:
+            yield packed
+            continue
+        logging.error(f"Packing order {orders[index].order_id} failed: {error}")
+        if on_error is not None:
+            on_error(orders[index], error)
@@ -0,0 +1,301 @@
+import collections
+import copy
+import logging
+import multiprocessing
+import time
+from typing import List, Tuple
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.eval.packing_evaluation import PackingEvaluation
+from packutils.solver.abstract_packer import AbstractPacker
+
+PACKER_AVAILABLE = True
+
+DEFAULT_BEAM_WIDTH = 4
+# number of extreme points (lowest first) expanded per state
+DEFAULT_POINTS_PER_STATE = 2
+
+# weights of the proxy score (utilized space is weighted with 1)
+ROUGHNESS_WEIGHT = 0.1
+MAX_Z_WEIGHT = 0.1
+
+# a partial packing: the bin and the remaining amount per shape
+BeamState = collections.namedtuple("BeamState", ["bin", "amounts", "score"])
+# a placement of a shape (index into the shapes) at a position and the resulting score
+Expansion = collections.namedtuple(
+    "Expansion", ["shape_index", "position", "score", "fingerprint"]
+)
+
+
+class BeamSearchPacker(AbstractPacker):
+    """
+    3D packer keeping the best partial packings (beam search over placements).
+
+    Starting with the empty bin, each state of the beam is expanded by placing each remaining
+    item shape on the lowest extreme points. The expansions are scored and the best
+    beam_width distinct states are kept for the next step. A beam width of 1 is a greedy
+    packer, larger beam widths trade runtime for packing quality.
+
+    Expansions are scored on the bin of the state by packing the item and reverting it with
+    Bin.unpack_last, only the kept states are copied (Bin.copy). The states of a step can be
+    expanded in parallel processes (workers > 1).
+
+    The score is the PackingEvaluation score of the bin (evaluation) or a cheap proxy of the
+    utilized space, the roughness of the height map and the maximum height (see get_proxy_score).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.beam_width = kwargs.get("beam_width", DEFAULT_BEAM_WIDTH)
+        self.points_per_state = kwargs.get("points_per_state", DEFAULT_POINTS_PER_STATE)
+        self.workers = kwargs.get("workers", 1)
+        self.evaluation: "PackingEvaluation | None" = kwargs.get("evaluation", None)
+        self.reset(None)
+
+    def reset(self, config: "PackerConfiguration | None"):
+        if config is None or not isinstance(config, PackerConfiguration):
+            config = PackerConfiguration()
+        self.config = config
+        # statistics of the last packed variant
+        self.stats = {"steps": 0, "expanded_states": 0, "expansions": 0, "duration": 0.0}
+
+    def get_params(self) -> dict:
+        return {
+            "beam_width": self.beam_width,
+            "points_per_state": self.points_per_state,
+            "workers": self.workers,
+        }
+
+    def is_packer_available(self) -> bool:
+        return PACKER_AVAILABLE
+
+    def pack_variants(
+        self, order: Order, configs: List[PackerConfiguration]
+    ) -> List[PackingVariant]:
+        return [self.pack_variant(order, config) for config in configs]
+
+    def pack_variant(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> PackingVariant:
+        self.reset(config)
+        start = time.perf_counter()
+
+        shapes = []
+        amounts = []
+        for a in order.articles:
+            if a.amount < 1:
+                continue
+            shapes.append(
+                Item(
+                    id=a.article_id,
+                    width=a.width + self.config.padding_x,
+                    length=a.length,
+                    height=a.height,
+                    weight=a.weight,
+                )
+            )
+            amounts.append(a.amount)
+        amounts = tuple(amounts)
+
+        variant = PackingVariant()
+        pool = (
+            multiprocessing.Pool(self.workers)
+            if self.workers is not None and self.workers > 1
+            else None
+        )
+        try:
+            for bin_index, reference_bin in enumerate(self.reference_bins):
+                if sum(amounts) < 1:
+                    break
+                logging.info("-" * 20 + f" Bin {bin_index+1}")
+                bin = copy.deepcopy(reference_bin)
+                bin.stability_factor = self.config.bin_stability_factor
+
+                bin, amounts = self._search(bin, amounts, shapes, pool)
+                if len(bin.packed_items) > 0:
+                    variant.add_bin(bin)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        for shape, amount in zip(shapes, amounts):
+            for _ in range(amount):
+                variant.add_unpacked_item(copy.copy(shape), None)
+
+        self.stats["duration"] = time.perf_counter() - start
+        return variant
+
+    def _search(
+        self,
+        bin: Bin,
+        amounts: "Tuple[int, ...]",
+        shapes: List[Item],
+        pool: "multiprocessing.pool.Pool | None",
+    ) -> "Tuple[Bin, Tuple[int, ...]]":
+        """
+        Runs the beam search for a single bin.
+
+        Returns:
+            Tuple[Bin, Tuple[int, ...]]: The best packed bin and the remaining amount per shape.
+        """
+        beam = [BeamState(bin, amounts, score_bin(bin, self.evaluation))]
+        best = None
+
+        while len(beam) > 0:
+            tasks = [
+                (state.bin, state.amounts, shapes, self.points_per_state, self.evaluation)
+                for state in beam
+            ]
+            if pool is not None and len(tasks) > 1:
+                results = pool.starmap(expand_state, tasks)
+            else:
+                results = [expand_state(*task) for task in tasks]
+
+            self.stats["steps"] += 1
+            self.stats["expanded_states"] += len(beam)
+
+            candidates = []
+            for state, expansions in zip(beam, results):
+                self.stats["expansions"] += len(expansions)
+                if len(expansions) < 1 and (
+                    best is None or get_state_rank(state) > get_state_rank(best)
+                ):
+                    # no item fits anymore
+                    best = state
+                candidates.extend((expansion, state) for expansion in expansions)
+
+            candidates.sort(key=lambda candidate: candidate[0].score, reverse=True)
+            next_beam = []
+            seen = set()
+            for expansion, state in candidates:
+                amounts = list(state.amounts)
+                amounts[expansion.shape_index] -= 1
+                key = (expansion.fingerprint, tuple(amounts))
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                child = state.bin.copy()
+                item = copy.copy(shapes[expansion.shape_index])
+                item.position = Position(*expansion.position)
+                child.pack_item(item)
+                next_beam.append(BeamState(child, tuple(amounts), expansion.score))
+                if len(next_beam) >= self.beam_width:
+                    break
+            beam = next_beam
+
+        return best.bin, best.amounts
+
+
+def expand_state(
+    bin: Bin,
+    amounts: "Tuple[int, ...]",
+    shapes: List[Item],
+    points_per_state: int,
+    evaluation: "PackingEvaluation | None" = None,
+) -> List[Expansion]:
+    """
+    Scores all placements of the remaining shapes on the lowest extreme points of the bin.
+
+    Each placement is packed, scored and reverted, the bin is unchanged afterwards.
+
+    Args:
+        bin (Bin): The bin of the state.
+        amounts (Tuple[int, ...]): The remaining amount per shape.
+        shapes (List[Item]): The item shapes.
+        points_per_state (int): The number of extreme points with a feasible placement to expand.
+        evaluation (PackingEvaluation | None, optional): Scores the bins, the proxy score is used if None.
+
+    Returns:
+        List[Expansion]: The feasible placements.
+    """
+    remaining_weight = (
+        bin.max_weight - bin.get_total_weight() if bin.max_weight is not None else None
+    )
+    points = bin.get_extreme_points()
+    points = points[np.lexsort(points.T)]
+
+    expansions = []
+    expanded_points = 0
+    for point in points.tolist():
+        found = False
+        for shape_index, (shape, amount) in enumerate(zip(shapes, amounts)):
+            if amount < 1 or (
+                remaining_weight is not None and (shape.weight or 0) > remaining_weight
+            ):
+                continue
+            item = copy.copy(shape)
+            item.position = Position(*point)
+            done, _ = bin.pack_item(item)
+            if not done:
+                continue
+
+            expansions.append(
+                Expansion(
+                    shape_index, tuple(point), score_bin(bin, evaluation), bin.fingerprint
+                )
+            )
+            bin.unpack_last()
+            found = True
+
+        if found:
+            expanded_points += 1
+            if expanded_points >= points_per_state:
+                break
+    return expansions
+
+
+def get_state_rank(state: BeamState) -> "Tuple[int, float]":
+    """
+    Ranks the final states of the search, the state packing more items is better, states
+    packing the same number of items are ranked by score.
+    """
+    return len(state.bin.packed_items), state.score
+
+
+def score_bin(bin: Bin, evaluation: "PackingEvaluation | None" = None) -> float:
+    """
+    Scores a (partially) packed bin, higher is better.
+
+    Args:
+        bin (Bin): The bin.
+        evaluation (PackingEvaluation | None, optional): Scores the bin, the proxy score is used if None.
+
+    Returns:
+        float: The score.
+    """
+    if len(bin.packed_items) < 1:
+        return 0.0
+    if evaluation is not None:
+        return evaluation.evaluate_bin(bin)[0]
+    return get_proxy_score(bin)
+
+
+def get_proxy_score(bin: Bin) -> float:
+    """
+    Cheap score of a bin: the utilized space, penalized by the roughness of the height map
+    (sum of the height differences of neighbouring cells) and the maximum height.
+
+    Args:
+        bin (Bin): The bin.
+
+    Returns:
+        float: The score.
+    """
+    heights = bin.get_height_map()
+    roughness = np.abs(np.diff(heights, axis=0)).sum() + np.abs(
+        np.diff(heights, axis=1)
+    ).sum()
+    return (
+        bin.get_used_volume() / bin.volume
+        - ROUGHNESS_WEIGHT * roughness / (bin.height * heights.size)
+        - MAX_Z_WEIGHT * bin.max_z / bin.height
+    )
@@ -0,0 +1,336 @@
+import copy
+import logging
+from typing import Dict, List, Tuple
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.order import Order
+from packutils.data.packer_configuration import (
+    ItemSelectStrategy,
+    PackerConfiguration,
+    PackerConfigurationTuple,
+)
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.solver.abstract_packer import AbstractPacker
+from packutils.solver.palletier_wish_packer import select_item_from_list
+
+PACKER_AVAILABLE = True
+
+# feasibility status of an extreme point for an item shape
+UNKNOWN = 0
+FEASIBLE = 1
+# the item overlaps a packed item or exceeds the bin, packing only adds items so this is final
+BLOCKED = 2
+# the item has not enough support below, may change when items are packed below
+UNSUPPORTED = 3
+
+# strategies that take the number of remaining items per shape into account
+COUNTING_STRATEGIES = (
+    ItemSelectStrategy.LARGEST_W_TO_FILL,
+    ItemSelectStrategy.LARGEST_W_H_TO_FILL,
+)
+
+
+class ExtremePointPacker(AbstractPacker):
+    """
+    3D packer placing items on the extreme points of the bin.
+
+    In each step the lowest extreme point (ordered by z, y, x) where at least one remaining item
+    fits is selected and the item to place is chosen with the select strategies of the
+    PackerConfiguration. The feasibility of each extreme point is stored per item shape and
+    updated incrementally: after packing an item only the new extreme points and the points
+    touched by the packed item are checked again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.reset(None)
+
+    def reset(self, config: "PackerConfiguration | PackerConfigurationTuple | None"):
+        if config is None or not isinstance(
+            config, (PackerConfiguration, PackerConfigurationTuple)
+        ):
+            config = PackerConfiguration()
+        self.config = config
+        self.prev_item = None
+
+    def get_params(self) -> dict:
+        return {}
+
+    def is_packer_available(self) -> bool:
+        return PACKER_AVAILABLE
+
+    def pack_variants(
+        self, order: Order, configs: List[PackerConfiguration]
+    ) -> List[PackingVariant]:
+        return [self.pack_variant(order, config) for config in configs]
+
+    def pack_variant(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> PackingVariant:
+        self.reset(config)
+
+        items_to_pack = [
+            Item(
+                id=a.article_id,
+                width=a.width + self.config.padding_x,
+                length=a.length,
+                height=a.height,
+                weight=a.weight,
+            )
+            for a in order.articles
+            for _ in range(a.amount)
+        ]
+        return self._pack_variant(items_to_pack)
+
+    def _pack_variant(self, items: List[Item]) -> PackingVariant:
+        variant = PackingVariant()
+
+        groups: Dict[tuple, List[Item]] = {}
+        for item in items:
+            key = (item.id, item.width, item.length, item.height, item.weight)
+            groups.setdefault(key, []).append(item)
+
+        for bin_index, reference_bin in enumerate(self.reference_bins):
+            if len(groups) < 1:
+                break
+            bin = copy.deepcopy(reference_bin)
+            bin.stability_factor = self.config.bin_stability_factor
+            logging.info("%s Bin %s", "-" * 20, bin_index + 1)
+
+            self._fill_bin(bin, groups)
+            if len(bin.packed_items) > 0:
+                variant.add_bin(bin)
+
+        for group in groups.values():
+            for item in group:
+                variant.add_unpacked_item(item, None)
+
+        return variant
+
+    def _fill_bin(self, bin: Bin, groups: Dict[tuple, List[Item]]):
+        """
+        Packs items of the groups into the bin until no item fits anymore.
+
+        Packed items are removed from the groups.
+        """
+        extreme_points = bin.extreme_points
+        shapes = _ShapeStatus(bin, set(key[1:4] for key in groups))
+
+        while len(groups) > 0:
+            remaining_weight = (
+                bin.max_weight - bin.get_total_weight()
+                if bin.max_weight is not None
+                else None
+            )
+            keys = [
+                key
+                for key in groups
+                if remaining_weight is None or (key[4] or 0) <= remaining_weight
+            ]
+            if len(keys) < 1:
+                break
+
+            active = extreme_points.active
+            feasible = np.stack(
+                [shapes.get(key[1:4]) == FEASIBLE for key in keys]
+            ) & active
+            point_has_item = np.any(feasible, axis=0)
+            if not np.any(point_has_item):
+                logging.info("There are no possible positions left.")
+                break
+
+            candidates = np.flatnonzero(point_has_item)
+            points = extreme_points.points[candidates]
+            point_index = candidates[np.lexsort(points.T)[0]]
+            point = extreme_points.points[point_index]
+
+            possible_keys = [
+                key for key, row in zip(keys, feasible) if row[point_index]
+            ]
+            strategy = (
+                self.config.new_layer_select_strategy
+                if point[2] >= bin.max_z
+                else self.config.default_select_strategy
+            )
+            if strategy in COUNTING_STRATEGIES:
+                possible_items = [item for key in possible_keys for item in groups[key]]
+            else:
+                possible_items = [groups[key][0] for key in possible_keys]
+            best = select_item_from_list(
+                possible_items, strategy, self.prev_item, bin.width - int(point[0])
+            )
+            key = (best.id, best.width, best.length, best.height, best.weight)
+
+            item = copy.deepcopy(groups[key][-1])
+            item.position = Position(int(point[0]), int(point[1]), int(point[2]))
+            done, info = bin.pack_item(item)
+            if not done:
+                logging.info("%s - %s", info, item)
+                shapes.block(key[1:4], point_index)
+                continue
+
+            logging.info("Packed item %s", item)
+            self.prev_item = item
+            groups[key].pop()
+            if len(groups[key]) < 1:
+                del groups[key]
+                if not any(other[1:4] == key[1:4] for other in groups):
+                    shapes.remove(key[1:4])
+            shapes.update(item)
+
+
+class _ShapeStatus:
+    """
+    Feasibility status of the extreme points of a bin per item shape.
+
+    The status rows are aligned with the (append-only) extreme point arrays of the bin,
+    all shapes are checked at once.
+    """
+
+    def __init__(self, bin: Bin, shapes: "set[Tuple[int, int, int]]"):
+        self.bin = bin
+        self.shapes = {shape: index for index, shape in enumerate(sorted(shapes))}
+        self.dimensions = np.array(sorted(shapes), dtype=int).reshape(-1, 3)
+        self.status = np.zeros((len(self.shapes), 0), dtype=np.int8)
+        self._check_new_points()
+
+    def get(self, shape: "Tuple[int, int, int]") -> np.ndarray:
+        return self.status[self.shapes[shape]]
+
+    def block(self, shape: "Tuple[int, int, int]", index: int):
+        self.status[self.shapes[shape], index] = BLOCKED
+
+    def remove(self, shape: "Tuple[int, int, int]"):
+        # the row is kept to keep the indices, the shape is never feasible again
+        self.status[self.shapes.pop(shape)] = BLOCKED
+
+    def update(self, item: Item):
+        """
+        Updates the status after an item was packed into the bin.
+        """
+        size = self.status.shape[1]
+        points = self.bin.extreme_points.points[:size]
+        active = self.bin.extreme_points.active[:size]
+        position = np.array((item.position.x, item.position.y, item.position.z))
+        end = position + item.dimensions
+
+        # only the points the largest shape reaches the item from (in x and y) can change
+        reach = points[:, :2] + self.dimensions[:, :2].max(axis=0)
+        near = np.flatnonzero(
+            active
+            & np.all(points[:, :2] < end[:2], axis=1)
+            & np.all(reach > position[:2], axis=1)
+        )
+        points = points[near]
+        status = self.status[:, near]
+
+        # shape (shapes, points, 3)
+        shape_ends = points[None, :, :] + self.dimensions[:, None, :]
+        touches = (points < end)[None, :, :] & (shape_ends > position)
+
+        overlaps = (status != BLOCKED) & np.all(touches, axis=2)
+        status[overlaps] = BLOCKED
+
+        # the packed item may support items on extreme points at its top
+        below = (
+            (status == UNSUPPORTED)
+            & (points[:, 2] == end[2])[None, :]
+            & np.all(touches[:, :, :2], axis=2)
+        )
+        shape_indices, indices = np.nonzero(below)
+        supported = self._is_supported(points[indices], self.dimensions[shape_indices])
+        status[shape_indices[supported], indices[supported]] = FEASIBLE
+        self.status[:, near] = status
+
+        self._check_new_points()
+
+    def _check_new_points(self):
+        """
+        Calculates the status of the extreme points added since the last check.
+        """
+        extreme_points = self.bin.extreme_points
+        start = self.status.shape[1]
+        points = extreme_points.points[start:]
+        status = np.full((len(self.dimensions), len(points)), BLOCKED, dtype=np.int8)
+
+        # shape (shapes, points, 3)
+        shape_ends = points[None, :, :] + self.dimensions[:, None, :]
+        bin_dimensions = np.array((self.bin.width, self.bin.length, self.bin.height))
+        in_bounds = np.all(shape_ends <= bin_dimensions, axis=2)
+
+        columns = self.bin.packed_columns
+        if len(columns) > 0:
+            positions = columns.positions
+            ends = positions + columns.dimensions
+            # only the items the largest shape reaches from one of the points can overlap
+            reach = points + self.dimensions.max(axis=0)
+            near = np.any(
+                np.all(
+                    (points[:, None, :] < ends[None, :, :])
+                    & (reach[:, None, :] > positions[None, :, :]),
+                    axis=2,
+                ),
+                axis=0,
+            )
+            positions, ends = positions[near], ends[near]
+            # shape (shapes, points, items)
+            overlaps = np.any(
+                np.all(
+                    (points[None, :, None, :] < ends[None, None, :, :])
+                    & (shape_ends[:, :, None, :] > positions[None, None, :, :]),
+                    axis=3,
+                ),
+                axis=2,
+            )
+            in_bounds &= ~overlaps
+
+        shape_indices, indices = np.nonzero(in_bounds)
+        status[shape_indices, indices] = np.where(
+            self._is_supported(points[indices], self.dimensions[shape_indices]),
+            FEASIBLE,
+            UNSUPPORTED,
+        )
+        # removed shapes are never feasible again
+        removed = np.ones(len(self.dimensions), dtype=bool)
+        removed[list(self.shapes.values())] = False
+        status[removed] = BLOCKED
+
+        self.status = np.concatenate((self.status, status), axis=1)
+
+    def _is_supported(self, points: np.ndarray, shapes: np.ndarray) -> np.ndarray:
+        """
+        Checks the support of item shapes placed on extreme points.
+
+        The occupied cells below the items are counted with a summed-area table of the
+        layer below, one table per distinct z of the points.
+
+        Args:
+            points (np.ndarray): The extreme points with shape (n, 3).
+            shapes (np.ndarray): The item shapes with shape (n, 3), the items must fit
+                into the bin at the points.
+
+        Returns:
+            np.ndarray: Whether the items have enough support, shape (n,).
+        """
+        supported = points[:, 2] == 0
+        for z in np.unique(points[~supported, 2]):
+            rows = np.flatnonzero(points[:, 2] == z)
+            table = np.zeros((self.bin.length + 1, self.bin.width + 1), dtype=int)
+            np.cumsum(
+                np.cumsum(self.bin.matrix[z - 1] != 0, axis=0),
+                axis=1,
+                out=table[1:, 1:],
+            )
+            x, y = points[rows, 0], points[rows, 1]
+            x_end, y_end = x + shapes[rows, 0], y + shapes[rows, 1]
+            counts = (
+                table[y_end, x_end] - table[y, x_end] - table[y_end, x] + table[y, x]
+            )
+            supported[rows] = (
+                counts >= shapes[rows, 0] * shapes[rows, 1] * self.bin.stability_factor
+            )
+        return supported
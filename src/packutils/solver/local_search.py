@@ -0,0 +1,279 @@
+import copy
+import logging
+import time
+from typing import List, Tuple
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+
+DEFAULT_TIME_BUDGET = 0.1
+
+
+class LocalSearch:
+    """
+    Improves finished packing variants by local moves.
+
+    The moves are applied to snapshots of the bins (Bin.copy) and validated incrementally
+    against the occupancy of the bin (Bin.remove_item, Bin.pack_item). A move is kept if it
+    packs an unpacked item or lowers the score of the bin (see get_bin_score), otherwise the
+    snapshot is discarded. The moves are:
+
+    - pack unpacked items into holes (extreme points of the bin)
+    - move a top item (nothing packed above) into a lower hole
+    - swap the positions of two top items of different shapes
+    - shift all items above a level down to close a gap below them
+
+    The search stops after a pass without improvement or when the time budget is used.
+
+    Attributes:
+        time_budget (float): The maximum runtime in seconds per variant.
+        stats (dict): The number of applied moves per move type of the last search.
+    """
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET):
+        """
+        Initializes the local search.
+
+        Args:
+            time_budget (float, optional): The maximum runtime in seconds per variant. Default is 0.1.
+        """
+        self.time_budget = time_budget
+        self.stats = {}
+
+    def improve_variant(self, variant: PackingVariant) -> PackingVariant:
+        """
+        Improves a packing variant, the given variant is not changed.
+
+        Args:
+            variant (PackingVariant): The packing variant.
+
+        Returns:
+            PackingVariant: The improved packing variant.
+        """
+        self.stats = {"fill": 0, "move": 0, "swap": 0, "shift": 0, "passes": 0}
+        deadline = time.perf_counter() + self.time_budget
+
+        bins = [bin.copy() for bin in variant.bins]
+        unpacked = list(variant.unpacked_items)
+
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            self.stats["passes"] += 1
+            for index, bin in enumerate(bins):
+                improved |= self._fill_holes(bin, unpacked, deadline)
+                for move in (self._move_top_items, self._swap_top_items, self._shift_levels):
+                    bin, moved = move(bin, deadline)
+                    improved |= moved
+                bins[index] = bin
+
+        improved_variant = PackingVariant()
+        for bin in bins:
+            improved_variant.add_bin(bin)
+        for item in unpacked:
+            improved_variant.add_unpacked_item(item, None)
+        return improved_variant
+
+    def _fill_holes(self, bin: Bin, unpacked: List[Item], deadline: float) -> bool:
+        """
+        Packs unpacked items on the extreme points of the bin.
+        """
+        improved = False
+        for item in list(unpacked):
+            if time.perf_counter() >= deadline:
+                break
+            for point in _sorted_points(bin):
+                candidate = _moved_item(item, point)
+                done, _ = bin.pack_item(candidate)
+                if done:
+                    unpacked.remove(item)
+                    self.stats["fill"] += 1
+                    improved = True
+                    break
+        return improved
+
+    def _move_top_items(self, bin: Bin, deadline: float) -> "Tuple[Bin, bool]":
+        """
+        Moves top items to lower extreme points if the score of the bin improves.
+        """
+        improved = False
+        for item in get_top_items(bin):
+            if time.perf_counter() >= deadline:
+                break
+            if not is_top_item(bin, item):
+                continue
+            score = get_bin_score(bin)
+            trial = bin.copy()
+            trial.remove_item(item)
+            for point in _sorted_points(trial):
+                if point[2] >= item.position.z:
+                    continue
+                done, _ = trial.pack_item(_moved_item(item, point))
+                if not done:
+                    continue
+                if get_bin_score(trial) < score:
+                    bin = trial
+                    self.stats["move"] += 1
+                    improved = True
+                    break
+                trial.unpack_last()
+        return bin, improved
+
+    def _swap_top_items(self, bin: Bin, deadline: float) -> "Tuple[Bin, bool]":
+        """
+        Swaps the positions of two top items of different shapes if the score of the bin improves.
+        """
+        improved = False
+        top_items = get_top_items(bin)
+        swapped = set()
+        for index, first in enumerate(top_items):
+            for second in top_items[index + 1 :]:
+                if time.perf_counter() >= deadline:
+                    return bin, improved
+                if (
+                    first.dimensions == second.dimensions
+                    or id(first) in swapped
+                    or id(second) in swapped
+                    or not is_top_item(bin, first)
+                    or not is_top_item(bin, second)
+                ):
+                    continue
+
+                trial = bin.copy()
+                trial.remove_item(first)
+                trial.remove_item(second)
+                candidates = sorted(
+                    [
+                        _moved_item(first, _corner(second)),
+                        _moved_item(second, _corner(first)),
+                    ],
+                    key=lambda item: item.position.z,
+                )
+                if _repack(trial, candidates) and get_bin_score(trial) < get_bin_score(
+                    bin
+                ):
+                    bin = trial
+                    swapped.update((id(first), id(second)))
+                    self.stats["swap"] += 1
+                    improved = True
+        return bin, improved
+
+    def _shift_levels(self, bin: Bin, deadline: float) -> "Tuple[Bin, bool]":
+        """
+        Shifts all items above a level down to the highest item top below the level.
+        """
+        levels = sorted(
+            set(item.position.z for item in bin.packed_items if item.position.z > 0)
+        )
+        for level in levels:
+            if time.perf_counter() >= deadline:
+                break
+            group = [item for item in bin.packed_items if item.position.z >= level]
+            floor = max(
+                (
+                    item.position.z + item.height
+                    for item in bin.packed_items
+                    if item.position.z < level and item.position.z + item.height <= level
+                ),
+                default=0,
+            )
+            shift = level - floor
+            if shift <= 0:
+                continue
+
+            trial = bin.copy()
+            for item in reversed(group):
+                trial.remove_item(item)
+            candidates = [
+                _moved_item(
+                    item,
+                    (item.position.x, item.position.y, item.position.z - shift),
+                )
+                for item in sorted(group, key=lambda item: item.position.z)
+            ]
+            if _repack(trial, candidates) and get_bin_score(trial) < get_bin_score(bin):
+                self.stats["shift"] += 1
+                # the levels changed, the next level is shifted in the next pass
+                return trial, True
+        return bin, False
+
+
+def get_bin_score(bin: Bin) -> "Tuple[int, float]":
+    """
+    Returns the score of a bin used by the local search, lower is better.
+
+    The score is calculated from the running totals and the height map of the bin.
+
+    Args:
+        bin (Bin): The bin.
+
+    Returns:
+        Tuple[int, float]: The maximum height and the height of the center of gravity (by volume).
+    """
+    if len(bin.packed_items) < 1:
+        return 0, 0.0
+    return bin.max_z, bin.get_center_of_gravity(use_volume=True).z
+
+
+def get_top_items(bin: Bin) -> List[Item]:
+    """
+    Returns the packed items without any item above them (highest first).
+
+    Args:
+        bin (Bin): The bin.
+
+    Returns:
+        List[Item]: The top items.
+    """
+    top_items = [item for item in bin.packed_items if is_top_item(bin, item)]
+    return sorted(top_items, key=lambda item: item.position.z + item.height, reverse=True)
+
+
+def is_top_item(bin: Bin, item: Item) -> bool:
+    """
+    Checks whether no item is packed above the item.
+
+    Args:
+        bin (Bin): The bin.
+        item (Item): The packed item.
+
+    Returns:
+        bool: True if the height map above the item equals the top of the item.
+    """
+    x, y, top = item.position.x, item.position.y, item.position.z + item.height
+    heights = bin.get_height_map()[y : y + item.length, x : x + item.width]
+    return bool(np.all(heights == top))
+
+
+def _sorted_points(bin: Bin) -> "List[Tuple[int, int, int]]":
+    points = bin.get_extreme_points()
+    return [tuple(point) for point in points[np.lexsort(points.T)].tolist()]
+
+
+def _corner(item: Item) -> "Tuple[int, int, int]":
+    return item.position.x, item.position.y, item.position.z
+
+
+def _moved_item(item: Item, point: "Tuple[int, int, int]") -> Item:
+    moved = copy.copy(item)
+    rotation = item.position.rotation if item.position is not None else 0
+    moved.position = Position(*point, rotation=rotation)
+    return moved
+
+
+def _repack(bin: Bin, items: List[Item]) -> bool:
+    """
+    Packs the items in the given order, stops at the first item that can not be packed.
+
+    Returns:
+        bool: True if all items were packed.
+    """
+    for item in items:
+        done, info = bin.pack_item(item)
+        if not done:
+            logging.info(f"{info} - {item}")
+            return False
+    return True
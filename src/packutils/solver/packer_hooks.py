@@ -0,0 +1,94 @@
+import collections
+import time
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.snappoint import Snappoint
+
+
+class PackerHooks:
+    """
+    Receives the events of a packer (e.g. for profiling, tracing or quality analysis).
+
+    The methods do nothing by default, subclasses override the events they need. Packers
+    without hooks (hooks=None) skip the events entirely. Hooks passed to packers packing in
+    worker processes (e.g. bin assignment with workers > 1) are copied to the workers, the
+    events of the workers are not reported back.
+    """
+
+    def on_layer_started(self, bin: Bin, z: int):
+        """
+        Called when the packer starts a new layer of a bin.
+
+        Args:
+            bin (Bin): The bin.
+            z (int): The z of the top of the previous layer (0 for the first layer).
+        """
+
+    def on_snappoint_selected(self, bin: Bin, snappoint: Snappoint):
+        """
+        Called when the packer selects the snappoint to pack the next item on.
+        """
+
+    def on_item_rejected(
+        self, bin: Bin, item: "Item | None", snappoint: Snappoint, reason: "str | None"
+    ):
+        """
+        Called when no item could be packed on the selected snappoint.
+
+        Args:
+            bin (Bin): The bin.
+            item (Item | None): The item that could not be packed, None if no item fits.
+            snappoint (Snappoint): The snappoint.
+            reason (str | None): The reason reported by the bin (see Bin.pack_item),
+                None if no item fits.
+        """
+
+    def on_item_packed(self, bin: Bin, item: Item, snappoint: Snappoint):
+        """
+        Called when an item is packed on a snappoint.
+        """
+
+
+class CountingHooks(PackerHooks):
+    """
+    Counts the events and measures the duration from selecting a snappoint until an item
+    is packed or rejected.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.counts = collections.Counter()
+        # durations (seconds) from selecting a snappoint until packing or rejecting an item
+        self.selection_seconds = 0.0
+        self.num_selections = 0
+        self._selected_at = None
+
+    def on_layer_started(self, bin: Bin, z: int):
+        self.counts["layer_started"] += 1
+
+    def on_snappoint_selected(self, bin: Bin, snappoint: Snappoint):
+        self.counts["snappoint_selected"] += 1
+        self._selected_at = time.perf_counter()
+
+    def on_item_rejected(
+        self, bin: Bin, item: "Item | None", snappoint: Snappoint, reason: "str | None"
+    ):
+        self.counts["item_rejected"] += 1
+        self._stop_selection()
+
+    def on_item_packed(self, bin: Bin, item: Item, snappoint: Snappoint):
+        self.counts["item_packed"] += 1
+        self._stop_selection()
+
+    def get_mean_selection_seconds(self) -> float:
+        return self.selection_seconds / max(self.num_selections, 1)
+
+    def _stop_selection(self):
+        if self._selected_at is None:
+            return
+        self.selection_seconds += time.perf_counter() - self._selected_at
+        self.num_selections += 1
+        self._selected_at = None
@@ -0,0 +1,300 @@
+import copy
+import functools
+import logging
+import multiprocessing
+from typing import Dict, List, Tuple
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.solver.abstract_packer import AbstractPacker
+from packutils.solver.palletier_wish_packer import PalletierWishPacker
+
+PACKER_AVAILABLE = True
+
+# maximum number of cached wall solutions (per process)
+WALL_CACHE_SIZE = 1024
+
+# (article_id, width, height, weight, amount)
+WallArticle = Tuple[str, int, int, float, int]
+# (article_id, x, z, width, height, weight) of a packed item, the width includes the padding
+WallPlacement = Tuple[str, int, int, int, int, float]
+
+
+class PalletierWallPacker(AbstractPacker):
+    """
+    3D packer building walls (depth slices) along the length of the bin.
+
+    The items are grouped by their length, each group is packed into walls with the depth of
+    the group using the 2D PalletierWishPacker. The walls are placed one after another along
+    the length of the bins, walls that do not fit into any bin are returned as unpacked items.
+
+    The groups are independent of each other and are packed in parallel if workers > 1.
+    Wall solutions are cached, so repeated walls (e.g. of large homogeneous orders) are
+    only packed once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.workers = kwargs.get("workers", 1)
+        self.reset(None)
+
+    def reset(self, config: "PackerConfiguration | None"):
+        if config is None or not isinstance(config, PackerConfiguration):
+            config = PackerConfiguration()
+        self.config = config
+
+    def get_params(self) -> dict:
+        return {"workers": self.workers}
+
+    def is_packer_available(self) -> bool:
+        return PACKER_AVAILABLE
+
+    def pack_variants(
+        self, order: Order, configs: List[PackerConfiguration]
+    ) -> List[PackingVariant]:
+        return [self.pack_variant(order, config) for config in configs]
+
+    def pack_variant(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> PackingVariant:
+        self.reset(config)
+        variant = PackingVariant()
+
+        max_length = max(bin.length for bin in self.reference_bins)
+        max_width = max(bin.width for bin in self.reference_bins)
+        max_height = max(bin.height for bin in self.reference_bins)
+
+        groups: Dict[int, List[WallArticle]] = {}
+        for a in order.articles:
+            if a.amount < 1:
+                continue
+            if a.length > max_length:
+                for _ in range(a.amount):
+                    variant.add_unpacked_item(self._create_item(a), None)
+                continue
+            groups.setdefault(a.length, []).append(
+                (a.article_id, a.width, a.height, a.weight, a.amount)
+            )
+
+        config_key = _get_config_key(self.config)
+        tasks = [
+            (tuple(articles), max_width, max_height, config_key)
+            for _, articles in sorted(groups.items(), reverse=True)
+        ]
+        if self.workers is not None and self.workers > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(min(self.workers, len(tasks))) as pool:
+                results = pool.starmap(pack_walls, tasks)
+        else:
+            results = [pack_walls(*task) for task in tasks]
+
+        walls = []
+        for depth, (group_walls, unpacked) in zip(sorted(groups, reverse=True), results):
+            walls.extend((depth, wall) for wall in group_walls)
+            for article_id, width, height, weight, amount in unpacked:
+                for _ in range(amount):
+                    variant.add_unpacked_item(
+                        Item(
+                            article_id,
+                            width + self.config.padding_x,
+                            depth,
+                            height,
+                            weight=weight,
+                        ),
+                        None,
+                    )
+
+        bins, unpacked_walls = self._stitch_walls(walls)
+        for bin in bins:
+            if len(bin.packed_items) > 0:
+                variant.add_bin(bin)
+        for item in unpacked_walls:
+            variant.add_unpacked_item(item, None)
+        return variant
+
+    def _create_item(self, article: Article) -> Item:
+        return Item(
+            id=article.article_id,
+            width=article.width + self.config.padding_x,
+            length=article.length,
+            height=article.height,
+            weight=article.weight,
+        )
+
+    def _stitch_walls(
+        self, walls: "List[Tuple[int, Tuple[WallPlacement, ...]]]"
+    ) -> "Tuple[List[Bin], List[Item]]":
+        """
+        Places the walls along the length of the bins (first fit).
+
+        Args:
+            walls (List[Tuple[int, Tuple[WallPlacement, ...]]]): The depth and the placements of each wall.
+
+        Returns:
+            Tuple[List[Bin], List[Item]]: The packed bins and the items of walls that did not fit.
+        """
+        bins: List[Bin] = []
+        used_lengths: List[int] = []
+        unpacked: List[Item] = []
+
+        for depth, wall in walls:
+            items = [
+                Item(
+                    article_id,
+                    width,
+                    depth,
+                    height,
+                    weight=weight,
+                    position=Position(x, 0, z),
+                )
+                for article_id, x, z, width, height, weight in wall
+            ]
+
+            bin_index = None
+            for index, reference_bin in enumerate(self.reference_bins):
+                if index == len(bins):
+                    bin = copy.deepcopy(reference_bin)
+                    bin.stability_factor = self.config.bin_stability_factor
+                    bins.append(bin)
+                    used_lengths.append(0)
+                if used_lengths[index] + depth <= bins[index].length and all(
+                    item.position.x + item.width <= bins[index].width
+                    and item.position.z + item.height <= bins[index].height
+                    for item in items
+                ):
+                    bin_index = index
+                    break
+
+            if bin_index is None:
+                for item in items:
+                    item.position = None
+                unpacked.extend(items)
+                continue
+
+            bin = bins[bin_index]
+            for item in items:
+                item.position.y = used_lengths[bin_index]
+                done, info = bin.pack_item(item)
+                if not done:
+                    logging.info(f"{info} - {item}")
+                    item.position = None
+                    unpacked.append(item)
+            used_lengths[bin_index] += depth
+
+        return bins, unpacked
+
+
+def pack_walls(
+    articles: "Tuple[WallArticle, ...]",
+    width: int,
+    height: int,
+    config_key: tuple,
+) -> "Tuple[List[Tuple[WallPlacement, ...]], List[WallArticle]]":
+    """
+    Packs articles of the same length into as many walls as needed.
+
+    Args:
+        articles (Tuple[WallArticle, ...]): The articles (article_id, width, height, weight, amount).
+        width (int): The width of the walls.
+        height (int): The height of the walls.
+        config_key (tuple): The packer configuration (see _get_config_key).
+
+    Returns:
+        Tuple[List[Tuple[WallPlacement, ...]], List[WallArticle]]: The placements of each wall
+        and the articles that could not be packed in any wall.
+    """
+    padding_x = dict(config_key).get("padding_x", 0)
+    remaining = {article[:4]: article[4] for article in articles}
+    walls = []
+    while len(remaining) > 0:
+        wall = pack_wall(_get_wall_key(remaining, width, height), width, height, config_key)
+        if len(wall) < 1:
+            break
+        walls.append(wall)
+
+        for article_id, _, _, item_width, item_height, weight in wall:
+            key = (article_id, item_width - padding_x, item_height, weight)
+            remaining[key] -= 1
+            if remaining[key] < 1:
+                del remaining[key]
+
+    unpacked = [key + (amount,) for key, amount in remaining.items()]
+    return walls, unpacked
+
+
+@functools.lru_cache(maxsize=WALL_CACHE_SIZE)
+def pack_wall(
+    articles: "Tuple[WallArticle, ...]", width: int, height: int, config_key: tuple
+) -> "Tuple[WallPlacement, ...]":
+    """
+    Packs a single wall with the 2D PalletierWishPacker (cached).
+
+    Args:
+        articles (Tuple[WallArticle, ...]): The articles (article_id, width, height, weight, amount).
+        width (int): The width of the wall.
+        height (int): The height of the wall.
+        config_key (tuple): The packer configuration (see _get_config_key).
+
+    Returns:
+        Tuple[WallPlacement, ...]: The placements of the packed items in packing order.
+    """
+    order = Order(
+        order_id="wall",
+        articles=[
+            Article(
+                article_id=article_id,
+                width=article_width,
+                length=1,
+                height=article_height,
+                weight=weight,
+                amount=amount,
+            )
+            for article_id, article_width, article_height, weight, amount in articles
+        ],
+    )
+    packer = PalletierWishPacker(bins=[Bin(width, 1, height)])
+    variant = packer.pack_variant(order, PackerConfiguration(**dict(config_key)))
+    if len(variant.bins) < 1:
+        return ()
+
+    return tuple(
+        (
+            item.id,
+            item.position.x,
+            item.position.z,
+            item.width,
+            item.height,
+            item.weight,
+        )
+        for item in variant.bins[0].packed_items
+    )
+
+
+def _get_wall_key(
+    remaining: "Dict[Tuple[str, int, int, float], int]", width: int, height: int
+) -> "Tuple[WallArticle, ...]":
+    """
+    Returns the articles of a wall as hashable cache key.
+
+    If the wall contains a single article, the amount is limited to the number of items
+    fitting into the wall area, so all full walls of homogeneous orders share one key.
+    Two more items are kept, as the wish packer holds back the last two items of a
+    dimension for mirrored walls.
+    """
+    articles = tuple(sorted(key + (amount,) for key, amount in remaining.items()))
+    if len(articles) == 1:
+        article_id, article_width, article_height, weight, amount = articles[0]
+        area_bound = (width * height) // max(article_width * article_height, 1) + 2
+        articles = (
+            (article_id, article_width, article_height, weight, min(amount, area_bound)),
+        )
+    return articles
+
+
+def _get_config_key(config: PackerConfiguration) -> tuple:
+    return tuple(sorted(config.model_dump().items()))
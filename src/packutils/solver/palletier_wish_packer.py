@@ -1,20 +1,39 @@
 import copy
+import functools
 import logging
 import time
 import numpy as np
 import collections
 import multiprocessing
 from enum import Enum
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from packutils.data.bin import Bin
-from packutils.data.item import Item
+from packutils.data.item import (
+    Item,
+    get_orientations,
+    get_rotated_item,
+    get_rotated_padded_dimensions,
+    get_unrotated_dimensions,
+)
 from packutils.data.order import Order
-from packutils.data.packer_configuration import ItemSelectStrategy, PackerConfiguration
+from packutils.data.packer_configuration import (
+    ItemSelectStrategy,
+    PackerConfiguration,
+    PackerConfigurationTuple,
+)
 from packutils.data.packing_variant import PackingVariant
 from packutils.data.position import Position
 from packutils.data.snappoint import Snappoint, SnappointDirection
+from packutils.eval.lower_bounds import (
+    get_items_lower_bound,
+    get_lower_bound,
+    meets_lower_bound,
+)
+from packutils.monitoring import metrics
 from packutils.solver.abstract_packer import AbstractPacker
+from packutils.solver.local_search import LocalSearch
+from packutils.solver.packer_hooks import PackerHooks
 
 PACKER_AVAILABLE = True
 
@@ -31,183 +50,339 @@ class PalletierWishPacker(AbstractPacker):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self.allow_rotation = kwargs.get("rotation", False)
+        self.layer_score_strategy: "LayerScoreStrategy | None" = kwargs.get(
+            "layer_score_strategy", None
+        )
+        # time budget (seconds) of the local search applied to each packed variant
+        self.local_search_time_budget: "float | None" = kwargs.get(
+            "local_search_time_budget", None
+        )
+        # assign the items to the bins before packing (see assign_items_to_bins)
+        self.bin_assignment = kwargs.get("bin_assignment", False)
+        # number of processes packing the assigned bins
+        self.workers = kwargs.get("workers", 1)
+        # receives the packing events (see PackerHooks), the events are skipped if None
+        self.hooks: "PackerHooks | None" = kwargs.get("hooks", None)
         self.reset(None)
 
-    def reset(self, config: "PackerConfiguration | None"):
-        if config is None or not isinstance(config, PackerConfiguration):
+    def reset(self, config: "PackerConfiguration | PackerConfigurationTuple | None"):
+        if config is None or not isinstance(
+            config, (PackerConfiguration, PackerConfigurationTuple)
+        ):
             config = PackerConfiguration()
         # logging.info("Used packer config: " + str(config))
         self.config = config
 
-        # not implemented yet
-        self.allow_rotation = False  # kwargs.get("rotation", False)
-
         self.snappoint_direction = SnappointDirection.RIGHT
 
         self.prev_item = None
 
+        # precomputed layers per bin width (see get_layer_catalog)
+        self.layer_catalogs = {}
+        # items (shape -> amount) planned for the current layer and the z of the layer
+        self.layer_plan: "collections.Counter | None" = None
+        self.layer_plan_z = None
+
+        # packing duration (seconds) per bin of the last packed variant
+        self.bin_timings: List[float] = []
+
     def get_params(self) -> dict:
-        return {}
+        return {"rotation": self.allow_rotation}
 
     def pack_variants(
-        self, order: Order, configs: List[PackerConfiguration]
+        self,
+        order: Order,
+        configs: List[PackerConfiguration],
+        stop_at_lower_bound: bool = False,
     ) -> List[PackingVariant]:
+        """
+        Packs a variant for each configuration.
+
+        Args:
+            order (Order): The order to pack.
+            configs (List[PackerConfiguration]): The configurations.
+            stop_at_lower_bound (bool, optional): Whether to stop once a variant packs all
+                items into the lower bound of bins (see get_lower_bound), the remaining
+                configurations are skipped. Default is False.
+
+        Returns:
+            List[PackingVariant]: The variants of the packed configurations (in order).
+        """
         variants = []
+        lower_bounds = {}
         for config in configs:
-            logging.info(f"Using config: {config}")
-            variants.append(self.pack_variant(order, config))
+            logging.info("Using config: %s", config)
+            variant = self.pack_variant(order, config)
+            variants.append(variant)
+            if not stop_at_lower_bound or variant is None:
+                continue
+
+            padding_x = config.padding_x if config is not None else 0
+            if padding_x not in lower_bounds:
+                lower_bounds[padding_x] = get_lower_bound(
+                    order, self.reference_bins, padding_x, self.allow_rotation
+                )
+            if meets_lower_bound(variant, lower_bounds[padding_x]):
+                logging.info(
+                    "Variant meets the lower bound of %s bins, skipping %s configurations.",
+                    lower_bounds[padding_x],
+                    len(configs) - len(variants),
+                )
+                break
         return variants
 
     def pack_variant(
         self, order: Order, config: PackerConfiguration = None
     ) -> "PackingVariant | None":
         self.reset(config)
+        metrics.CONFIGS_PACKED.inc()
 
         items_to_pack = [
             Item(
                 id=a.article_id,
-                width=a.width + config.padding_x,
+                width=a.width + self.config.padding_x,
                 length=a.length,
                 height=a.height,
+                weight=a.weight,
             )
             for a in order.articles
             for _ in range(a.amount)
         ]
 
-        variant = self._pack_variant(items_to_pack)
+        with metrics.CONFIG_PACKING_SECONDS.time():
+            variant = self._pack_variant(items_to_pack)
+            if self.local_search_time_budget is not None:
+                variant = LocalSearch(self.local_search_time_budget).improve_variant(
+                    variant
+                )
         return variant
 
     def _pack_variant(self, items: List[Item]) -> PackingVariant:
+        self.bin_timings = []
+        if self.bin_assignment and len(self.reference_bins) > 1:
+            return self._pack_variant_assigned(items)
+
         variant = PackingVariant()
         items_to_pack = copy.deepcopy(items)
         for bin_index, bin in enumerate(copy.deepcopy(self.reference_bins)):
-            bin.stability_factor = self.config.bin_stability_factor
-            logging.info("-" * 20 + f" Bin {bin_index+1}")
-            snappoints_to_ignore = []
-            layer_z_max = bin.height
+            logging.info("%s Bin %s", "-" * 20, bin_index + 1)
+            start = time.perf_counter()
+            self._fill_bin(bin, items_to_pack)
+            self.bin_timings.append(time.perf_counter() - start)
+            if len(bin.packed_items) > 0:
+                variant.add_bin(bin)
 
-            is_packing = True
-            while is_packing:
-                if len(items_to_pack) < 1:
-                    is_packing = False
-                    break
+        for item in items_to_pack:
+            variant.add_unpacked_item(item, None)
 
-                is_new_layer = layer_z_max == bin.height
+        return variant
 
-                snappoints = [
-                    point
-                    for point in bin.get_snappoints()
-                    if not point in snappoints_to_ignore and point.z < layer_z_max
-                ]
+    def _pack_variant_assigned(self, items: List[Item]) -> PackingVariant:
+        """
+        Packs the items with an assignment pre-pass.
+
+        The items are assigned to the lower bound of bins first (see assign_items_to_bins),
+        the bins are packed independently (in parallel if workers > 1). Items that were not
+        assigned or did not fit into their bin are packed sequentially, into the free space
+        of the assigned bins first and then into the remaining bins.
+        """
+        variant = PackingVariant()
+        items_to_pack = copy.deepcopy(items)
+        bins = copy.deepcopy(self.reference_bins)
+        num_bins = min(
+            len(bins),
+            max(
+                1,
+                get_items_lower_bound(
+                    items_to_pack, bins, self.allow_rotation, self.config.padding_x
+                ),
+            ),
+        )
+        assigned, leftovers = assign_items_to_bins(items_to_pack, bins[:num_bins])
+        logging.info(
+            "Assigned items to %s bins, %s items left over.", num_bins, len(leftovers)
+        )
+
+        tasks = [(self, bin, bin_items) for bin, bin_items in zip(bins, assigned)]
+        if self.workers is not None and self.workers > 1 and num_bins > 1:
+            with multiprocessing.Pool(min(self.workers, num_bins)) as pool:
+                results = pool.starmap(_fill_assigned_bin, tasks)
+        else:
+            results = [_fill_assigned_bin(*task) for task in tasks]
+
+        packed_bins = []
+        for bin, unpacked, duration in results:
+            self.bin_timings.append(duration)
+            packed_bins.append(bin)
+            leftovers.extend(unpacked)
+
+        # the leftovers are packed on top of the assigned bins first, then into new bins
+        packed_bins += bins[num_bins:]
+        for bin_index, bin in enumerate(packed_bins):
+            if len(leftovers) > 0:
+                logging.info("%s Bin %s (leftovers)", "-" * 20, bin_index + 1)
+                start = time.perf_counter()
+                # each bin starts with a fresh state, as in _fill_assigned_bin
+                self.snappoint_direction = SnappointDirection.RIGHT
+                self.prev_item = None
+                self._fill_bin(bin, leftovers)
+                if bin_index < num_bins:
+                    self.bin_timings[bin_index] += time.perf_counter() - start
+                else:
+                    self.bin_timings.append(time.perf_counter() - start)
+            if len(bin.packed_items) > 0:
+                variant.add_bin(bin)
+
+        for item in leftovers:
+            variant.add_unpacked_item(item, None)
+
+        return variant
+
+    def _fill_bin(self, bin: Bin, items_to_pack: List[Item]):
+        """
+        Packs items into the bin until no item fits anymore, packed items are removed from the list.
+        """
+        bin.stability_factor = self.config.bin_stability_factor
+        if self.layer_score_strategy is not None and (
+            bin.width not in self.layer_catalogs
+        ):
+            self.layer_catalogs[bin.width] = self.get_layer_catalog(
+                items_to_pack, bin.width
+            )
+        self.layer_plan, self.layer_plan_z = None, None
+        snappoints_to_ignore = []
+        layer_z_max = bin.height
+        if self.hooks is not None:
+            self.hooks.on_layer_started(bin, bin.max_z)
+
+        is_packing = True
+        while is_packing:
+            if len(items_to_pack) < 1:
+                is_packing = False
+                break
+
+            is_new_layer = layer_z_max == bin.height
+
+            snappoints = [
+                point
+                for point in bin.get_snappoints()
+                if not point in snappoints_to_ignore and point.z < layer_z_max
+            ]
+
+            if is_new_layer:
+                sorted_points = sorted(snappoints, key=lambda p: p.x)
+            else:
+                sorted_points = sorted(snappoints, key=lambda p: (p.z, p.x))
+
+            # no snappoint available
+            if len(sorted_points) < 2:
+                # reached top of the bin or no possible positions left
+                if layer_z_max == bin.height:
+                    is_packing = False
+                    logging.info("There are no possible positions left.")
 
-                if is_new_layer:
-                    sorted_points = sorted(snappoints, key=lambda p: p.x)
                 else:
-                    sorted_points = sorted(snappoints, key=lambda p: (p.z, p.x))
-
-                # no snappoint available
-                if len(sorted_points) < 2:
-                    # reached top of the bin or no possible positions left
-                    if layer_z_max == bin.height:
-                        is_packing = False
-                        logging.info("There are no possible positions left.")
-
-                    else:
-                        logging.info(f"Starting next layer! ({layer_z_max})")
-
-                        # if self.fill_gaps:
-                        #    self._fill_gaps(bin, layer_z_min)
-                        snappoints_to_ignore = []
-                        layer_z_max = bin.height
-                        self.snappoint_direction = SnappointDirection.RIGHT
-                    continue
-
-                left_snappoint = [
-                    p for p in sorted_points if p.direction == SnappointDirection.RIGHT
-                ][0]
-                right_snappoint = [
-                    p for p in sorted_points if p.direction == SnappointDirection.LEFT
-                ][0]
-
-                logging.info("")
+                    logging.info("Starting next layer! (%s)", layer_z_max)
+                    if self.hooks is not None:
+                        self.hooks.on_layer_started(bin, layer_z_max)
+
+                    # if self.fill_gaps:
+                    #    self._fill_gaps(bin, layer_z_min)
+                    snappoints_to_ignore = []
+                    layer_z_max = bin.height
+                    self.snappoint_direction = SnappointDirection.RIGHT
+                continue
+
+            left_snappoint = [
+                p for p in sorted_points if p.direction == SnappointDirection.RIGHT
+            ][0]
+            right_snappoint = [
+                p for p in sorted_points if p.direction == SnappointDirection.LEFT
+            ][0]
+
+            logging.info("")
+            logging.info("Selected snappoints: %s, %s", left_snappoint, right_snappoint)
+
+            snappoint = (
+                right_snappoint
+                if self.snappoint_direction == SnappointDirection.LEFT
+                else left_snappoint
+            )
+            logging.info("Selected snappoint: %s", snappoint)
+            if self.hooks is not None:
+                self.hooks.on_snappoint_selected(bin, snappoint)
+
+            allowed_max_z = (
+                bin.height if self.config.allow_item_exceeds_layer else layer_z_max
+            )
+            best = self.get_best_item_to_pack(
+                items_to_pack, bin, snappoint, allowed_max_z
+            )
+            logging.info("Item to pack: %s", best)
+
+            if best is None:
                 logging.info(
-                    f"Selected snappoints: {left_snappoint}, {right_snappoint}"
+                    "This snappoint is invalid, checking other snappoint. %s", snappoint
                 )
-
+                if self.hooks is not None:
+                    self.hooks.on_item_rejected(bin, None, snappoint, None)
+                snappoints_to_ignore.append(snappoint)
                 snappoint = (
                     right_snappoint
-                    if self.snappoint_direction == SnappointDirection.LEFT
+                    if snappoint == left_snappoint
                     else left_snappoint
                 )
-                logging.info(f"Selected snappoint: {snappoint}")
-
-                allowed_max_z = (
-                    bin.height if self.config.allow_item_exceeds_layer else layer_z_max
-                )
+                if self.hooks is not None:
+                    self.hooks.on_snappoint_selected(bin, snappoint)
                 best = self.get_best_item_to_pack(
                     items_to_pack, bin, snappoint, allowed_max_z
                 )
-                logging.info(f"Item to pack: {best}")
 
-                if best is None:
-                    logging.info(
-                        f"This snappoint is invalid, checking other snappoint. {snappoint}"
-                    )
-                    snappoints_to_ignore.append(snappoint)
-                    snappoint = (
-                        right_snappoint
-                        if snappoint == left_snappoint
-                        else left_snappoint
-                    )
-                    best = self.get_best_item_to_pack(
-                        items_to_pack, bin, snappoint, allowed_max_z
-                    )
+            if best is None:
+                logging.info("This snappoint is invalid too. %s", snappoint)
+                if self.hooks is not None:
+                    self.hooks.on_item_rejected(bin, None, snappoint, None)
+                snappoints_to_ignore.append(snappoint)
+                continue
 
-                if best is None:
-                    logging.info(f"This snappoint is invalid too. {snappoint}")
-                    snappoints_to_ignore.append(snappoint)
-                    continue
+            done, _ = self.pack_item_on_snappoint(
+                bin=bin, item=best, snappoint=snappoint
+            )
 
-                done, _ = self.pack_item_on_snappoint(
-                    bin=bin, item=best, snappoint=snappoint
-                )
+            if not done:
+                continue
 
-                if not done:
-                    continue
+            layer_z_max = bin.max_z
+            remove_item_from_list(items_to_pack, best, self.config.padding_x)
+            snappoints_to_ignore = []
 
-                layer_z_max = bin.max_z
-                items_to_pack.remove(best)
-                snappoints_to_ignore = []
+            # check if the placement can be mirrored
+            if self.config.mirror_walls and snappoint.x == 0:
+                logging.info("Mirroring walls")
 
-                # check if the placement can be mirrored
-                if self.config.mirror_walls and snappoint.x == 0:
-                    logging.info("Mirroring walls")
+                mirror_snappoint = Snappoint(
+                    x=bin.width,
+                    y=snappoint.y,
+                    z=snappoint.z,
+                    direction=SnappointDirection.LEFT,
+                )
+                mirror_item = get_item_with_dimension(
+                    items_to_pack,
+                    best.dimensions,
+                    get_rotation(best),
+                    self.config.padding_x,
+                )
+                if mirror_item is not None:
+                    logging.info("No item with same dimensions found.")
 
-                    mirror_snappoint = Snappoint(
-                        x=bin.width,
-                        y=snappoint.y,
-                        z=snappoint.z,
-                        direction=SnappointDirection.LEFT,
+                    done, _ = self.pack_item_on_snappoint(
+                        bin=bin, item=mirror_item, snappoint=mirror_snappoint
                     )
-                    mirror_item = get_item_with_dimension(
-                        items_to_pack, best.dimensions
-                    )
-                    if mirror_item is not None:
-                        logging.info("No item with same dimensions found.")
-
-                        done, _ = self.pack_item_on_snappoint(
-                            bin=bin, item=mirror_item, snappoint=mirror_snappoint
+                    if done:
+                        remove_item_from_list(
+                            items_to_pack, mirror_item, self.config.padding_x
                         )
-                        if done:
-                            items_to_pack.remove(mirror_item)
-
-            if len(bin.packed_items) > 0:
-                variant.add_bin(bin)
-
-        for item in items_to_pack:
-            variant.add_unpacked_item(item, None)
-
-        return variant
 
     def _get_variant_score(self, variant: PackingVariant):
         return 0
@@ -227,26 +402,28 @@ class PalletierWishPacker(AbstractPacker):
         """
 
         item = copy.deepcopy(item)
-        if snappoint.direction == SnappointDirection.LEFT:
-            position = Position(snappoint.x - item.width, snappoint.y, snappoint.z)
-
-        if snappoint.direction == SnappointDirection.RIGHT:
-            position = Position(snappoint.x, snappoint.y, snappoint.z)
+        position = get_snappoint_position(item, snappoint)
 
         item.position = position
         done, info = bin.pack_item(item)
         if info is not None:
-            logging.info(f"{info} - {item}")
+            logging.info("%s - %s", info, item)
         if done:
-            logging.info(f"Packed item {item}")
+            logging.info("Packed item %s", item)
+            if self.hooks is not None:
+                self.hooks.on_item_packed(bin, item, snappoint)
             self.prev_item = item
+            if self.layer_plan is not None:
+                self.layer_plan[self._get_plan_key(item)] -= 1
             if item.volume / bin.volume >= self.config.direction_change_min_volume:
                 self.snappoint_direction = self.snappoint_direction.change()
-                logging.info(f"New snappoint direction: {self.snappoint_direction}")
+                logging.info("New snappoint direction: %s", self.snappoint_direction)
 
             new_z_max = position.z + item.height
             return done, new_z_max
 
+        if self.hooks is not None:
+            self.hooks.on_item_rejected(bin, item, snappoint, info)
         return done, None
 
     def is_packer_available(self) -> bool:
@@ -267,21 +444,48 @@ class PalletierWishPacker(AbstractPacker):
         Returns:
             Item: The best item to pack or None if no item can be packed.
         """
+        metrics.SNAPPOINTS_EVALUATED.inc()
 
-        possible_items = [
-            copy.deepcopy(item)
-            for item in items
-            if can_pack_on_snappoint(bin, item, snappoint, max_z)
-        ]
+        possible_items = get_possible_items(
+            items, bin, snappoint, max_z, self.allow_rotation, self.config.padding_x
+        )
 
         if len(possible_items) < 1:
             return None
 
+        is_new_layer = not np.any(bin.get_height_map() > snappoint.z)
+        if self.layer_score_strategy is not None:
+            if is_new_layer and self.layer_plan_z != snappoint.z:
+                self.layer_plan = self.get_layer_plan(
+                    items, bin.width, max_z - snappoint.z
+                )
+                self.layer_plan_z = snappoint.z
+            # the rows of the plan consist of items in their original orientation
+            planned_items = [
+                item
+                for item in possible_items
+                if self.layer_plan is not None
+                and not get_rotation(item)
+                and self.layer_plan[self._get_plan_key(item)] > 0
+            ]
+            # the greedy selection continues when the planned items are packed or do not fit
+            if len(planned_items) > 0:
+                possible_items = planned_items
+
+        fill_width = (
+            get_free_width(bin, snappoint)
+            if ItemSelectStrategy.BEST_W_TO_FILL
+            in (
+                self.config.new_layer_select_strategy,
+                self.config.default_select_strategy,
+            )
+            else None
+        )
+
         new_layer_item = select_item_from_list(
-            possible_items, self.config.new_layer_select_strategy, None
+            possible_items, self.config.new_layer_select_strategy, None, fill_width
         )
 
-        is_new_layer = not np.any(bin.get_height_map() > snappoint.z)
         if is_new_layer:
             return new_layer_item
 
@@ -298,14 +502,113 @@ class PalletierWishPacker(AbstractPacker):
             ) or can_fit_in_layer(bin, doubled_item_w, snappoint.z, max_z)
 
             if not can_both_fit:
-                possible_items.remove(new_layer_item)
-                possible_items.remove(new_layer_item)
+                # the items differ in weight or rotation, so match the dimensions only
+                possible_items = [
+                    i for i in possible_items if i.dimensions != new_layer_item.dimensions
+                ]
 
         next_item = select_item_from_list(
-            possible_items, self.config.default_select_strategy, self.prev_item
+            possible_items,
+            self.config.default_select_strategy,
+            self.prev_item,
+            fill_width,
         )
         return next_item
 
+    def get_candidate_layers(self, items: List[Item]) -> List[Layer]:
+        """
+        Get the candidate layer heights of the items scored by the layer score strategy.
+
+        Each distinct item height is a candidate. With MIN_HEIGHT_VARIANCE the score of a
+        layer is the negative sum of the absolute height differences between the items and
+        the layer.
+
+        Args:
+            items (List[Item]): The items to be packed.
+
+        Returns:
+            List[Layer]: The candidate layers, sorted by score (best first).
+        """
+        if len(items) < 1:
+            return []
+
+        strategy = self.layer_score_strategy or LayerScoreStrategy.MIN_HEIGHT_VARIANCE
+        if strategy != LayerScoreStrategy.MIN_HEIGHT_VARIANCE:
+            raise NotImplementedError(f"LayerScoreStrategy not implemented: {strategy}")
+
+        heights, counts = np.unique([item.height for item in items], return_counts=True)
+        differences = np.abs(heights[:, None] - heights[None, :]) @ counts
+        layers = [
+            Layer(int(height), -int(difference))
+            for height, difference in zip(heights, differences)
+        ]
+        return sorted(layers, key=lambda layer: layer.score, reverse=True)
+
+    def _get_plan_key(self, item: Item) -> "Tuple[Tuple[int, int, int], float]":
+        """
+        Returns the key of an item in the layer plan: the shape of the item in its original
+        orientation (any orientation of a planned shape uses up the plan).
+        """
+        dims = get_unrotated_dimensions(
+            item.dimensions, get_rotation(item), self.config.padding_x
+        )
+        return dims, item.weight
+
+    def get_layer_catalog(
+        self, items: List[Item], width: int
+    ) -> "List[Tuple[Layer, collections.Counter]]":
+        """
+        Precomputes the best row filling of each candidate layer.
+
+        The row of a layer contains items not higher than the layer and fills the width
+        of the bin as good as possible (bounded knapsack over the item widths, maximizing
+        the covered area).
+
+        Args:
+            items (List[Item]): The items to be packed.
+            width (int): The width of the bin.
+
+        Returns:
+            List[Tuple[Layer, collections.Counter]]: The layers (best first) with the amount
+            of items per shape (dimensions, weight) of the row.
+        """
+        amounts = collections.Counter((item.dimensions, item.weight) for item in items)
+        catalog = []
+        for layer in self.get_candidate_layers(items):
+            shapes = {
+                shape: amount
+                for shape, amount in amounts.items()
+                if shape[0][2] <= layer.height
+            }
+            row = fill_row(shapes, width)
+            if len(row) > 0:
+                catalog.append((layer, row))
+        return catalog
+
+    def get_layer_plan(
+        self, items: List[Item], width: int, max_height: int
+    ) -> "collections.Counter | None":
+        """
+        Selects the best precomputed layer that fits the height and the remaining items.
+
+        Args:
+            items (List[Item]): The remaining items.
+            width (int): The width of the bin.
+            max_height (int): The maximum height of the layer.
+
+        Returns:
+            collections.Counter | None: The amount of items per shape planned for the layer.
+        """
+        amounts = collections.Counter((item.dimensions, item.weight) for item in items)
+        for layer, row in self.layer_catalogs.get(width, []):
+            if layer.height > max_height:
+                continue
+            plan = row & amounts
+            if len(plan) > 0:
+                logging.info("Selected layer: %s %s", layer, dict(plan))
+                return plan
+        return None
+
     def _fill_gaps(self, bin: Bin, min_z: int):
         # detect the gap
         heightmap = bin.get_height_map() - min_z
@@ -322,9 +625,8 @@ class PalletierWishPacker(AbstractPacker):
             return False
 
         # this does not work for larger stacks to move (use prev approach with items left and right of gap)
-        for item in items_to_move:
-            bin.packed_items.remove(item)
-            bin.matrix[min_z:, :, :] = 0
+        for item in reversed(items_to_move):
+            bin.remove_item(item)
 
         items_to_move = sorted(
             items_to_move, key=lambda x: (x.position.z, x.position.x)
@@ -386,11 +688,7 @@ def can_pack_on_snappoint(
     """
 
     item = copy.deepcopy(item)
-    if snappoint.direction == SnappointDirection.LEFT:
-        position = Position(snappoint.x - item.width, snappoint.y, snappoint.z)
-
-    if snappoint.direction == SnappointDirection.RIGHT:
-        position = Position(snappoint.x, snappoint.y, snappoint.z)
+    position = get_snappoint_position(item, snappoint)
 
     item.position = position
     can_be_packed, _ = bin.can_item_be_packed(item)
@@ -400,24 +698,215 @@ def can_pack_on_snappoint(
     return can_be_packed and not exceeds_height
 
 
-def get_item_with_dimension(items: List[Item], dims: "Tuple[int, int, int]"):
+def get_free_width(bin: Bin, snappoint: Snappoint) -> int:
+    """
+    Get the free width next to a snappoint at the height of the snappoint.
+
+    Args:
+        bin (Bin): The bin to pack the item into.
+        snappoint (Snappoint): The snappoint.
+
+    Returns:
+        int: The width (to the right of a RIGHT or to the left of a LEFT snappoint) not occupied at the snappoint height.
+    """
+    blocked = bin.get_height_map()[snappoint.y] > snappoint.z
+    if snappoint.direction == SnappointDirection.LEFT:
+        blocked_left = np.flatnonzero(blocked[: snappoint.x])
+        return snappoint.x - (int(blocked_left[-1]) + 1 if len(blocked_left) > 0 else 0)
+
+    blocked_right = np.flatnonzero(blocked[snappoint.x :])
+    return int(blocked_right[0]) if len(blocked_right) > 0 else bin.width - snappoint.x
+
+
+def get_item_with_dimension(
+    items: List[Item],
+    dims: "Tuple[int, int, int]",
+    rotation: int = 0,
+    padding_x: int = 0,
+):
     """
     Get an item with the specified dimensions from a list of items.
 
     Args:
         items (List[Item]): The list of items to search from.
         dims (Tuple[int]): The dimensions (width, length, height) of the item to find.
+        rotation (int, optional): The rotation type applied to the items before comparing. Default is 0.
+        padding_x (int, optional): The padding included in the width of the items (see get_rotated_item).
 
     Returns:
-        Item: The item with the specified dimensions, or None if not found.
+        Item: The (rotated) item with the specified dimensions, or None if not found.
     """
-    items_same_dim = [item for item in items if item.dimensions == dims]
+    items_same_dim = [
+        item
+        for item in items
+        if get_rotated_padded_dimensions(item, rotation, padding_x) == dims
+    ]
     if len(items_same_dim) < 1:
         return None
 
+    if rotation:
+        return get_rotated_item(items_same_dim[0], rotation, padding_x)
     return copy.deepcopy(items_same_dim[0])
 
 
+def get_rotation(item: Item) -> int:
+    """
+    Returns the rotation type of an item (0 for items without position).
+    """
+    if item.position is None or item.position.rotation is None:
+        return 0
+    return item.position.rotation
+
+
+def get_snappoint_position(item: Item, snappoint: Snappoint) -> Position:
+    """
+    Returns the position of an item placed on a snappoint (keeping the rotation of the item).
+    """
+    rotation = get_rotation(item)
+    if snappoint.direction == SnappointDirection.LEFT:
+        return Position(
+            snappoint.x - item.width, snappoint.y, snappoint.z, rotation=rotation
+        )
+    return Position(snappoint.x, snappoint.y, snappoint.z, rotation=rotation)
+
+
+def get_possible_items(
+    items: List[Item],
+    bin: Bin,
+    snappoint: Snappoint,
+    max_z: int,
+    allow_rotation: bool = False,
+    padding_x: int = 0,
+) -> List[Item]:
+    """
+    Get the items (in all allowed orientations) that can be packed on a snappoint.
+
+    The feasibility is checked once per distinct orientation and weight, not per item.
+    Items in their original orientation are returned as they are, rotated items as
+    rotated copies.
+
+    Args:
+        items (List[Item]): The items to be packed.
+        bin (Bin): The bin to pack the items into.
+        snappoint (Snappoint): The snappoint to pack the items on.
+        max_z (int): The maximum height allowed for the packed items.
+        allow_rotation (bool, optional): Whether the items may be rotated. Default is False.
+        padding_x (int, optional): The padding included in the width of the items, it is
+            kept on the width of rotated items. Default is 0.
+
+    Returns:
+        List[Item]: The items that can be packed.
+    """
+    feasible = {}
+    feasible_orientations = {}
+    possible_items = []
+    for item in items:
+        shape = (item.dimensions, item.weight)
+        if shape not in feasible_orientations:
+            orientations = (
+                get_orientations(
+                    item.width - padding_x, item.length, item.height, padding_x
+                )
+                if allow_rotation
+                else ((0, item.dimensions),)
+            )
+            shape_orientations = []
+            for rotation, dims in orientations:
+                if (dims, item.weight) not in feasible:
+                    feasible[(dims, item.weight)] = can_pack_on_snappoint(
+                        bin,
+                        get_rotated_item(item, rotation, padding_x) if rotation else item,
+                        snappoint,
+                        max_z,
+                    )
+                if feasible[(dims, item.weight)]:
+                    shape_orientations.append(rotation)
+            feasible_orientations[shape] = shape_orientations
+
+        for rotation in feasible_orientations[shape]:
+            possible_items.append(
+                get_rotated_item(item, rotation, padding_x) if rotation else item
+            )
+    metrics.FEASIBILITY_CHECKS.inc(len(feasible))
+    return possible_items
+
+
+def remove_item_from_list(items: List[Item], item: Item, padding_x: int = 0):
+    """
+    Removes the item in its original orientation from a list of items.
+
+    Args:
+        items (List[Item]): The list of items.
+        item (Item): The (possibly rotated) item to remove.
+        padding_x (int, optional): The padding included in the width of the items. Default is 0.
+
+    Raises:
+        ValueError: If no matching item is found.
+    """
+    rotation = get_rotation(item)
+    if not rotation:
+        items.remove(item)
+        return
+
+    for index, other in enumerate(items):
+        if (
+            other.id == item.id
+            and other.weight == item.weight
+            and get_rotated_padded_dimensions(other, rotation, padding_x)
+            == item.dimensions
+        ):
+            del items[index]
+            return
+    raise ValueError(f"{item.id}: Item not found in list.")
+
+
+def fill_row(
+    shapes: "Dict[Tuple[Tuple[int, int, int], float], int]", width: int
+) -> "collections.Counter":
+    """
+    Fills a row of the given width with items (bounded knapsack).
+
+    The amount of each shape is split into chunks of 1, 2, 4, ... items, which are
+    solved as 0/1 knapsack over the widths, maximizing the covered area (width * height).
+
+    Args:
+        shapes (Dict[Tuple[Tuple[int, int, int], float], int]): The available amount per shape (dimensions, weight).
+        width (int): The width of the row.
+
+    Returns:
+        collections.Counter: The amount of items per shape of the best row.
+    """
+    chunks = []
+    for shape, amount in shapes.items():
+        size = 1
+        while amount > 0:
+            count = min(size, amount)
+            chunks.append((shape, count))
+            amount -= count
+            size *= 2
+
+    best = np.zeros(width + 1, dtype=np.int64)
+    taken = np.zeros((len(chunks), width + 1), dtype=bool)
+    for index, ((dims, _), count) in enumerate(chunks):
+        chunk_width = dims[0] * count
+        if chunk_width > width:
+            continue
+        value = chunk_width * dims[2]
+        candidate = best[: width + 1 - chunk_width] + value
+        take = candidate > best[chunk_width:]
+        taken[index, chunk_width:] = take
+        best[chunk_width:] = np.where(take, candidate, best[chunk_width:])
+
+    row = collections.Counter()
+    remaining = width
+    for index in range(len(chunks) - 1, -1, -1):
+        if taken[index, remaining]:
+            (dims, weight), count = chunks[index]
+            row[(dims, weight)] += count
+            remaining -= dims[0] * count
+    return row
+
+
 def count_same_dimensions(items: List[Item], item: Item) -> int:
     """
     Counts the number of occurrences of items with the same dimensions as the given item.
@@ -437,6 +926,7 @@ def select_item_from_list(
     items: List[Item],
     strategy: ItemSelectStrategy,
     prev_item: "Item | None",
+    fill_width: "int | None" = None,
 ) -> "Item | None":
     """
     Selects a item based on the specified strategy.
@@ -444,6 +934,8 @@ def select_item_from_list(
     Args:
         items (List[Item]): The list of items to select from.
         strategy (ItemSelectStrategy): The strategy to use for selecting the item.
+        prev_item (Item | None): The previously packed item.
+        fill_width (int | None, optional): The remaining width of the layer, used by BEST_W_TO_FILL.
 
     Returns:
         Item: The best item to pack or None if no item can be packed.
@@ -487,27 +979,165 @@ def select_item_from_list(
         return sorted_items[0]
 
     if strategy == ItemSelectStrategy.LARGEST_W_TO_FILL:
-        unique_items = set(items)
-        largest_w = 0
-        best_item = None
-
-        for item in unique_items:
-            item_count = count_same_dimensions(items, item)
-            if item_count * item.width > largest_w:
-                largest_w = item_count * item.width
-                best_item = item
-        return best_item
+        return _select_largest_to_fill(items, lambda item: item.width)
 
     if strategy == ItemSelectStrategy.LARGEST_W_H_TO_FILL:
-        unique_items = set(items)
-        largest_w_h = 0
-        best_item = None
-
-        for item in unique_items:
-            item_count = count_same_dimensions(items, item)
-            if item_count * item.width * item.height > largest_w_h:
-                largest_w_h = item_count * item.width * item.height
-                best_item = item
-        return best_item
+        return _select_largest_to_fill(items, lambda item: item.width * item.height)
+
+    if strategy == ItemSelectStrategy.BEST_W_TO_FILL:
+        if fill_width is None:
+            return max(items, key=lambda x: (x.width, x.height, x.length))
+
+        counts = collections.Counter(item.width for item in items)
+        widths = tuple(
+            sorted(
+                (width, min(count, fill_width // width))
+                for width, count in counts.items()
+                if width <= fill_width
+            )
+        )
+        fill = get_best_width_fill(widths, fill_width)
+        # no item fits, select the narrowest item
+        if len(fill) < 1:
+            return min(items, key=lambda x: (x.width, -x.height, -x.length))
+
+        fill_widths = set(width for width, _ in fill)
+        return max(
+            (item for item in items if item.width in fill_widths),
+            key=lambda x: (x.width, x.height, x.length),
+        )
 
     raise NotImplementedError(f"ItemSelectStrategy not implemented: {strategy}")
+
+
+def _select_largest_to_fill(items: List[Item], size) -> "Item | None":
+    """
+    Selects the item whose dimensions have the largest total size (amount * size).
+
+    Ties are broken by the first item in the list (the former implementation iterated
+    over a set of the items, so ties depended on the item hashes).
+    """
+    counts = collections.Counter(item.dimensions for item in items)
+    first_items = {}
+    for item in items:
+        first_items.setdefault(item.dimensions, item)
+
+    largest = 0
+    best_item = None
+    for dimensions, item in first_items.items():
+        total = counts[dimensions] * size(item)
+        if total > largest:
+            largest = total
+            best_item = item
+    return best_item
+
+
+@functools.lru_cache(maxsize=4096)
+def get_best_width_fill(
+    widths: "Tuple[Tuple[int, int], ...]", fill_width: int
+) -> "Tuple[Tuple[int, int], ...]":
+    """
+    Finds the combination of item widths that fills the given width best (bounded subset sum).
+
+    The amounts are split into chunks of 1, 2, 4, ... items, which are solved as 0/1 subset sum.
+    The results are cached, so each remaining (widths, fill width) state is only solved once.
+
+    Args:
+        widths (Tuple[Tuple[int, int]]): The available (width, amount) pairs.
+        fill_width (int): The width to fill.
+
+    Returns:
+        Tuple[Tuple[int, int]]: The (width, amount) pairs of the best combination.
+    """
+    chunks = []
+    for width, amount in widths:
+        size = 1
+        while amount > 0:
+            count = min(size, amount)
+            chunks.append((width, count))
+            amount -= count
+            size *= 2
+
+    reachable = np.zeros(fill_width + 1, dtype=bool)
+    reachable[0] = True
+    taken = np.zeros((len(chunks), fill_width + 1), dtype=bool)
+    for index, (width, count) in enumerate(chunks):
+        chunk_width = width * count
+        if chunk_width > fill_width:
+            continue
+        take = reachable[: fill_width + 1 - chunk_width] & ~reachable[chunk_width:]
+        taken[index, chunk_width:] = take
+        reachable[chunk_width:] |= take
+
+    remaining = int(np.flatnonzero(reachable)[-1])
+    fill = collections.Counter()
+    for index in range(len(chunks) - 1, -1, -1):
+        if taken[index, remaining]:
+            width, count = chunks[index]
+            fill[width] += count
+            remaining -= width * count
+    return tuple(sorted(fill.items()))
+
+
+def assign_items_to_bins(
+    items: List[Item], bins: List[Bin]
+) -> "Tuple[List[List[Item]], List[Item]]":
+    """
+    Assigns the items to the bins (volume balanced first fit decreasing).
+
+    The items are sorted by volume and height (largest first), each item is assigned to the
+    bin with the lowest relative volume load where it fits (dimensions, volume and weight).
+
+    Args:
+        items (List[Item]): The items.
+        bins (List[Bin]): The bins.
+
+    Returns:
+        Tuple[List[List[Item]], List[Item]]: The items assigned to each bin and the items that
+        could not be assigned.
+    """
+    assigned = [[] for _ in bins]
+    loads = [0.0 for _ in bins]
+    weights = [0.0 for _ in bins]
+    leftovers = []
+    for item in sorted(items, key=lambda i: (i.volume, i.height), reverse=True):
+        best_index = None
+        for index, bin in enumerate(bins):
+            if (
+                item.width > bin.width
+                or item.length > bin.length
+                or item.height > bin.height
+                or loads[index] + item.volume / bin.volume > 1
+                or (
+                    bin.max_weight is not None
+                    and weights[index] + (item.weight or 0) > bin.max_weight
+                )
+            ):
+                continue
+            if best_index is None or loads[index] < loads[best_index]:
+                best_index = index
+
+        if best_index is None:
+            leftovers.append(item)
+            continue
+        assigned[best_index].append(item)
+        loads[best_index] += item.volume / bins[best_index].volume
+        weights[best_index] += item.weight or 0
+    return assigned, leftovers
+
+
+def _fill_assigned_bin(
+    packer: PalletierWishPacker, bin: Bin, items: List[Item]
+) -> "Tuple[Bin, List[Item], float]":
+    """
+    Packs the assigned items into the bin, independent of the other bins.
+
+    Returns:
+        Tuple[Bin, List[Item], float]: The packed bin, the unpacked items and the duration.
+    """
+    start = time.perf_counter()
+    packer.snappoint_direction = SnappointDirection.RIGHT
+    packer.prev_item = None
+    items = list(items)
+    packer._fill_bin(bin, items)
+    return bin, items, time.perf_counter() - start
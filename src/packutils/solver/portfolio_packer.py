@@ -0,0 +1,215 @@
+import collections
+import inspect
+import logging
+import multiprocessing
+import time
+from typing import List, Tuple
+
+from packutils.data.order import Order
+from packutils.data.packer_configuration import (
+    PackerConfiguration,
+    PackerConfigurationTuple,
+)
+from packutils.data.packing_variant import PackingVariant
+from packutils.eval.packing_evaluation import (
+    PackingEvaluation,
+    PackingEvaluationWeights,
+)
+from packutils.solver.abstract_packer import AbstractPacker
+
+PACKER_AVAILABLE = True
+
+# seconds until the running packers are terminated
+DEFAULT_DEADLINE = 10.0
+
+# status of a packer run
+FINISHED = "finished"
+FAILED = "failed"
+TIMEOUT = "timeout"
+UNAVAILABLE = "unavailable"
+
+# the result of a single packer of the portfolio, the score is None if no variant was packed
+SolverResult = collections.namedtuple(
+    "SolverResult", ["name", "params", "status", "duration", "variant", "score", "error"]
+)
+
+
+class PortfolioPacker(AbstractPacker):
+    """
+    Runs multiple packers concurrently and returns the best variant.
+
+    Each packer runs in its own worker process, packers that are not finished at the
+    deadline are terminated. The variants are ranked by the number of unpacked items and
+    the PackingEvaluation score. The results (status, duration, score) of all packers of
+    the last run are stored in results, best first.
+
+    The packers are passed as instances (e.g. the same packer class with different
+    parameters), unavailable packers are skipped.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.packers: List[AbstractPacker] = kwargs.get("packers", [])
+        self.deadline: float = kwargs.get("deadline", DEFAULT_DEADLINE)
+        self.workers = kwargs.get("workers", None)
+        self.evaluation: PackingEvaluation = kwargs.get(
+            "evaluation", None
+        ) or PackingEvaluation(PackingEvaluationWeights())
+        self.reset(None)
+
+    def reset(self, config: "PackerConfiguration | PackerConfigurationTuple | None"):
+        # the packers of the portfolio receive a PackerConfiguration
+        if isinstance(config, PackerConfigurationTuple):
+            config = config.to_configuration()
+        if config is None or not isinstance(config, PackerConfiguration):
+            config = PackerConfiguration()
+        self.config = config
+        # results of the last run, best first
+        self.results: List[SolverResult] = []
+
+    def get_params(self) -> dict:
+        return {
+            "packers": [
+                (type(packer).__name__, packer.get_params()) for packer in self.packers
+            ],
+            "deadline": self.deadline,
+            "workers": self.workers,
+        }
+
+    def is_packer_available(self) -> bool:
+        return PACKER_AVAILABLE
+
+    def pack_variants(
+        self, order: Order, configs: List[PackerConfiguration]
+    ) -> List[PackingVariant]:
+        return [self.pack_variant(order, config) for config in configs]
+
+    def pack_variant(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> "PackingVariant | None":
+        """
+        Runs all packers and returns the best variant (None if no packer finished in time).
+        """
+        results = self.race(order, config)
+        if len(results) < 1 or results[0].variant is None:
+            return None
+        return results[0].variant
+
+    def race(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> List[SolverResult]:
+        """
+        Runs all packers until the deadline.
+
+        Args:
+            order (Order): The order to pack.
+            config (PackerConfiguration | None, optional): The configuration passed to
+                packers supporting configurations.
+
+        Returns:
+            List[SolverResult]: The results of all packers, best first.
+        """
+        self.reset(config)
+        start = time.perf_counter()
+
+        results = [None] * len(self.packers)
+        available = []
+        for index, packer in enumerate(self.packers):
+            if packer.is_packer_available():
+                available.append(index)
+            else:
+                results[index] = _get_result(packer, UNAVAILABLE)
+
+        if len(available) > 0:
+            workers = self.workers if self.workers is not None else len(available)
+            with multiprocessing.Pool(min(workers, len(available))) as pool:
+                pending = [
+                    (
+                        index,
+                        pool.apply_async(
+                            run_packer, (self.packers[index], order, self.config)
+                        ),
+                    )
+                    for index in available
+                ]
+                for index, async_result in pending:
+                    remaining = self.deadline - (time.perf_counter() - start)
+                    async_result.wait(max(remaining, 0))
+                    packer = self.packers[index]
+                    if not async_result.ready():
+                        logging.info("%s reached the deadline.", type(packer).__name__)
+                        results[index] = _get_result(packer, TIMEOUT, self.deadline)
+                        continue
+
+                    variant, duration, error = async_result.get()
+                    if error is not None:
+                        results[index] = _get_result(
+                            packer, FAILED, duration, error=error
+                        )
+                        continue
+                    score = (
+                        self.evaluation.evaluate_packing_variant(variant)[0]
+                        if variant is not None and len(variant.bins) > 0
+                        else None
+                    )
+                    results[index] = _get_result(
+                        packer, FINISHED, duration, variant, score
+                    )
+            # leaving the pool terminates the stragglers
+
+        self.results = sorted(results, key=get_result_rank)
+        return self.results
+
+
+def run_packer(
+    packer: AbstractPacker, order: Order, config: PackerConfiguration
+) -> "Tuple[PackingVariant | None, float, str | None]":
+    """
+    Packs a variant with the packer (executed in the worker processes).
+
+    The configuration is only passed to packers supporting configurations.
+
+    Returns:
+        Tuple[PackingVariant | None, float, str | None]: The variant, the duration and the
+        error message if the packer failed.
+    """
+    start = time.perf_counter()
+    try:
+        if "config" in inspect.signature(packer.pack_variant).parameters:
+            variant = packer.pack_variant(order, config)
+        else:
+            variant = packer.pack_variant(order)
+    except Exception as e:
+        return None, time.perf_counter() - start, repr(e)
+    return variant, time.perf_counter() - start, None
+
+
+def get_result_rank(result: SolverResult) -> tuple:
+    """
+    Returns the sort key of a result: finished results first, then the least unpacked
+    items, the highest score and the shortest duration (other results keep their order).
+    """
+    if result.status != FINISHED or result.variant is None:
+        return (1,)
+    score = result.score if result.score is not None else 0.0
+    return (0, len(result.variant.unpacked_items), -score, result.duration)
+
+
+def _get_result(
+    packer: AbstractPacker,
+    status: str,
+    duration: float = 0.0,
+    variant: "PackingVariant | None" = None,
+    score: "float | None" = None,
+    error: "str | None" = None,
+) -> SolverResult:
+    return SolverResult(
+        type(packer).__name__,
+        packer.get_params(),
+        status,
+        duration,
+        variant,
+        score,
+        error,
+    )
@@ -0,0 +1,388 @@
+from abc import abstractmethod
+import copy
+import logging
+from typing import Callable, List, Tuple
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import (
+    Item,
+    get_rotated_item,
+    get_rotated_padded_dimensions,
+)
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.solver.abstract_packer import AbstractPacker
+
+PACKER_AVAILABLE = True
+
+AXES = {"width": 0, "length": 1, "height": 2}
+# rotation type swapping the two packed dimensions (see get_rotated_dimensions)
+PLANE_ROTATIONS = {
+    ("width", "length"): 3,
+    ("width", "height"): 1,
+    ("length", "height"): 5,
+}
+
+# (orientation index, u, v) of a placement in the packed plane
+Placement = Tuple[int, int, int]
+
+
+class _RectanglePacker(AbstractPacker):
+    """
+    Base of the 2D packers placing the items one after another into the packed plane of
+    the bins (see Bin.is_packing_2d).
+
+    The bins are opened in the order of the reference bins, each item is placed into the
+    first open bin where it fits. If the plane contains the height, placements need the
+    support required by the bin stability factor.
+    """
+
+    SUPPORTED_HEURISTICS: List[str] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        planes = set()
+        for bin in self.reference_bins:
+            is_2d, dims = bin.is_packing_2d()
+            if not is_2d:
+                raise ValueError(f"{type(self).__name__} can only handle 2D packings.")
+            planes.add(tuple(dims))
+        if len(planes) != 1:
+            raise ValueError(
+                f"{type(self).__name__} can only handle reference bins packed in the same plane."
+            )
+        self.dimensions = list(planes.pop())
+        self.u_axis, self.v_axis = (AXES[dim] for dim in self.dimensions)
+        self.gravity = "height" in self.dimensions
+
+        self.heuristic = kwargs.get("heuristic", "default")
+        if self.heuristic == "default":
+            self.heuristic = self.SUPPORTED_HEURISTICS[0]
+        if self.heuristic not in self.SUPPORTED_HEURISTICS:
+            raise ValueError(
+                f"Heuristic not supported: {self.heuristic} (expected one of {self.SUPPORTED_HEURISTICS})"
+            )
+        self.rotation = kwargs.get("rotation", False)
+        self.sorting = kwargs.get("sorting", True)
+        self.reset(None)
+
+    def reset(self, config: "PackerConfiguration | None"):
+        if config is None or not isinstance(config, PackerConfiguration):
+            config = PackerConfiguration()
+        self.config = config
+
+    def get_params(self) -> dict:
+        return {
+            "heuristic": self.heuristic,
+            "rotation": self.rotation,
+            "sorting": self.sorting,
+        }
+
+    def is_packer_available(self) -> bool:
+        return PACKER_AVAILABLE
+
+    def pack_variants(
+        self, order: Order, configs: List[PackerConfiguration]
+    ) -> List[PackingVariant]:
+        return [self.pack_variant(order, config) for config in configs]
+
+    def pack_variant(
+        self, order: Order, config: "PackerConfiguration | None" = None
+    ) -> PackingVariant:
+        self.reset(config)
+
+        items = [
+            Item(
+                id=a.article_id,
+                width=a.width + self.config.padding_x,
+                length=a.length,
+                height=a.height,
+                weight=a.weight,
+            )
+            for a in order.articles
+            for _ in range(a.amount)
+        ]
+        if self.sorting:
+            # largest area first, longer items first for the same area
+            items.sort(
+                key=lambda item: (
+                    item.dimensions[self.u_axis] * item.dimensions[self.v_axis],
+                    max(item.dimensions[self.u_axis], item.dimensions[self.v_axis]),
+                ),
+                reverse=True,
+            )
+
+        variant = PackingVariant()
+        bins: List[Bin] = []
+        states = []
+        for item in items:
+            packed = any(
+                self._pack_item(bin, state, item) for bin, state in zip(bins, states)
+            )
+            if not packed and len(bins) < len(self.reference_bins):
+                bin = copy.deepcopy(self.reference_bins[len(bins)])
+                bin.stability_factor = self.config.bin_stability_factor
+                bins.append(bin)
+                states.append(self._create_state(bin))
+                packed = self._pack_item(bin, states[-1], item)
+            if not packed:
+                variant.add_unpacked_item(item, None)
+
+        for bin in bins:
+            if len(bin.packed_items) > 0:
+                variant.add_bin(bin)
+        return variant
+
+    @abstractmethod
+    def _create_state(self, bin: Bin):
+        """
+        Creates the placement state (free space) of an empty bin.
+        """
+
+    def _pack_item(self, bin: Bin, state, item: Item) -> bool:
+        """
+        Places the item at the best position of the state and packs it into the bin.
+        """
+        if (
+            bin.max_weight is not None
+            and bin.get_total_weight() + (item.weight or 0) > bin.max_weight
+        ):
+            return False
+
+        orientations = [item]
+        rotation = PLANE_ROTATIONS[tuple(self.dimensions)]
+        # the padding stays on the width of the rotated item
+        padding_x = self.config.padding_x
+        if (
+            self.rotation
+            and get_rotated_padded_dimensions(item, rotation, padding_x)
+            != item.dimensions
+        ):
+            orientations.append(get_rotated_item(item, rotation, padding_x))
+        sizes = np.array(
+            [
+                (o.dimensions[self.u_axis], o.dimensions[self.v_axis])
+                for o in orientations
+            ],
+            dtype=int,
+        )
+
+        is_supported = (
+            (lambda u, v, w: self._is_supported(bin, u, v, w)) if self.gravity else None
+        )
+        placement = state.find(sizes, is_supported)
+        if placement is None:
+            return False
+
+        index, u, v = placement
+        coordinates = [0, 0, 0]
+        coordinates[self.u_axis], coordinates[self.v_axis] = u, v
+        packed = copy.copy(orientations[index])
+        packed.position = Position(*coordinates, rotation=rotation if index > 0 else 0)
+        done, info = bin.pack_item(packed)
+        if not done:
+            logging.info("%s - %s", info, packed)
+            return False
+
+        state.place(u, v, *sizes[index])
+        return True
+
+    def _is_supported(self, bin: Bin, u: int, v: int, w: int) -> bool:
+        if v == 0:
+            return True
+        if self.u_axis == 0:
+            below = bin.matrix[v - 1, 0, u : u + w]
+        else:
+            below = bin.matrix[v - 1, u : u + w, 0]
+        return np.count_nonzero(below) >= w * bin.stability_factor
+
+
+class SkylinePacker(_RectanglePacker):
+    """
+    2D packer placing the items on the skyline (the height of the packing per column).
+
+    Heuristics:
+        bottom_left: The placement with the lowest top, then the leftmost one.
+        best_fit: The placement wasting the least area below the item, then the lowest top.
+
+    The skyline is stored as height per unit column, the candidate positions are the starts
+    and ends of the skyline segments.
+    """
+
+    SUPPORTED_HEURISTICS = ["bottom_left", "best_fit"]
+
+    def _create_state(self, bin: Bin) -> "_Skyline":
+        width, height = bin.get_dimension_2d(self.dimensions)
+        return _Skyline(width, height, self.heuristic)
+
+
+class MaxRectsPacker(_RectanglePacker):
+    """
+    2D packer keeping the maximal free rectangles of the bins.
+
+    Heuristics:
+        best_shortside: The free rectangle with the smallest short side leftover.
+        best_longside: The free rectangle with the smallest long side leftover.
+        best_area: The smallest free rectangle.
+        bottom_left: The placement with the lowest top, then the leftmost one.
+
+    The free rectangles are stored as array (x, y, width, height), all rectangles are
+    scored, split and pruned at once.
+    """
+
+    SUPPORTED_HEURISTICS = ["best_shortside", "best_longside", "best_area", "bottom_left"]
+
+    def _create_state(self, bin: Bin) -> "_FreeRectangles":
+        width, height = bin.get_dimension_2d(self.dimensions)
+        return _FreeRectangles(width, height, self.heuristic)
+
+
+class _Skyline:
+    def __init__(self, width: int, height: int, heuristic: str):
+        self.width = width
+        self.height = height
+        self.heuristic = heuristic
+        self.heights = np.zeros(width, dtype=int)
+
+    def find(
+        self,
+        sizes: np.ndarray,
+        is_supported: "Callable[[int, int, int], bool] | None" = None,
+    ) -> "Placement | None":
+        """
+        Returns the best placement of the orientations (width, height) on the skyline.
+        """
+        segment_starts = np.flatnonzero(np.diff(self.heights, prepend=-1) != 0)
+        segment_ends = np.append(segment_starts[1:], self.width)
+        cumulated = np.concatenate(([0], np.cumsum(self.heights)))
+
+        best, best_key = None, None
+        for index, (w, h) in enumerate(sizes.tolist()):
+            if w > self.width:
+                continue
+            xs = np.unique(np.concatenate((segment_starts, segment_ends - w)))
+            xs = xs[(xs >= 0) & (xs <= self.width - w)]
+            windows = np.lib.stride_tricks.sliding_window_view(self.heights, w)[xs]
+            ys = windows.max(axis=1)
+            valid = ys + h <= self.height
+            if is_supported is not None:
+                valid &= np.array(
+                    [ok and is_supported(x, y, w) for x, y, ok in zip(xs, ys, valid)],
+                    dtype=bool,
+                )
+            if not np.any(valid):
+                continue
+            xs, ys = xs[valid], ys[valid]
+
+            if self.heuristic == "best_fit":
+                waste = w * ys - (cumulated[xs + w] - cumulated[xs])
+                keys = (xs, ys + h, waste)
+            else:
+                keys = (xs, ys + h)
+            candidate = np.lexsort(keys)[0]
+            key = tuple(k[candidate] for k in reversed(keys))
+            if best_key is None or key < best_key:
+                best = (index, int(xs[candidate]), int(ys[candidate]))
+                best_key = key
+        return best
+
+    def place(self, u: int, v: int, w: int, h: int):
+        self.heights[u : u + w] = v + h
+
+
+class _FreeRectangles:
+    def __init__(self, width: int, height: int, heuristic: str):
+        self.heuristic = heuristic
+        # (x, y, width, height)
+        self.rectangles = np.array([[0, 0, width, height]], dtype=int)
+
+    def find(
+        self,
+        sizes: np.ndarray,
+        is_supported: "Callable[[int, int, int], bool] | None" = None,
+    ) -> "Placement | None":
+        """
+        Returns the best placement of the orientations (width, height) in the free rectangles.
+        """
+        x, y, fw, fh = self.rectangles.T
+        candidates = []
+        for index, (w, h) in enumerate(sizes.tolist()):
+            fits = np.flatnonzero((fw >= w) & (fh >= h))
+            if len(fits) < 1:
+                continue
+            leftover_w, leftover_h = fw[fits] - w, fh[fits] - h
+            short_side = np.minimum(leftover_w, leftover_h)
+            long_side = np.maximum(leftover_w, leftover_h)
+            if self.heuristic == "best_longside":
+                primary, secondary = long_side, short_side
+            elif self.heuristic == "best_area":
+                primary, secondary = fw[fits] * fh[fits] - w * h, short_side
+            elif self.heuristic == "bottom_left":
+                primary, secondary = y[fits] + h, x[fits]
+            else:
+                primary, secondary = short_side, long_side
+            candidates.append(
+                np.column_stack(
+                    (
+                        primary,
+                        secondary,
+                        y[fits],
+                        x[fits],
+                        np.full(len(fits), index),
+                        np.full(len(fits), w),
+                    )
+                )
+            )
+        if len(candidates) < 1:
+            return None
+
+        candidates = np.concatenate(candidates)
+        order = np.lexsort(candidates[:, 3::-1].T)
+        for primary, secondary, cy, cx, index, w in candidates[order].tolist():
+            if is_supported is None or is_supported(cx, cy, w):
+                return int(index), int(cx), int(cy)
+        return None
+
+    def place(self, u: int, v: int, w: int, h: int):
+        """
+        Splits the free rectangles overlapping the placed rectangle and removes the free
+        rectangles contained in other ones.
+        """
+        x, y, fw, fh = self.rectangles.T
+        overlaps = (x < u + w) & (x + fw > u) & (y < v + h) & (y + fh > v)
+        hit = self.rectangles[overlaps]
+        hx, hy, hw, hh = hit.T
+
+        right, top = np.full_like(hx, u + w), np.full_like(hy, v + h)
+
+        pieces = [
+            self.rectangles[~overlaps],
+            # left, right, below and above the placed rectangle
+            np.column_stack((hx, hy, u - hx, hh))[hx < u],
+            np.column_stack((right, hy, hx + hw - right, hh))[hx + hw > right],
+            np.column_stack((hx, hy, hw, v - hy))[hy < v],
+            np.column_stack((hx, top, hw, hy + hh - top))[hy + hh > top],
+        ]
+        rectangles = np.concatenate(pieces)
+        self.rectangles = rectangles[~_get_contained(rectangles)]
+
+
+def _get_contained(rectangles: np.ndarray) -> np.ndarray:
+    """
+    Returns a mask of the rectangles contained in another rectangle (duplicates are kept once).
+    """
+    x, y, w, h = rectangles.T
+    inside = (
+        (x[:, None] >= x[None, :])
+        & (y[:, None] >= y[None, :])
+        & (x[:, None] + w[:, None] <= x[None, :] + w[None, :])
+        & (y[:, None] + h[:, None] <= y[None, :] + h[None, :])
+    )
+    equal = np.all(rectangles[:, None, :] == rectangles[None, :, :], axis=2)
+    # a rectangle is removed if it is inside a different rectangle or equal to an earlier one
+    removed = inside & (~equal | np.tri(len(rectangles), k=-1, dtype=bool))
+    return np.any(removed, axis=1)
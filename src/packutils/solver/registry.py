@@ -0,0 +1,71 @@
+import functools
+import importlib
+from typing import Dict, List, Type
+
+from packutils.solver.abstract_packer import AbstractPacker
+
+# packer name -> "module:class", the modules are imported on first use
+PACKERS: Dict[str, str] = {
+    "beam_search": "packutils.solver.beam_search_packer:BeamSearchPacker",
+    "extreme_point": "packutils.solver.extreme_point_packer:ExtremePointPacker",
+    "greedy": "packutils.solver.greedy_packer:GreedyPacker",
+    "maxrects": "packutils.solver.rectangle_packer:MaxRectsPacker",
+    "palletier": "packutils.solver.palletier_packer:PalletierPacker",
+    "palletier_wall": "packutils.solver.palletier_wall_packer:PalletierWallPacker",
+    "palletier_wish": "packutils.solver.palletier_wish_packer:PalletierWishPacker",
+    "portfolio": "packutils.solver.portfolio_packer:PortfolioPacker",
+    "py3dbp": "packutils.solver.py3dbp_packer:Py3dbpPacker",
+    "skyline": "packutils.solver.rectangle_packer:SkylinePacker",
+}
+
+
+def get_packer_names() -> List[str]:
+    """
+    Returns the names of all registered packers.
+    """
+    return sorted(PACKERS)
+
+
+def register_packer(name: str, path: str):
+    """
+    Registers a packer class.
+
+    Args:
+        name (str): The name of the packer.
+        path (str): The import path of the packer class ("module:class").
+    """
+    PACKERS[name] = path
+    get_packer_class.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def get_packer_class(name: str) -> Type[AbstractPacker]:
+    """
+    Returns the packer class of a name, the module of the packer is imported on first use.
+
+    Args:
+        name (str): The name of the packer (see get_packer_names).
+
+    Returns:
+        Type[AbstractPacker]: The packer class.
+    """
+    if name not in PACKERS:
+        raise ValueError(
+            f"Packer not supported: {name} (expected one of {get_packer_names()})"
+        )
+    module_name, class_name = PACKERS[name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_packer(name: str, *args, **kwargs) -> AbstractPacker:
+    """
+    Creates a packer by name.
+
+    Args:
+        name (str): The name of the packer (see get_packer_names).
+        *args, **kwargs: The arguments of the packer (e.g. bins).
+
+    Returns:
+        AbstractPacker: The packer.
+    """
+    return get_packer_class(name)(*args, **kwargs)
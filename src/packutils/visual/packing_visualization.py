@@ -1,18 +1,23 @@
 import os
 import io
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-
-from matplotlib.patches import Rectangle
-from PIL import Image
 
 from packutils.data.bin import Bin
 from packutils.data.packing_variant import PackingVariant
 
+# matplotlib and PIL are imported on first use, they dominate the import time of packutils
+
 
 class PackingVisualization:
     def __init__(self):
-        self.colors = list(mcolors.TABLEAU_COLORS.keys())
+        self._colors = None
+
+    @property
+    def colors(self):
+        if self._colors is None:
+            import matplotlib.colors as mcolors
+
+            self._colors = list(mcolors.TABLEAU_COLORS.keys())
+        return self._colors
 
     def get_color(self, index: int) -> str:
         color = self.colors[index % len(self.colors)]
@@ -74,6 +79,9 @@ class PackingVisualization:
         if not is_2d:
             raise ValueError("Bin is not 2D, use _visualize_bin_3d.")
 
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Rectangle
+
         items = bin.packed_items
         fig, ax = plt.subplots()
 
@@ -120,6 +128,8 @@ class PackingVisualization:
             plt.show()
 
         if return_png:
+            from PIL import Image
+
             img_buf = io.BytesIO()
             plt.savefig(img_buf, format="png")
             img = Image.open(img_buf)
@@ -137,6 +147,8 @@ class PackingVisualization:
         output_dir: "str | None" = None,
         return_png: bool = False,
     ):
+        import matplotlib.pyplot as plt
+
         items = bin.packed_items
         fig = plt.figure()
         ax = fig.add_subplot(111, projection="3d")
@@ -201,6 +213,8 @@ class PackingVisualization:
             plt.show()
 
         if return_png:
+            from PIL import Image
+
             img_buf = io.BytesIO()
             plt.savefig(img_buf, format="png")
             img = Image.open(img_buf)
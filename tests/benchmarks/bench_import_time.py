@@ -0,0 +1,78 @@
+"""
+Measures the import time of packutils modules and the packing API in fresh interpreters.
+
+Usage:
+    python tests/benchmarks/bench_import_time.py [--repeat 5] [module ...]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_MODULES = [
+    "packutils.data.bin",
+    "packutils.solver.registry",
+    "packutils.solver.palletier_wish_packer",
+    "packutils.dataset.data_generator_2d",
+    "packutils.visual.packing_visualization",
+]
+# the API module is imported from its own directory
+API_MODULE = "v1.api"
+API_DIR = os.path.join(ROOT_DIR, "api_packing")
+
+
+def measure_import_time(module: str, repeat: int = 5, cwd: "str | None" = None) -> float:
+    """
+    Returns the median wall time (seconds) of importing a module in a new interpreter,
+    minus the start up time of the interpreter.
+
+    Args:
+        module (str): The module to import.
+        repeat (int, optional): The number of measurements. Default is 5.
+        cwd (str | None, optional): The working directory of the interpreter.
+
+    Returns:
+        float: The median import time in seconds.
+    """
+    baseline = _measure([sys.executable, "-c", "pass"], repeat, cwd)
+    duration = _measure([sys.executable, "-c", f"import {module}"], repeat, cwd)
+    return max(duration - baseline, 0.0)
+
+
+def _measure(command: List[str], repeat: int, cwd: "str | None") -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.join(ROOT_DIR, "src"), cwd or ROOT_DIR, env.get("PYTHONPATH", "")]
+    )
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, env=env, check=True, capture_output=True)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main(argv: "List[str] | None" = None) -> Dict[str, float]:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES + [API_MODULE])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        cwd = API_DIR if module == API_MODULE else None
+        try:
+            results[module] = measure_import_time(module, args.repeat, cwd)
+            print(f"{module :<50}: {results[module] * 1000:8.1f} ms")
+        except subprocess.CalledProcessError as e:
+            print(f"{module :<50}: import failed ({e.stderr.decode().splitlines()[-1]})")
+    return results
+
+
+if __name__ == "__main__":
+    main()
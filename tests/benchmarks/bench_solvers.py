@@ -0,0 +1,366 @@
+"""
+Benchmarks the solvers on reproducible order families, bin resolutions and item counts.
+
+Records the wall time (median), the peak memory (tracemalloc), the utilized space and the
+PackingEvaluation score of each run and stores the results as JSON. Results of two
+versions are compared with --compare.
+
+Usage:
+    python tests/benchmarks/bench_solvers.py [--solvers palletier_wish skyline] [--output results.json]
+    python tests/benchmarks/bench_solvers.py --compare baseline.json results.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.data.packing_variant import PackingVariant
+from packutils.eval.packing_evaluation import (
+    PackingEvaluation,
+    PackingEvaluationWeights,
+)
+from packutils.solver.portfolio_packer import run_packer
+from packutils.solver.registry import create_packer
+
+DEFAULT_SOLVERS = [
+    "palletier_wish",
+    "palletier_wall",
+    "extreme_point",
+    "beam_search",
+    "skyline",
+    "maxrects",
+]
+# units per height map cell, the bins and articles are scaled down by the resolution
+DEFAULT_RESOLUTIONS = [1, 2, 5]
+DEFAULT_ITEM_COUNTS = [20, 50, 100]
+
+# the bins of the Streamlit demo (main.py) at resolution 1
+BIN_WIDTH, BIN_HEIGHT, NUM_BINS = 800, 600, 3
+
+# the weights of the packing API
+EVALUATION_WEIGHTS = dict(
+    item_distribution=1.0, item_stacking=1.0, item_grouping=1.0, utilized_space=3.0
+)
+
+# relative change of the duration and peak memory reported as regression
+DEFAULT_THRESHOLD = 0.1
+
+
+def get_homogeneous_order(num_items: int, rng: random.Random) -> Order:
+    width, height = rng.randint(60, 200), rng.randint(40, 150)
+    return Order(
+        "homogeneous",
+        articles=[Article("1", width=width, length=1, height=height, amount=num_items)],
+    )
+
+
+def get_few_large_many_small_order(num_items: int, rng: random.Random) -> Order:
+    num_large = max(num_items // 10, 1)
+    articles = [
+        Article(
+            f"large {idx}",
+            width=rng.randint(250, 400),
+            length=1,
+            height=rng.randint(150, 250),
+            amount=1,
+        )
+        for idx in range(num_large)
+    ]
+    articles.append(
+        Article(
+            "small",
+            width=rng.randint(30, 60),
+            length=1,
+            height=rng.randint(20, 50),
+            amount=num_items - num_large,
+        )
+    )
+    return Order("few_large_many_small", articles=articles)
+
+
+def get_many_skus_order(num_items: int, rng: random.Random) -> Order:
+    return Order(
+        "many_skus",
+        articles=[
+            Article(
+                str(idx),
+                width=rng.randint(30, 250),
+                length=1,
+                height=rng.randint(20, 200),
+                amount=1,
+            )
+            for idx in range(num_items)
+        ],
+    )
+
+
+def get_demo_order(num_items: int, rng: random.Random) -> Order:
+    """
+    The order of the Streamlit demo (main.py), the item count is fixed.
+    """
+    return Order(
+        "demo",
+        articles=[
+            Article("Article 1", width=68, length=1, height=68, amount=21),
+            Article("Article 2", width=170, length=1, height=175, amount=19),
+            Article("Article 3", width=82, length=1, height=20, amount=19),
+            Article("Article 4", width=185, length=1, height=80, amount=8),
+        ],
+    )
+
+
+ORDER_FAMILIES: Dict[str, Callable[[int, random.Random], Order]] = {
+    "homogeneous": get_homogeneous_order,
+    "few_large_many_small": get_few_large_many_small_order,
+    "many_skus": get_many_skus_order,
+    "demo": get_demo_order,
+}
+
+
+def get_order(family: str, num_items: int, resolution: int, seed: int = 0) -> Order:
+    """
+    Returns the order of a family, the same arguments always return the same order.
+
+    Args:
+        family (str): The order family (see ORDER_FAMILIES).
+        num_items (int): The number of items (ignored by the demo order).
+        resolution (int): The units per height map cell, the articles are scaled down.
+        seed (int, optional): The seed of the random article dimensions.
+
+    Returns:
+        Order: The order.
+    """
+    rng = random.Random(f"{family}-{num_items}-{seed}")
+    order = ORDER_FAMILIES[family](num_items, rng)
+    for article in order.articles:
+        article.width = max(math.ceil(article.width / resolution), 1)
+        article.height = max(math.ceil(article.height / resolution), 1)
+    return order
+
+
+def get_bins(resolution: int) -> List[Bin]:
+    return [
+        Bin(BIN_WIDTH // resolution, 1, BIN_HEIGHT // resolution)
+        for _ in range(NUM_BINS)
+    ]
+
+
+def get_utilized_space(variant: "PackingVariant | None") -> "float | None":
+    """
+    Returns the used volume of the packed bins in percent.
+    """
+    if variant is None or len(variant.bins) < 1:
+        return None
+    used_volume = sum(bin.get_used_volume() for bin in variant.bins)
+    return 100.0 * used_volume / sum(bin.volume for bin in variant.bins)
+
+
+def run_benchmark(
+    solver: str, family: str, resolution: int, num_items: int, repeat: int = 3
+) -> dict:
+    """
+    Packs the order of a family with a solver.
+
+    The wall time is the median of the repetitions, the peak memory is measured in an
+    additional run (tracemalloc slows down the packing).
+
+    Returns:
+        dict: The result of the benchmark.
+    """
+    order = get_order(family, num_items, resolution)
+    result = {
+        "solver": solver,
+        "family": family,
+        "resolution": resolution,
+        "num_items": sum(a.amount for a in order.articles),
+        "duration": None,
+        "peak_memory": None,
+        "num_bins": None,
+        "unpacked_items": None,
+        "utilized_space": None,
+        "score": None,
+        "error": None,
+    }
+
+    try:
+        packer = create_packer(solver, bins=get_bins(resolution))
+    except Exception as e:
+        result["error"] = repr(e)
+        return result
+    if not packer.is_packer_available():
+        result["error"] = "unavailable"
+        return result
+
+    durations = []
+    for _ in range(repeat):
+        variant, duration, error = run_packer(packer, order, PackerConfiguration())
+        if error is not None:
+            result["error"] = error
+            return result
+        durations.append(duration)
+
+    tracemalloc.start()
+    run_packer(packer, order, PackerConfiguration())
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    evaluation = PackingEvaluation(PackingEvaluationWeights(**EVALUATION_WEIGHTS))
+    result.update(
+        duration=statistics.median(durations),
+        peak_memory=peak_memory,
+        num_bins=len(variant.bins) if variant is not None else None,
+        unpacked_items=len(variant.unpacked_items) if variant is not None else None,
+        utilized_space=get_utilized_space(variant),
+        score=(
+            float(evaluation.evaluate_packing_variant(variant)[0])
+            if variant is not None and len(variant.bins) > 0
+            else None
+        ),
+    )
+    return result
+
+
+def run_benchmarks(
+    solvers: List[str] = DEFAULT_SOLVERS,
+    families: "List[str] | None" = None,
+    resolutions: List[int] = DEFAULT_RESOLUTIONS,
+    item_counts: List[int] = DEFAULT_ITEM_COUNTS,
+    repeat: int = 3,
+) -> dict:
+    """
+    Runs the benchmarks of all combinations (the demo order once per solver and resolution).
+
+    Returns:
+        dict: The environment and the results of the benchmarks.
+    """
+    families = families if families is not None else list(ORDER_FAMILIES)
+    results = []
+    for solver in solvers:
+        for family in families:
+            for resolution in resolutions:
+                counts = item_counts[:1] if family == "demo" else item_counts
+                for num_items in counts:
+                    result = run_benchmark(solver, family, resolution, num_items, repeat)
+                    print(_format_result(result))
+                    results.append(result)
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Compares the results of two benchmark runs.
+
+    Args:
+        baseline (dict): The results of the reference version (see run_benchmarks).
+        current (dict): The results of the new version.
+        threshold (float, optional): The relative increase of the duration and peak memory
+            reported as regression. Default is 0.1.
+
+    Returns:
+        List[str]: The regressions: slower, more memory, more unpacked items, lower
+        utilized space or score and new errors.
+    """
+    baseline_results = {_get_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        reference = baseline_results.get(_get_key(result))
+        if reference is None or reference["error"] is not None:
+            continue
+        name = "%s/%s/resolution %s/%s items" % _get_key(result)
+        if result["error"] is not None:
+            regressions.append(f"{name}: failed ({result['error']})")
+            continue
+
+        for metric in ("duration", "peak_memory"):
+            if result[metric] > reference[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {reference[metric]:.4g} -> {result[metric]:.4g}"
+                )
+        if (
+            reference["unpacked_items"] is not None
+            and result["unpacked_items"] is not None
+            and result["unpacked_items"] > reference["unpacked_items"]
+        ):
+            regressions.append(
+                f"{name}: unpacked_items {reference['unpacked_items']} -> {result['unpacked_items']}"
+            )
+        for metric in ("utilized_space", "score"):
+            if (
+                reference[metric] is not None
+                and result[metric] is not None
+                and result[metric] < reference[metric] - 1e-9
+            ):
+                regressions.append(
+                    f"{name}: {metric} {reference[metric]:.4g} -> {result[metric]:.4g}"
+                )
+    return regressions
+
+
+def _get_key(result: dict) -> tuple:
+    return (result["solver"], result["family"], result["resolution"], result["num_items"])
+
+
+def _format_result(result: dict) -> str:
+    name = "%s/%s/resolution %s/%s items" % _get_key(result)
+    if result["error"] is not None:
+        return f"{name :<60}: {result['error']}"
+    return (
+        f"{name :<60}: {result['duration'] * 1000:8.1f} ms"
+        f" {result['peak_memory'] / 1024:8.0f} KiB"
+        f" {result['num_bins']} bins {result['unpacked_items']} unpacked"
+        f" {result['utilized_space'] or 0.0:5.1f} % score {result['score'] or 0.0:.3f}"
+    )
+
+
+def main(argv: "List[str] | None" = None) -> "dict | List[str]":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--solvers", nargs="*", default=DEFAULT_SOLVERS)
+    parser.add_argument("--families", nargs="*", default=list(ORDER_FAMILIES))
+    parser.add_argument("--resolutions", nargs="*", type=int, default=DEFAULT_RESOLUTIONS)
+    parser.add_argument("--items", nargs="*", type=int, default=DEFAULT_ITEM_COUNTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.compare is not None:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare_results(baseline, current, args.threshold)
+        for regression in regressions:
+            print(regression)
+        print(f"{len(regressions)} regressions")
+        return regressions
+
+    results = run_benchmarks(
+        args.solvers, args.families, args.resolutions, args.items, args.repeat
+    )
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
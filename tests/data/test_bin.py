@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import numpy as np
 
 from packutils.data.bin import Bin
@@ -165,6 +166,7 @@ class TestBin(unittest.TestCase):
         height_map = self.bin.get_height_map()
         expected_height_map = np.zeros((10, 10), dtype=int)
         np.testing.assert_array_equal(height_map, expected_height_map)
+        self.assertEqual(height_map.dtype, float)
 
     def test_get_height_map_single_item(self):
         # You need to import Item class or create it if not available
@@ -280,6 +282,175 @@ class TestBin(unittest.TestCase):
 
         self.assertEqual(snappoints, expected_snappoints)
 
+    def test_unpack_last(self):
+        bin = Bin(10, 1, 10)
+        bin.pack_item(Item("item1", 4, 1, 2, position=Position(0, 0, 0)))
+        expected_height_map = bin.get_height_map()
+        expected_snappoints = bin.get_snappoints()
+
+        item2 = Item("item2", 3, 1, 3, position=Position(0, 0, 2))
+        bin.pack_item(item2)
+
+        removed = bin.unpack_last()
+        self.assertEqual(removed, item2)
+        self.assertEqual(len(bin.packed_items), 1)
+        self.assertEqual(bin.get_used_volume(), 8)
+        self.assertEqual(np.count_nonzero(bin.matrix), 8)
+        np.testing.assert_array_equal(bin.get_height_map(), expected_height_map)
+        self.assertEqual(bin.get_snappoints(), expected_snappoints)
+
+        bin.unpack_last()
+        self.assertIsNone(bin.unpack_last())
+        self.assertEqual(bin.max_z, 0)
+
+    def test_remove_item(self):
+        bin = Bin(10, 1, 10)
+        item1 = Item("item1", 4, 1, 2, position=Position(0, 0, 0))
+        item2 = Item("item2", 4, 1, 3, position=Position(4, 0, 0))
+        item3 = Item("item3", 4, 1, 2, position=Position(0, 0, 2))
+        bin.pack_item(item1)
+        bin.pack_item(item2)
+        bin.pack_item(item3)
+
+        result, _ = bin.remove_item(item2)
+        self.assertTrue(result)
+        self.assertEqual(bin.packed_items, [item1, item3])
+        # the matrix holds the placement index of the remaining items
+        self.assertTrue(np.all(bin.matrix[0:2, 0, 0:4] == 1))
+        self.assertTrue(np.all(bin.matrix[2:4, 0, 0:4] == 2))
+        self.assertEqual(np.count_nonzero(bin.matrix), 16)
+        expected_height_map = np.zeros((1, 10), dtype=int)
+        expected_height_map[0, 0:4] = 4
+        np.testing.assert_array_equal(bin.get_height_map(), expected_height_map)
+
+        result, _ = bin.remove_item(item2)
+        self.assertFalse(result)
+
+        # the logged state of item3 is still valid after removing item2
+        bin.unpack_last()
+        expected_height_map[0, 0:4] = 2
+        np.testing.assert_array_equal(bin.get_height_map(), expected_height_map)
+
+        # the position can be used again
+        result, _ = bin.pack_item(Item("item4", 2, 1, 2, position=Position(4, 0, 0)))
+        self.assertTrue(result)
+
+    def test_max_weight(self):
+        bin = Bin(10, 1, 10, max_weight=10.0)
+        result, _ = bin.pack_item(
+            Item("item1", 2, 1, 2, weight=6.0, position=Position(0, 0, 0))
+        )
+        self.assertTrue(result)
+        self.assertEqual(bin.get_total_weight(), 6.0)
+
+        result, info = bin.pack_item(
+            Item("item2", 2, 1, 2, weight=5.0, position=Position(2, 0, 0))
+        )
+        self.assertFalse(result)
+        self.assertIn("weight condition", info)
+
+        result, _ = bin.pack_item(
+            Item("item3", 2, 1, 2, weight=4.0, position=Position(2, 0, 0))
+        )
+        self.assertTrue(result)
+
+        bin.unpack_last()
+        self.assertEqual(bin.get_total_weight(), 6.0)
+
+    def test_running_totals_after_removal(self):
+        bin = Bin(width=10, length=10, height=10)
+        item1 = Item("test", width=3, length=1, height=3, weight=1)
+        item1.position = Position(x=1, y=0, z=0)
+        item2 = Item("test", width=2, length=1, height=2, weight=3)
+        item2.position = Position(x=5, y=0, z=0)
+        bin.pack_item(item1)
+        bin.pack_item(item2)
+        self.assertEqual(bin.get_used_volume(), 13)
+        self.assertEqual(bin.get_center_of_gravity().x, 5)  # (2.5 + 6*3) / 4
+
+        bin.remove_item(item1)
+        self.assertEqual(bin.get_used_volume(), 4)
+        self.assertEqual(bin.get_total_weight(), 3)
+        cg = bin.get_center_of_gravity(use_volume=True)
+        self.assertEqual((cg.x, cg.y, cg.z), (6, 0, 1))
+
+    def test_center_of_gravity_rounding_errors(self):
+        bin = Bin(width=10, length=1, height=10)
+        items = [
+            Item(str(idx), 2, 1, 2, weight=0.1, position=Position(2 * idx, 0, 0))
+            for idx in range(3)
+        ]
+        for item in items:
+            bin.pack_item(item)
+        # the running moment is 3.9999999999999996 after the removal
+        bin.remove_item(items[0])
+        self.assertEqual(bin.get_center_of_gravity().x, 4)
+
+    def test_item_without_weight(self):
+        bin = Bin(width=10, length=1, height=10, max_weight=5)
+        item1 = Item("item1", 2, 1, 2, weight=None, position=Position(0, 0, 0))
+        item2 = Item("item2", 2, 1, 2, weight=2, position=Position(2, 0, 0))
+        self.assertTrue(bin.pack_item(item1)[0])
+        self.assertTrue(bin.pack_item(item2)[0])
+        self.assertEqual(bin.get_total_weight(), 2)
+        self.assertEqual(bin.get_center_of_gravity().x, 3)
+
+        bin.remove_item(item1)
+        self.assertEqual(bin.get_total_weight(), 2)
+
+        bin.packed_items = [item1, item2]
+        self.assertEqual(bin.get_total_weight(), 2)
+
+
+    def test_compare_fingerprint_collision(self):
+        bin1 = Bin(10, 1, 10)
+        bin1.pack_item(Item("a", 2, 1, 2, position=Position(0, 0, 0)))
+        bin2 = Bin(10, 1, 10)
+        bin2.pack_item(Item("a", 2, 1, 2, position=Position(2, 0, 0)))
+
+        # equal fingerprints are confirmed by comparing the packed items
+        with mock.patch.object(
+            Bin, "fingerprint", new_callable=mock.PropertyMock, return_value=0
+        ):
+            self.assertNotEqual(bin1, bin2)
+            self.assertEqual(bin1, bin1.copy())
+
+    def test_copy(self):
+        bin = Bin(10, 10, 10, max_weight=10)
+        bin.pack_item(Item("a", 4, 4, 4, weight=2, position=Position(0, 0, 0)))
+        bin.get_extreme_points()
+
+        snapshot = bin.copy()
+        snapshot.pack_item(Item("b", 4, 4, 4, weight=3, position=Position(4, 0, 0)))
+
+        self.assertEqual(len(bin.packed_items), 1)
+        self.assertEqual(bin.get_used_volume(), 64)
+        self.assertEqual(bin.get_total_weight(), 2)
+        self.assertEqual(np.count_nonzero(bin.matrix), 64)
+        self.assertEqual(len(bin.packed_columns), 1)
+        self.assertNotIn([4, 0, 4], bin.get_extreme_points().tolist())
+
+        self.assertEqual(len(snapshot.packed_items), 2)
+        self.assertEqual(snapshot.get_used_volume(), 128)
+        self.assertEqual(snapshot.get_total_weight(), 5)
+        self.assertIn([4, 0, 4], snapshot.get_extreme_points().tolist())
+        self.assertEqual(snapshot.max_weight, 10)
+
+        snapshot.unpack_last()
+        self.assertEqual(snapshot, bin)
+
+    def test_copy_attributes(self):
+        bin = Bin(10, 10, 10)
+        bin.pack_item(Item("a", 4, 4, 4, weight=2, position=Position(0, 0, 0)))
+        bin.get_extreme_points()
+
+        snapshot = bin.copy()
+        self.assertEqual(snapshot.__dict__.keys(), bin.__dict__.keys())
+        # the mutable containers (lists, arrays, packed columns, extreme points) are not shared
+        for name, value in bin.__dict__.items():
+            if hasattr(value, "copy"):
+                self.assertIsNot(snapshot.__dict__[name], value, name)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.extreme_points import ExtremePoints
+from packutils.data.item import Item
+from packutils.data.position import Position
+
+
+def as_set(points: np.ndarray) -> set:
+    return set(map(tuple, points.tolist()))
+
+
+class TestExtremePoints(unittest.TestCase):
+    def test_empty_bin(self):
+        points = ExtremePoints(10, 10, 10)
+        self.assertEqual(as_set(points.get_active_points()), {(0, 0, 0)})
+        self.assertEqual(len(points), 1)
+
+    def test_single_item(self):
+        bin = Bin(10, 10, 10)
+        bin.pack_item(Item("a", 4, 3, 2, position=Position(0, 0, 0)))
+
+        self.assertEqual(
+            as_set(bin.get_extreme_points()), {(4, 0, 0), (0, 3, 0), (0, 0, 2)}
+        )
+
+    def test_projection(self):
+        bin = Bin(10, 10, 10)
+        bin.pack_item(Item("a", 4, 4, 4, position=Position(0, 0, 0)))
+        bin.pack_item(Item("b", 2, 2, 2, position=Position(4, 0, 0)))
+
+        points = as_set(bin.get_extreme_points())
+        # the top corner of b is projected onto the side of a
+        self.assertIn((4, 0, 2), points)
+        # the front corner of b is projected onto the front of a
+        self.assertIn((4, 2, 0), points)
+        # the corner covered by b is removed
+        self.assertNotIn((4, 0, 0), points)
+
+    def test_incremental_equals_rebuild(self):
+        bin = Bin(10, 10, 10)
+        self.assertEqual(len(bin.get_extreme_points()), 1)
+        items = [
+            Item("a", 4, 4, 4, position=Position(0, 0, 0)),
+            Item("b", 2, 5, 2, position=Position(4, 0, 0)),
+            Item("c", 3, 3, 3, position=Position(0, 4, 0)),
+            Item("d", 4, 4, 1, position=Position(0, 0, 4)),
+        ]
+        for item in items:
+            bin.pack_item(item)
+        incremental = as_set(bin.get_extreme_points())
+
+        bin.unpack_last()
+        bin.pack_item(items[-1])
+        self.assertEqual(as_set(bin.get_extreme_points()), incremental)
+
+    def test_undo(self):
+        bin = Bin(10, 10, 10)
+        bin.pack_item(Item("a", 4, 4, 4, position=Position(0, 0, 0)))
+        points = bin.get_extreme_points().tolist()
+
+        bin.pack_item(Item("b", 4, 4, 4, position=Position(0, 4, 0)))
+        self.assertNotEqual(bin.get_extreme_points().tolist(), points)
+
+        bin.unpack_last()
+        self.assertEqual(bin.get_extreme_points().tolist(), points)
+        self.assertEqual(bin.extreme_points.undo(), True)
+        self.assertEqual(as_set(bin.get_extreme_points()), {(0, 0, 0)})
+        self.assertEqual(bin.extreme_points.undo(), False)
+
+    def test_capacity_grows(self):
+        bin = Bin(100, 1, 100)
+        for x in range(0, 100, 2):
+            bin.pack_item(Item("a", 2, 1, 1, position=Position(x, 0, 0)))
+        points = bin.extreme_points
+
+        self.assertGreater(len(points.points), 64)
+        self.assertTrue(np.all(points.get_active_points()[:, 2] == 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
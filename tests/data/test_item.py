@@ -1,5 +1,6 @@
+import copy
 import unittest
-from packutils.data.item import Item
+from packutils.data.item import Item, get_rotated_item
 from packutils.data.position import Position
 
 
@@ -46,6 +47,46 @@ class ItemTestCase(unittest.TestCase):
             item.to_position_and_dimension_2d(
                 ["width", "depth"])  # Invalid dimension
 
+    def test_cached_values_follow_dimensions(self):
+        item = Item(id="test", width=10, length=20, height=30)
+        other = Item(id="test", width=10, length=20, height=30)
+        self.assertEqual(item.volume, 6000)
+        self.assertEqual(item.surface, 200)
+        self.assertEqual(hash(item), hash(other))
+
+        item.width *= 2
+        self.assertEqual(item.volume, 12000)
+        self.assertEqual(item.surface, 400)
+        self.assertEqual(item.dimensions, (20, 20, 30))
+        self.assertNotEqual(item, other)
+
+        item.width = 10
+        item.weight = 1.0
+        self.assertNotEqual(item, other)
+
+    def test_copy(self):
+        item = Item(
+            id="test", width=10, length=20, height=30, position=Position(x=1, y=2, z=3)
+        )
+        copied = copy.deepcopy(item)
+        self.assertEqual(item, copied)
+        self.assertIsNot(item.position, copied.position)
+
+        copied.position.x = 5
+        self.assertEqual(item.position.x, 1)
+        self.assertNotEqual(item, copied)
+
+    def test_get_rotated_item(self):
+        item = Item("1", width=4, length=1, height=8, weight=2.0)
+        rotated = get_rotated_item(item, 1)
+        self.assertEqual(rotated.dimensions, (8, 1, 4))
+        self.assertEqual(rotated.position.rotation, 1)
+
+        # the padding (included in the width) stays on the width
+        rotated = get_rotated_item(item, 1, padding_x=2)
+        self.assertEqual(rotated.dimensions, (10, 1, 2))
+        self.assertEqual(rotated.weight, 2.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.packed_items import PackedItems
+from packutils.data.position import Position
+
+
+class TestPackedItems(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            Item("item1", 2, 1, 2, weight=1.0, position=Position(0, 0, 0)),
+            Item("item2", 3, 1, 1, weight=2.0, position=Position(2, 0, 0)),
+            Item("item3", 1, 1, 4, weight=3.0, position=Position(5, 0, 0)),
+        ]
+
+    def test_append_grows_capacity(self):
+        packed = PackedItems(capacity=1)
+        for item in self.items:
+            packed.append(item)
+
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(packed.ids, ["item1", "item2", "item3"])
+        np.testing.assert_array_equal(
+            packed.positions, [[0, 0, 0], [2, 0, 0], [5, 0, 0]]
+        )
+        np.testing.assert_array_equal(
+            packed.dimensions, [[2, 1, 2], [3, 1, 1], [1, 1, 4]]
+        )
+        np.testing.assert_array_equal(packed.weights, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(packed.order, [0, 1, 2])
+        np.testing.assert_array_equal(packed.volumes, [4, 3, 4])
+        np.testing.assert_array_equal(
+            packed.centerpoints, [[1, 0.5, 1], [3.5, 0.5, 0.5], [5.5, 0.5, 2]]
+        )
+
+    def test_remove_keeps_order(self):
+        packed = PackedItems.from_items(self.items)
+        packed.remove(0)
+
+        self.assertEqual(packed.ids, ["item2", "item3"])
+        np.testing.assert_array_equal(packed.positions, [[2, 0, 0], [5, 0, 0]])
+        np.testing.assert_array_equal(packed.order, [1, 2])
+
+        packed.append(self.items[0])
+        np.testing.assert_array_equal(packed.order, [1, 2, 3])
+
+        with self.assertRaises(IndexError):
+            packed.remove(3)
+
+    def test_bin_columns(self):
+        bin = Bin(10, 1, 10)
+        for item in self.items:
+            bin.pack_item(item)
+        self.assertEqual(bin.packed_columns.ids, ["item1", "item2", "item3"])
+
+        bin.remove_item(self.items[1])
+        bin.unpack_last()
+        self.assertEqual(bin.packed_columns.ids, ["item1"])
+
+        bin.packed_items = self.items[1:]
+        self.assertEqual(bin.packed_columns.ids, ["item2", "item3"])
+        self.assertEqual(bin.get_used_volume(), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
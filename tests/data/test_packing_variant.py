@@ -1,7 +1,9 @@
 import unittest
+from unittest import mock
 from packutils.data.item import Item
-from packutils.data.bin import Bin
+from packutils.data.bin import Bin, get_item_fingerprint
 from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
 
 
 class TestPackingVariant(unittest.TestCase):
@@ -45,6 +47,72 @@ class TestPackingVariant(unittest.TestCase):
 
         self.assertEqual(variant1, variant2)
 
+    def test_compare_ignores_placement_order(self):
+        items = [
+            Item("item1", 2, 1, 2, position=Position(0, 0, 0)),
+            Item("item2", 3, 1, 1, position=Position(2, 0, 0)),
+            Item("item3", 2, 1, 2, position=Position(0, 0, 2)),
+        ]
+
+        variant1 = PackingVariant()
+        bin1 = Bin(width=10, length=1, height=10)
+        for item in items:
+            bin1.pack_item(item)
+        variant1.add_bin(bin1)
+
+        variant2 = PackingVariant()
+        bin2 = Bin(width=10, length=1, height=10)
+        for item in [items[1], items[0], items[2]]:
+            bin2.pack_item(item)
+        variant2.add_bin(bin2)
+
+        self.assertEqual(bin1.fingerprint, bin2.fingerprint)
+        self.assertEqual(variant1, variant2)
+        self.assertEqual(len(set([variant1, variant2])), 1)
+
+        bin2.unpack_last()
+        self.assertNotEqual(variant1, variant2)
+        bin2.pack_item(items[2])
+        self.assertEqual(variant1, variant2)
+
+        variant2.add_unpacked_item(Item("item4", 1, 1, 1), None)
+        self.assertNotEqual(variant1, variant2)
+
+    def test_compare_fingerprint_collision(self):
+        variant1 = PackingVariant()
+        bin1 = Bin(width=10, length=1, height=10)
+        bin1.pack_item(Item("item1", 2, 1, 2, position=Position(0, 0, 0)))
+        variant1.add_bin(bin1)
+
+        variant2 = PackingVariant()
+        bin2 = Bin(width=10, length=1, height=10)
+        bin2.pack_item(Item("item1", 2, 1, 2, position=Position(2, 0, 0)))
+        variant2.add_bin(bin2)
+
+        # equal fingerprints are confirmed by comparing the items
+        with mock.patch.object(PackingVariant, "get_fingerprint", return_value=()):
+            self.assertNotEqual(variant1, variant2)
+            self.assertEqual(variant1, variant1)
+
+    def test_unpacked_item_fingerprint(self):
+        # items without weight are hashed like weightless items, not with hash(None)
+        self.assertEqual(
+            get_item_fingerprint(Item("item1", 2, 1, 2, weight=None)),
+            get_item_fingerprint(Item("item1", 2, 1, 2, weight=0.0)),
+        )
+        self.assertEqual(
+            get_item_fingerprint(Item("item1", 2, 1, 2, position=Position(0, 0, 0))),
+            get_item_fingerprint(
+                Item("item1", 2, 1, 2, weight=None, position=Position(0, 0, 0))
+            ),
+        )
+
+        variant1 = PackingVariant()
+        variant1.add_unpacked_item(Item("item1", 2, 1, 2, weight=None), None)
+        variant2 = PackingVariant()
+        variant2.add_unpacked_item(Item("item1", 2, 1, 2, weight=0.0), None)
+        self.assertEqual(variant1, variant2)
+
 
 if __name__ == "__main__":
     unittest.main()
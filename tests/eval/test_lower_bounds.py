@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.order import Order
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.eval.lower_bounds import (
+    get_items_lower_bound,
+    get_l2_bound,
+    get_lower_bound,
+    get_volume_bound,
+    meets_lower_bound,
+)
+
+
+class TestLowerBounds(unittest.TestCase):
+    def test_get_volume_bound(self):
+        dimensions = np.array([[5, 5, 5], [5, 5, 5], [5, 5, 1]])
+        self.assertEqual(get_volume_bound(dimensions, np.array([10, 5, 5])), 2)
+        self.assertEqual(get_volume_bound(dimensions, np.array([10, 10, 10])), 1)
+
+    def test_get_l2_bound(self):
+        # three items larger than half the capacity need a bin each
+        self.assertEqual(get_l2_bound(np.array([6, 6, 6]), 10), 3)
+        # the small items fill the free space of the large items
+        self.assertEqual(get_l2_bound(np.array([6, 6, 4, 4]), 10), 2)
+        self.assertEqual(get_l2_bound(np.array([6, 6, 4, 4, 4]), 10), 3)
+        self.assertEqual(get_l2_bound(np.array([3, 3, 3]), 10), 1)
+        self.assertEqual(get_l2_bound(np.array([]), 10), 0)
+
+    def test_get_lower_bound(self):
+        bins = [Bin(10, 1, 10)]
+        # the volume bound is 1, but the items are wider than half the bin
+        order = Order(
+            "order",
+            articles=[Article("a", width=6, length=1, height=6, amount=2)],
+        )
+        self.assertEqual(get_lower_bound(order, bins), 2)
+        # with rotation only the continuous bounds are used
+        self.assertEqual(get_lower_bound(order, bins, rotation=True), 1)
+        # the padding is added to the width
+        order = Order(
+            "order",
+            articles=[Article("a", width=4, length=1, height=4, amount=4)],
+        )
+        self.assertEqual(get_lower_bound(order, bins), 1)
+        self.assertEqual(get_lower_bound(order, bins, padding_x=2), 2)
+        # with rotation the padding is added to the rotated width
+        order = Order(
+            "order",
+            articles=[Article("a", width=1, length=1, height=8, amount=8)],
+        )
+        self.assertEqual(get_lower_bound(order, bins, padding_x=2), 3)
+        self.assertEqual(get_lower_bound(order, bins, padding_x=2, rotation=True), 1)
+
+    def test_get_lower_bound_weight(self):
+        bins = [Bin(10, 1, 10, max_weight=10)]
+        order = Order(
+            "order",
+            articles=[Article("a", width=1, length=1, height=1, amount=3, weight=4)],
+        )
+        self.assertEqual(get_lower_bound(order, bins), 2)
+
+    def test_get_items_lower_bound(self):
+        bins = [Bin(10, 1, 10)]
+        items = [Item("a", 6, 1, 6) for _ in range(2)]
+        self.assertEqual(get_items_lower_bound(items, bins), 2)
+        self.assertEqual(get_items_lower_bound([], bins), 0)
+
+        # the padded items use the orientation with the smallest volume
+        items = [Item("a", 1 + 2, 1, 8) for _ in range(8)]
+        self.assertEqual(get_items_lower_bound(items, bins, padding_x=2), 3)
+        self.assertEqual(
+            get_items_lower_bound(items, bins, rotation=True, padding_x=2), 1
+        )
+
+    def test_meets_lower_bound(self):
+        variant = PackingVariant()
+        bin = Bin(10, 1, 10)
+        bin.pack_item(Item("a", 2, 1, 2, position=Position(0, 0, 0)))
+        variant.add_bin(bin)
+        self.assertTrue(meets_lower_bound(variant, 1))
+
+        variant.add_unpacked_item(Item("b", 2, 1, 2), None)
+        self.assertFalse(meets_lower_bound(variant, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
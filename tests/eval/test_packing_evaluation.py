@@ -2,7 +2,10 @@ import unittest
 
 from packutils.data.bin import Bin
 from packutils.data.item import Item
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.data.packing_variant import PackingVariant
 from packutils.data.position import Position
+from packutils.eval import packing_evaluation
 from packutils.eval.packing_evaluation import PackingEvaluation, PackingEvaluationWeights
 from packutils.visual.packing_visualization import PackingVisualization
 
@@ -111,6 +114,75 @@ class TestPackingEvaluation(unittest.TestCase):
 
         self.assertTrue(score4 > score1 == score2 > score3)
 
+    def test_evaluate_mirrored_variants_once(self):
+        variants = []
+        for x_large, x_small in [(0, 5), (3, 0)]:
+            bin = Bin(6, 1, 6)
+            bin.pack_item(
+                Item("large", width=3, length=1, height=2, position=Position(x_large, 0, 0))
+            )
+            bin.pack_item(
+                Item("small", width=1, length=1, height=1, position=Position(x_small, 0, 0))
+            )
+            variant = PackingVariant()
+            variant.add_bin(bin)
+            variants.append(variant)
+
+        self.assertNotEqual(variants[0], variants[1])
+        self.assertEqual(
+            variants[0].get_fingerprint(canonical=True),
+            variants[1].get_fingerprint(canonical=True),
+        )
+
+        eval = PackingEvaluation(PackingEvaluationWeights(
+            item_distribution=1.0,
+            item_stacking=1.0,
+            item_grouping=1.0,
+        ))
+        configs = [PackerConfiguration(mirror_walls=False), PackerConfiguration(mirror_walls=True)]
+        scored_variants = list(eval.evaluate_packing_variants(variants, configs))
+        self.assertEqual(len(scored_variants), 1)
+        self.assertEqual(scored_variants[0][1][1], configs)
+
+        scored_variants = list(
+            eval.evaluate_packing_variants(variants, configs, merge_mirrored=False)
+        )
+        self.assertEqual(len(scored_variants), 2)
+        self.assertEqual(scored_variants[0][0], scored_variants[1][0])
+
+
+    def test_evaluate_placement_order(self):
+        large = Item("large", width=4, length=1, height=2, position=Position(0, 0, 0))
+        small = Item("small", width=2, length=1, height=1, position=Position(0, 0, 2))
+        # a packing order with the large item first and with the small item first
+        variants = []
+        for items in ([large, small], [small, large]):
+            bin = Bin(6, 1, 6)
+            bin.packed_items = list(items)
+            variant = PackingVariant()
+            variant.add_bin(bin)
+            variants.append(variant)
+        self.assertEqual(variants[0].get_fingerprint(), variants[1].get_fingerprint())
+
+        eval = PackingEvaluation(PackingEvaluationWeights(item_stacking=1.0))
+        scores = [eval.evaluate_packing_variant(v)[0] for v in variants]
+        self.assertNotEqual(scores[0], scores[1])
+        self.assertEqual(scores[1], eval.evaluate_bin(variants[1].bins[0])[0])
+
+        configs = [PackerConfiguration(), PackerConfiguration()]
+        scored_variants = list(eval.evaluate_packing_variants(variants, configs))
+        self.assertEqual(sorted(s for s, _ in scored_variants), sorted(scores))
+
+    def test_score_cache_size(self):
+        eval = PackingEvaluation(PackingEvaluationWeights())
+        for width in range(1, packing_evaluation.SCORE_CACHE_SIZE + 3):
+            bin = Bin(packing_evaluation.SCORE_CACHE_SIZE + 2, 1, 1)
+            bin.pack_item(Item("item", width=width, length=1, height=1, position=Position(0, 0, 0)))
+            variant = PackingVariant()
+            variant.add_bin(bin)
+            eval.evaluate_packing_variant(variant)
+        self.assertEqual(len(eval._score_cache), packing_evaluation.SCORE_CACHE_SIZE)
+
 
 if __name__ == '__main__':
     unittest.main()
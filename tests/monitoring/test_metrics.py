@@ -0,0 +1,58 @@
+import unittest
+
+from packutils.monitoring import metrics
+from packutils.monitoring.metrics import MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.enabled = metrics.is_enabled()
+        metrics.set_enabled(True)
+        self.registry = MetricsRegistry()
+
+    def tearDown(self):
+        metrics.set_enabled(self.enabled)
+
+    def test_counter(self):
+        counter = self.registry.counter("test_total", "Test counter.")
+        counter.inc()
+        counter.inc(2)
+        self.assertEqual(counter.value, 3)
+
+        metrics.set_enabled(False)
+        counter.inc()
+        self.assertEqual(counter.value, 3)
+
+        self.assertEqual(
+            self.registry.to_text(),
+            "# HELP test_total Test counter.\n# TYPE test_total counter\ntest_total 3\n",
+        )
+
+    def test_histogram(self):
+        histogram = self.registry.histogram("test_seconds", "Test histogram.", (0.1, 1))
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(2)
+        with histogram.time():
+            pass
+
+        self.assertEqual(histogram.count, 4)
+        self.assertEqual(histogram.bucket_counts, [2, 1, 1])
+
+        text = self.registry.to_text()
+        self.assertIn('test_seconds_bucket{le="0.1"} 2\n', text)
+        self.assertIn('test_seconds_bucket{le="1"} 3\n', text)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 4\n', text)
+        self.assertIn("test_seconds_count 4\n", text)
+
+        self.registry.reset()
+        self.assertEqual(histogram.count, 0)
+
+    def test_register_duplicate(self):
+        self.registry.counter("test_total", "Test counter.")
+        with self.assertRaises(ValueError):
+            self.registry.histogram("test_total", "Test histogram.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 
 import unittest
+from packutils.data.article import Article
+from packutils.data.bin import Bin
 from packutils.data.order import Order
 from packutils.data.packing_variant import PackingVariant
 from packutils.solver.abstract_packer import AbstractPacker
@@ -21,6 +23,15 @@ class SubClassWithAllImplementations(AbstractPacker):
         pass
 
 
+class FailingPacker(SubClassWithAllImplementations):
+    def pack_variant(self, order: Order) -> PackingVariant:
+        if order.order_id == "fail":
+            raise ValueError("failed")
+        variant = PackingVariant()
+        variant.add_bin(Bin(1, 1, 1))
+        return variant
+
+
 class AbstractClassTest(unittest.TestCase):
     def test_missing_implementation(self):
         # Create an instance of AnotherSubClass
@@ -30,3 +41,27 @@ class AbstractClassTest(unittest.TestCase):
             SubClassWithAllImplementations()
         except TypeError:
             self.fail("Missing implementation of SubClassWithAllImplementations")
+
+    def test_pack_orders(self):
+        orders = [
+            Order(order_id, [Article("1", width=1, length=1, height=1, amount=1)])
+            for order_id in ["1", "fail", "2", "3"]
+        ]
+        packer = FailingPacker(bins=[Bin(1, 1, 1)])
+
+        for workers in [1, 2]:
+            errors = []
+            packed = list(
+                packer.pack_orders(
+                    orders,
+                    workers=workers,
+                    on_error=lambda order, error: errors.append(
+                        (order.order_id, error)
+                    ),
+                )
+            )
+            self.assertEqual([p.order_id for p in packed], ["1", "2", "3"])
+            self.assertEqual(errors, [("fail", "ValueError('failed')")])
+
+        packed = packer.pack_orders(orders, workers=2, chunksize=2, ordered=False)
+        self.assertEqual(sorted(p.order_id for p in packed), ["1", "2", "3"])
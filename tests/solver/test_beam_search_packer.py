@@ -0,0 +1,117 @@
+import unittest
+import numpy as np
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.eval.packing_evaluation import (
+    PackingEvaluation,
+    PackingEvaluationWeights,
+)
+from packutils.solver.beam_search_packer import (
+    BeamSearchPacker,
+    expand_state,
+    get_proxy_score,
+)
+from packutils.data.item import Item
+from packutils.data.position import Position
+
+
+class TestBeamSearchPacker(unittest.TestCase):
+    def assert_valid_packing(self, bin: Bin):
+        occupancy = np.zeros((bin.height, bin.length, bin.width), dtype=int)
+        for item in bin.packed_items:
+            p = item.position
+            occupancy[
+                p.z : p.z + item.height, p.y : p.y + item.length, p.x : p.x + item.width
+            ] += 1
+        self.assertLessEqual(occupancy.max(), 1)
+
+    def test_pack_variant(self):
+        articles = [
+            Article(article_id="1", width=6, length=4, height=3, amount=4),
+            Article(article_id="2", width=4, length=4, height=3, amount=4),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = BeamSearchPacker(bins=[Bin(10, 8, 6)], beam_width=3)
+
+        variant = packer.pack_variant(order, PackerConfiguration())
+
+        # 6 + 4 fills the width of the bin completely
+        self.assertEqual(len(variant.unpacked_items), 0)
+        self.assertEqual(variant.bins[0].get_used_volume(use_percentage=True), 100)
+        self.assert_valid_packing(variant.bins[0])
+        self.assertGreater(packer.stats["expansions"], 0)
+
+    def test_pack_variant_prefers_more_packed_items(self):
+        articles = [
+            Article(article_id="1", width=5, length=2, height=2, amount=2),
+            Article(article_id="2", width=5, length=3, height=4, amount=4),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = BeamSearchPacker(bins=[Bin(8, 4, 4)], beam_width=2)
+
+        variant = packer.pack_variant(order)
+
+        # the final state with the large item scores higher than the one with both small items
+        self.assertEqual(len(variant.bins[0].packed_items), 2)
+
+    def test_pack_variant_items_without_weight(self):
+        articles = [Article(article_id="1", width=1, length=1, height=1, weight=None, amount=4)]
+        order = Order(order_id="", articles=articles)
+        packer = BeamSearchPacker(bins=[Bin(4, 4, 4, max_weight=2)])
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual(len(variant.bins[0].packed_items), 4)
+
+    def test_pack_variant_multiple_bins(self):
+        articles = [Article(article_id="1", width=5, length=5, height=5, amount=10)]
+        order = Order(order_id="", articles=articles)
+        packer = BeamSearchPacker(bins=[Bin(10, 10, 10), Bin(10, 10, 10)])
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual([len(bin.packed_items) for bin in variant.bins], [8, 2])
+        self.assertEqual(len(variant.unpacked_items), 0)
+
+    def test_pack_variant_evaluation(self):
+        articles = [Article(article_id="1", width=2, length=2, height=2, amount=3)]
+        order = Order(order_id="", articles=articles)
+        packer = BeamSearchPacker(
+            bins=[Bin(4, 4, 4)],
+            evaluation=PackingEvaluation(PackingEvaluationWeights()),
+        )
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual(len(variant.bins[0].packed_items), 3)
+
+    def test_expand_state_keeps_bin(self):
+        bin = Bin(10, 10, 10)
+        bin.pack_item(Item("a", 5, 5, 5, position=Position(0, 0, 0)))
+        shapes = [Item("b", 5, 5, 5), Item("c", 2, 2, 2)]
+        points_before = bin.get_extreme_points().tolist()
+
+        expansions = expand_state(bin, (1, 1), shapes, points_per_state=1)
+
+        # both shapes at the lowest extreme point (ordered by z, y, x)
+        self.assertEqual(
+            [(e.shape_index, e.position) for e in expansions],
+            [(0, (5, 0, 0)), (1, (5, 0, 0))],
+        )
+        self.assertEqual(len(bin.packed_items), 1)
+        self.assertEqual(bin.get_extreme_points().tolist(), points_before)
+
+    def test_proxy_score(self):
+        flat = Bin(4, 4, 4)
+        flat.pack_item(Item("a", 4, 4, 1, position=Position(0, 0, 0)))
+        tower = Bin(4, 4, 4)
+        tower.pack_item(Item("a", 1, 4, 4, position=Position(0, 0, 0)))
+
+        self.assertGreater(get_proxy_score(flat), get_proxy_score(tower))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import numpy as np
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packed_order import PackedOrder
+from packutils.data.packer_configuration import (
+    ItemSelectStrategy,
+    PackerConfiguration,
+    PackerConfigurationTuple,
+)
+from packutils.eval.packing_evaluation import (
+    PackingEvaluation,
+    PackingEvaluationWeights,
+)
+from packutils.data.item import Item
+from packutils.data.position import Position
+from packutils.solver.extreme_point_packer import (
+    FEASIBLE,
+    ExtremePointPacker,
+    _ShapeStatus,
+)
+
+
+class TestExtremePointPacker(unittest.TestCase):
+    def assert_valid_packing(self, bin: Bin):
+        occupancy = np.zeros((bin.height, bin.length, bin.width), dtype=int)
+        for item in bin.packed_items:
+            p = item.position
+            occupancy[
+                p.z : p.z + item.height, p.y : p.y + item.length, p.x : p.x + item.width
+            ] += 1
+        self.assertLessEqual(occupancy.max(), 1)
+
+    def test_pack_variant_3d(self):
+        articles = [
+            Article(article_id="1", width=5, length=5, height=5, amount=8),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(10, 10, 10)])
+
+        variant = packer.pack_variant(order, PackerConfiguration())
+
+        self.assertEqual(len(variant.bins), 1)
+        self.assertEqual(len(variant.unpacked_items), 0)
+        self.assertEqual(variant.bins[0].get_used_volume(use_percentage=True), 100)
+        self.assert_valid_packing(variant.bins[0])
+
+    def test_pack_variant_multiple_bins(self):
+        articles = [
+            Article(article_id="1", width=6, length=4, height=3, amount=10),
+            Article(article_id="2", width=3, length=2, height=2, amount=20),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(10, 8, 6), Bin(10, 8, 6)])
+
+        for strategy in ItemSelectStrategy.list():
+            config = PackerConfiguration(
+                default_select_strategy=strategy, new_layer_select_strategy=strategy
+            )
+            variant = packer.pack_variant(order, config)
+
+            packed = sum(len(bin.packed_items) for bin in variant.bins)
+            self.assertEqual(packed + len(variant.unpacked_items), 30)
+            for bin in variant.bins:
+                self.assert_valid_packing(bin)
+
+    def test_pack_variant_no_item_packed(self):
+        articles = [Article(article_id="1", width=10, length=20, height=30, amount=2)]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(1, 1, 1)])
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual(len(variant.bins), 0)
+        self.assertEqual(len(variant.unpacked_items), 2)
+
+    def test_pack_variant_max_weight(self):
+        articles = [Article(article_id="1", width=1, length=1, height=1, weight=2, amount=5)]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(10, 10, 10, max_weight=5)])
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual(len(variant.bins[0].packed_items), 2)
+        self.assertEqual(len(variant.unpacked_items), 3)
+
+    def test_pack_variant_items_without_weight(self):
+        articles = [Article(article_id="1", width=1, length=1, height=1, weight=None, amount=5)]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(10, 10, 10, max_weight=5)])
+
+        variant = packer.pack_variant(order)
+
+        self.assertEqual(len(variant.bins[0].packed_items), 5)
+
+    def test_pack_variant_configuration_tuple(self):
+        articles = [Article(article_id="1", width=3, length=3, height=3, amount=4)]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(10, 10, 10)])
+
+        config = PackerConfigurationTuple(bin_stability_factor=0.5)
+        packer.pack_variant(order, config)
+        self.assertIs(packer.config, config)
+
+    def test_shape_status_matches_bin(self):
+        articles = [
+            Article(article_id="1", width=3, length=2, height=2, amount=6),
+            Article(article_id="2", width=2, length=4, height=1, amount=6),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(8, 8, 8, stability_factor=0.5)])
+        bin = packer.pack_variant(order).bins[0]
+
+        shapes = [(3, 2, 2), (2, 4, 1), (1, 1, 1), (5, 5, 3)]
+        status = _ShapeStatus(bin, set(shapes))
+        points = bin.extreme_points.points
+        for shape in shapes:
+            for index in np.flatnonzero(bin.extreme_points.active):
+                x, y, z = (int(v) for v in points[index])
+                item = Item("", *shape, position=Position(x, y, z))
+                self.assertEqual(
+                    status.get(shape)[index] == FEASIBLE,
+                    bin.can_item_be_packed(item)[0],
+                    (shape, (x, y, z)),
+                )
+
+    def test_evaluation_and_serialization(self):
+        articles = [
+            Article(article_id="1", width=4, length=4, height=2, amount=6),
+            Article(article_id="2", width=2, length=4, height=4, amount=4),
+        ]
+        order = Order(order_id="order", articles=articles)
+        packer = ExtremePointPacker(bins=[Bin(8, 8, 8)])
+
+        variant = packer.pack_variant(order)
+        config = PackerConfiguration()
+        scores = list(
+            PackingEvaluation(PackingEvaluationWeights()).evaluate_packing_variants(
+                [variant], [config]
+            )
+        )
+        self.assertEqual(len(scores), 1)
+
+        packed_order = PackedOrder(order_id=order.order_id)
+        packed_order.add_packing_variant(variant)
+        data = packed_order.to_dict(as_string=False)
+        self.assertEqual(len(data["packing_variants"][0][0]["positions"]), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from packutils.data.bin import Bin
+from packutils.data.item import Item
+from packutils.data.packing_variant import PackingVariant
+from packutils.data.position import Position
+from packutils.solver.local_search import LocalSearch, get_bin_score, get_top_items
+
+
+class TestLocalSearch(unittest.TestCase):
+    def test_move_top_item_into_hole(self):
+        bin = Bin(4, 1, 4)
+        bin.pack_item(Item("a", 2, 1, 2, position=Position(0, 0, 0)))
+        bin.pack_item(Item("b", 2, 1, 2, position=Position(0, 0, 2)))
+        variant = PackingVariant()
+        variant.add_bin(bin)
+
+        search = LocalSearch()
+        improved = search.improve_variant(variant)
+
+        self.assertEqual(improved.bins[0].max_z, 2)
+        self.assertEqual(search.stats["move"], 1)
+        # the given variant is unchanged
+        self.assertEqual(bin.max_z, 4)
+
+    def test_fill_holes_with_unpacked_items(self):
+        bin = Bin(4, 1, 4)
+        bin.pack_item(Item("a", 2, 1, 2, position=Position(0, 0, 0)))
+        variant = PackingVariant()
+        variant.add_bin(bin)
+        variant.add_unpacked_item(Item("b", 2, 1, 2), None)
+        variant.add_unpacked_item(Item("c", 5, 1, 1), None)
+
+        improved = LocalSearch().improve_variant(variant)
+
+        self.assertEqual(len(improved.bins[0].packed_items), 2)
+        self.assertEqual([item.id for item in improved.unpacked_items], ["c"])
+
+    def test_swap_top_items(self):
+        bin = Bin(4, 1, 6)
+        bin.pack_item(Item("a", 2, 1, 1, position=Position(0, 0, 0)))
+        bin.pack_item(Item("b", 2, 1, 2, position=Position(2, 0, 0)))
+        bin.pack_item(Item("c", 2, 1, 1, position=Position(0, 0, 1)))
+        bin.pack_item(Item("d", 2, 1, 3, position=Position(2, 0, 2)))
+
+        search = LocalSearch()
+        improved = search.improve_variant(_variant(bin))
+
+        self.assertEqual(improved.bins[0].max_z, 4)
+        self.assertEqual(search.stats["swap"], 1)
+
+    def test_shift_levels(self):
+        bin = Bin(2, 1, 6)
+        bin.pack_item(Item("a", 2, 1, 1, position=Position(0, 0, 0)))
+        support = Item("b", 2, 1, 2, position=Position(0, 0, 1))
+        bin.pack_item(support)
+        bin.pack_item(Item("c", 2, 1, 1, position=Position(0, 0, 3)))
+        bin.pack_item(Item("d", 2, 1, 1, position=Position(0, 0, 4)))
+        # creates a gap below c and d
+        bin.remove_item(support)
+
+        search = LocalSearch()
+        search.stats = {"shift": 0}
+        shifted, improved = search._shift_levels(bin, float("inf"))
+
+        self.assertTrue(improved)
+        self.assertEqual(shifted.max_z, 3)
+        self.assertEqual(
+            [item.position.z for item in shifted.packed_items], [0, 1, 2]
+        )
+        # the given bin is unchanged
+        self.assertEqual(bin.max_z, 5)
+
+    def test_get_top_items(self):
+        bin = Bin(4, 1, 4)
+        bin.pack_item(Item("a", 2, 1, 2, position=Position(0, 0, 0)))
+        bin.pack_item(Item("b", 2, 1, 1, position=Position(2, 0, 0)))
+        bin.pack_item(Item("c", 2, 1, 2, position=Position(0, 0, 2)))
+
+        self.assertEqual([item.id for item in get_top_items(bin)], ["c", "b"])
+
+
+def _variant(bin: Bin) -> PackingVariant:
+    variant = PackingVariant()
+    variant.add_bin(bin)
+    return variant
+
+
+if __name__ == "__main__":
+    unittest.main()
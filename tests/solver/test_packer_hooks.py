@@ -0,0 +1,64 @@
+import unittest
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.solver.packer_hooks import CountingHooks, PackerHooks
+from packutils.solver.palletier_wish_packer import PalletierWishPacker
+
+
+class RecordingHooks(PackerHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_item_packed(self, bin, item, snappoint):
+        self.events.append(("packed", item.id, snappoint.x))
+
+
+class TestPackerHooks(unittest.TestCase):
+    def setUp(self):
+        self.order = Order(
+            "order",
+            articles=[
+                Article("1", width=4, length=1, height=2, amount=4),
+                Article("2", width=10, length=1, height=2, amount=1),
+            ],
+        )
+
+    def test_counting_hooks(self):
+        hooks = CountingHooks()
+        packer = PalletierWishPacker(bins=[Bin(10, 1, 4)], hooks=hooks)
+        variant = packer.pack_variant(self.order, PackerConfiguration())
+
+        num_packed = sum(len(bin.packed_items) for bin in variant.bins)
+        self.assertEqual(hooks.counts["item_packed"], num_packed)
+        self.assertEqual(hooks.counts["layer_started"], 2)
+        self.assertGreaterEqual(hooks.counts["snappoint_selected"], num_packed)
+        self.assertGreater(hooks.counts["item_rejected"], 0)
+        self.assertEqual(
+            hooks.num_selections,
+            hooks.counts["item_packed"] + hooks.counts["item_rejected"],
+        )
+
+    def test_hooks_do_not_change_variant(self):
+        hooks = RecordingHooks()
+        variant = PalletierWishPacker(bins=[Bin(10, 1, 4)], hooks=hooks).pack_variant(
+            self.order, PackerConfiguration()
+        )
+        reference = PalletierWishPacker(bins=[Bin(10, 1, 4)]).pack_variant(
+            self.order, PackerConfiguration()
+        )
+
+        self.assertEqual(
+            variant.get_fingerprint(canonical=False),
+            reference.get_fingerprint(canonical=False),
+        )
+        self.assertEqual(
+            [event[1] for event in hooks.events],
+            [item.id for bin in variant.bins for item in bin.packed_items],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
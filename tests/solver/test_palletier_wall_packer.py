@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.solver.palletier_wall_packer import PalletierWallPacker, pack_wall
+
+
+class TestPalletierWallPacker(unittest.TestCase):
+    def assert_valid_packing(self, bin: Bin):
+        occupancy = np.zeros((bin.height, bin.length, bin.width), dtype=int)
+        for item in bin.packed_items:
+            p = item.position
+            occupancy[
+                p.z : p.z + item.height, p.y : p.y + item.length, p.x : p.x + item.width
+            ] += 1
+        self.assertLessEqual(occupancy.max(), 1)
+
+    def test_walls_by_length(self):
+        articles = [
+            Article(article_id="1", width=5, length=6, height=5, amount=4),
+            Article(article_id="2", width=2, length=4, height=2, amount=25),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWallPacker(bins=[Bin(10, 10, 10)])
+
+        variant = packer.pack_variant(order, PackerConfiguration())
+
+        self.assertEqual(len(variant.bins), 1)
+        self.assertEqual(len(variant.unpacked_items), 0)
+        bin = variant.bins[0]
+        self.assert_valid_packing(bin)
+        # the deepest wall is placed first
+        self.assertTrue(
+            all(item.position.y == 0 for item in bin.packed_items if item.id == "1")
+        )
+        self.assertTrue(
+            all(item.position.y == 6 for item in bin.packed_items if item.id == "2")
+        )
+
+    def test_walls_exceeding_bin(self):
+        articles = [
+            Article(article_id="1", width=5, length=4, height=5, amount=12),
+            Article(article_id="2", width=5, length=20, height=5, amount=1),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWallPacker(bins=[Bin(10, 10, 10)])
+
+        variant = packer.pack_variant(order, PackerConfiguration())
+
+        # two walls with four items fit, the third wall and the long item do not
+        self.assertEqual(len(variant.bins[0].packed_items), 8)
+        self.assertEqual(len(variant.unpacked_items), 5)
+        self.assertTrue(all(item.position is None for item in variant.unpacked_items))
+
+    def test_wall_cache(self):
+        pack_wall.cache_clear()
+        articles = [Article(article_id="1", width=2, length=2, height=2, amount=100)]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWallPacker(bins=[Bin(10, 10, 10), Bin(10, 10, 10)])
+
+        variant = packer.pack_variant(order, PackerConfiguration())
+
+        self.assertEqual(sum(len(bin.packed_items) for bin in variant.bins), 100)
+        # the first three walls share the same cache entry, the last wall is not full
+        self.assertEqual(pack_wall.cache_info().misses, 2)
+        self.assertEqual(pack_wall.cache_info().hits, 2)
+        for bin in variant.bins:
+            self.assert_valid_packing(bin)
+
+    def test_parallel_equals_sequential(self):
+        articles = [
+            Article(article_id="1", width=3, length=3, height=2, amount=10),
+            Article(article_id="2", width=2, length=2, height=3, amount=10),
+        ]
+        order = Order(order_id="", articles=articles)
+        bins = [Bin(10, 10, 10)]
+
+        sequential = PalletierWallPacker(bins=bins).pack_variant(order)
+        parallel = PalletierWallPacker(bins=bins, workers=2).pack_variant(order)
+
+        self.assertEqual(sequential, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
+import collections
 import copy
 import unittest
 from packutils.data.article import Article
 from packutils.data.bin import Bin
-from packutils.data.item import Item
+from packutils.data.item import Item, get_rotated_item
 from packutils.data.order import Order
 from packutils.data.packer_configuration import ItemSelectStrategy, PackerConfiguration
 from packutils.data.packing_variant import PackingVariant
@@ -12,6 +13,11 @@ from packutils.solver.palletier_wish_packer import (
     Layer,
     LayerScoreStrategy,
     PalletierWishPacker,
+    assign_items_to_bins,
+    fill_row,
+    get_best_width_fill,
+    get_orientations,
+    select_item_from_list,
 )
 from packutils.visual.packing_visualization import PackingVisualization
 
@@ -100,6 +106,20 @@ class TestPalletierWishPacker(unittest.TestCase):
         self.assertEqual(len(packing_variant.bins[0].packed_items), 3)
         self.assertEqual(expected_items, packing_variant.bins[0].packed_items)
 
+    def test_pack_variant_mirror_walls_different_weights(self):
+        # items with the same dimensions but different weights are saved for the next layer
+        articles = [
+            Article(article_id="a", width=2, length=1, height=1, weight=1.0, amount=3),
+            Article(article_id="b", width=2, length=1, height=1, weight=2.0, amount=1),
+            Article(article_id="c", width=2, length=1, height=2, weight=1.0, amount=2),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWishPacker(bins=[Bin(10, 1, 8)])
+
+        variant = packer.pack_variant(order, PackerConfiguration(mirror_walls=True))
+        packed = sum(len(bin.packed_items) for bin in variant.bins)
+        self.assertEqual(packed + len(variant.unpacked_items), 6)
+
     def test_get_candidate_layers(self):
         self.packer = PalletierWishPacker(
             bins=[Bin(1, 1, 1)],
@@ -121,6 +141,176 @@ class TestPalletierWishPacker(unittest.TestCase):
             scores, sorted(scores, reverse=True), "Layers are not sorted by score"
         )
 
+    def test_get_layer_catalog(self):
+        packer = PalletierWishPacker(
+            bins=[Bin(10, 1, 10)],
+            layer_score_strategy=LayerScoreStrategy.MIN_HEIGHT_VARIANCE,
+        )
+        items = [Item(id="1", width=3, length=1, height=2) for _ in range(4)] + [
+            Item(id="2", width=4, length=1, height=3) for _ in range(2)
+        ]
+
+        catalog = packer.get_layer_catalog(items, 10)
+
+        # layer of height 2 only contains the lower items
+        self.assertEqual(catalog[0][0], Layer(2, -2))
+        self.assertEqual(dict(catalog[0][1]), {((3, 1, 2), 0.0): 3})
+        # layer of height 3 fills the width completely
+        self.assertEqual(catalog[1][0], Layer(3, -4))
+        self.assertEqual(
+            dict(catalog[1][1]), {((3, 1, 2), 0.0): 2, ((4, 1, 3), 0.0): 1}
+        )
+
+    def test_fill_row(self):
+        shapes = {((3, 1, 2), 0.0): 5, ((5, 1, 2), 0.0): 2}
+        row = fill_row(shapes, 14)
+        self.assertEqual(dict(row), {((3, 1, 2), 0.0): 3, ((5, 1, 2), 0.0): 1})
+        self.assertEqual(len(fill_row(shapes, 2)), 0)
+
+    def test_pack_variant_layer_score_strategy(self):
+        articles = [
+            Article(article_id="1", width=3, length=1, height=2, amount=6),
+            Article(article_id="2", width=4, length=1, height=3, amount=3),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWishPacker(
+            bins=[Bin(10, 1, 10)],
+            layer_score_strategy=LayerScoreStrategy.MIN_HEIGHT_VARIANCE,
+        )
+
+        packing_variant = packer.pack_variant(order, PackerConfiguration())
+
+        self.assertEqual(len(packing_variant.unpacked_items), 0)
+        # the first layer is filled with the planned row
+        first_layer = [
+            item for item in packing_variant.bins[0].packed_items if item.position.z == 0
+        ]
+        self.assertEqual(sum(item.width for item in first_layer), 9)
+
+    def test_layer_plan_rotation(self):
+        packer = PalletierWishPacker(
+            bins=[Bin(10, 1, 10)],
+            rotation=True,
+            layer_score_strategy=LayerScoreStrategy.MIN_HEIGHT_VARIANCE,
+        )
+        packer.reset(PackerConfiguration(padding_x=1))
+        packer.layer_plan = collections.Counter({((4, 1, 2), 0.0): 2})
+
+        # a rotated item uses up the plan of its original shape
+        item = get_rotated_item(Item(id="1", width=4, length=1, height=2), 1, 1)
+        self.assertEqual(item.dimensions, (3, 1, 3))
+        bin = Bin(width=10, length=1, height=10)
+        snappoint = Snappoint(x=0, y=0, z=0, direction=SnappointDirection.RIGHT)
+        done, _ = packer.pack_item_on_snappoint(bin, item, snappoint)
+
+        self.assertTrue(done)
+        self.assertEqual(dict(packer.layer_plan), {((4, 1, 2), 0.0): 1})
+
+        articles = [
+            Article(article_id="1", width=3, length=1, height=2, amount=6),
+            Article(article_id="2", width=4, length=1, height=3, amount=3),
+        ]
+        variant = packer.pack_variant(Order(order_id="", articles=articles), None)
+        self.assertEqual(len(variant.unpacked_items), 0)
+
+    def test_pack_variants_stop_at_lower_bound(self):
+        articles = [Article(article_id="1", width=3, length=1, height=2, amount=4)]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWishPacker(bins=[Bin(10, 1, 10), Bin(10, 1, 10)])
+        configs = [PackerConfiguration() for _ in range(3)]
+
+        variants = packer.pack_variants(order, configs)
+        self.assertEqual(len(variants), 3)
+
+        # the first variant packs all items into one bin
+        variants = packer.pack_variants(order, configs, stop_at_lower_bound=True)
+        self.assertEqual(len(variants), 1)
+
+    def test_assign_items_to_bins(self):
+        bins = [Bin(10, 1, 10), Bin(10, 1, 10)]
+        items = [Item(id="1", width=10, length=1, height=4) for _ in range(3)] + [
+            Item(id="2", width=5, length=1, height=4) for _ in range(2)
+        ] + [Item(id="3", width=11, length=1, height=1)]
+
+        assigned, leftovers = assign_items_to_bins(items, bins)
+
+        # the volume is balanced between the bins
+        self.assertEqual(
+            [sum(item.volume for item in bin_items) for bin_items in assigned],
+            [80, 80],
+        )
+        # the item does not fit into any bin
+        self.assertEqual([item.id for item in leftovers], ["3"])
+
+        # items without weight weigh nothing
+        bins = [Bin(10, 1, 10, max_weight=2)]
+        items = [Item(id="1", width=2, length=1, height=2, weight=None) for _ in range(2)]
+        assigned, leftovers = assign_items_to_bins(items, bins)
+        self.assertEqual(len(assigned[0]), 2)
+        self.assertEqual(len(leftovers), 0)
+
+    def test_pack_variant_bin_assignment(self):
+        articles = [
+            Article(article_id="1", width=6, length=1, height=4, amount=3),
+            Article(article_id="2", width=4, length=1, height=4, amount=3),
+        ]
+        order = Order(order_id="", articles=articles)
+        packer = PalletierWishPacker(
+            bins=[Bin(10, 1, 10) for _ in range(3)], bin_assignment=True
+        )
+
+        packing_variant = packer.pack_variant(order, PackerConfiguration())
+
+        self.assertEqual(len(packing_variant.unpacked_items), 0)
+        self.assertEqual(len(packing_variant.bins), 2)
+        self.assertEqual(
+            [len(bin.packed_items) for bin in packing_variant.bins], [3, 3]
+        )
+        self.assertEqual(len(packer.bin_timings), 2)
+
+    def test_get_best_width_fill(self):
+        self.assertEqual(get_best_width_fill(((3, 5), (5, 2)), 14), ((3, 3), (5, 1)))
+        self.assertEqual(get_best_width_fill(((4, 3), (7, 1)), 13), ((4, 3),))
+        self.assertEqual(get_best_width_fill(((6, 1),), 5), ())
+
+    def test_select_largest_w_to_fill_tie(self):
+        # both shapes cover a width of 6, the first item of the list is selected
+        items = [
+            Item(id="1", width=2, length=1, height=1),
+            Item(id="2", width=3, length=1, height=1),
+            Item(id="1", width=2, length=1, height=1),
+            Item(id="2", width=3, length=1, height=1),
+            Item(id="1", width=2, length=1, height=1),
+        ]
+        for strategy in (
+            ItemSelectStrategy.LARGEST_W_TO_FILL,
+            ItemSelectStrategy.LARGEST_W_H_TO_FILL,
+        ):
+            self.assertEqual(select_item_from_list(items, strategy, None).id, "1")
+            reordered = [items[1], items[0], items[3], items[2], items[4]]
+            self.assertEqual(select_item_from_list(reordered, strategy, None).id, "2")
+
+    def test_select_best_w_to_fill(self):
+        items = [Item(id="1", width=5, length=1, height=2) for _ in range(2)] + [
+            Item(id="2", width=4, length=1, height=3) for _ in range(3)
+        ]
+
+        # 4 + 4 + 4 fills the width exactly, the wider items leave a gap
+        selected = select_item_from_list(
+            items, ItemSelectStrategy.BEST_W_TO_FILL, None, fill_width=12
+        )
+        self.assertEqual(selected.width, 4)
+        # 5 + 4 + 4
+        selected = select_item_from_list(
+            items, ItemSelectStrategy.BEST_W_TO_FILL, None, fill_width=13
+        )
+        self.assertEqual(selected.width, 5)
+        # no item fits
+        selected = select_item_from_list(
+            items, ItemSelectStrategy.BEST_W_TO_FILL, None, fill_width=3
+        )
+        self.assertEqual(selected.width, 4)
+
     def test_get_best_item_to_pack_no_item_fit(self):
         bin = Bin(1, 1, 1)
         self.packer = PalletierWishPacker(
@@ -293,6 +483,74 @@ class TestPalletierWishPacker(unittest.TestCase):
         )
         self.assertTrue(result_right, "Failed to pack item on the right snappoint")
 
+    def test_pack_variant_rotation(self):
+        # the items only fit into the bin if they are rotated
+        articles = [Article(article_id="1", width=2, length=1, height=8, amount=2)]
+        order = Order(order_id="", articles=articles)
+        config = PackerConfiguration()
+
+        packer = PalletierWishPacker(bins=[Bin(8, 1, 4)])
+        packing_variant = packer.pack_variant(order, config)
+        self.assertEqual(len(packing_variant.unpacked_items), 2)
+
+        packer = PalletierWishPacker(bins=[Bin(8, 1, 4)], rotation=True)
+        packing_variant = packer.pack_variant(order, config)
+        self.assertEqual(len(packing_variant.unpacked_items), 0)
+        for item in packing_variant.bins[0].packed_items:
+            self.assertEqual(item.dimensions, (8, 1, 2))
+            self.assertEqual(item.position.rotation, 1)
+
+    def test_pack_variant_rotation_padding(self):
+        # the padding stays on the width of the rotated items
+        articles = [Article(article_id="1", width=2, length=1, height=8, amount=2)]
+        order = Order(order_id="", articles=articles)
+        config = PackerConfiguration(padding_x=2)
+
+        packer = PalletierWishPacker(bins=[Bin(10, 1, 4)], rotation=True)
+        packing_variant = packer.pack_variant(order, config)
+        self.assertEqual(len(packing_variant.unpacked_items), 0)
+        for item in packing_variant.bins[0].packed_items:
+            self.assertEqual(item.dimensions, (10, 1, 2))
+            self.assertEqual(item.position.rotation, 1)
+
+    def test_pack_variant_rotation_mirror_walls(self):
+        # rotated and unrotated items with the same dimensions are saved for the next layer
+        articles = [
+            Article(article_id=str(idx), width=w, length=1, height=h, amount=amount)
+            for idx, (w, h, amount) in enumerate([(2, 5, 4), (6, 4, 2), (5, 2, 1), (3, 5, 1)])
+        ]
+        order = Order(order_id="", articles=articles)
+        config = PackerConfiguration(
+            default_select_strategy=ItemSelectStrategy.LARGEST_L_H_W,
+            new_layer_select_strategy=ItemSelectStrategy.LARGEST_W_H_L,
+            direction_change_min_volume=0.05,
+            mirror_walls=True,
+            padding_x=1,
+        )
+        packer = PalletierWishPacker(bins=[Bin(14, 1, 10)], rotation=True)
+
+        variant = packer.pack_variant(order, config)
+        packed = sum(len(bin.packed_items) for bin in variant.bins)
+        self.assertEqual(packed + len(variant.unpacked_items), 8)
+
+    def test_get_orientations(self):
+        self.assertEqual(get_orientations(2, 2, 2), ((0, (2, 2, 2)),))
+        self.assertEqual(
+            get_orientations(2, 1, 8, padding_x=2)[:2], ((0, (4, 1, 8)), (1, (10, 1, 2)))
+        )
+        self.assertEqual(
+            get_orientations(2, 1, 3),
+            (
+                (0, (2, 1, 3)),
+                (1, (3, 1, 2)),
+                (2, (3, 2, 1)),
+                (3, (1, 2, 3)),
+                (4, (1, 3, 2)),
+                (5, (2, 3, 1)),
+            ),
+        )
+        self.assertEqual(len(get_orientations(2, 2, 1)), 3)
+
     def test_fill_gaps_no_gap(self):
         bin = Bin(width=10, length=1, height=2)
         bin.pack_item(Item("", width=5, length=1, height=1, position=Position(0, 0, 0)))
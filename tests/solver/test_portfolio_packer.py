@@ -0,0 +1,109 @@
+import time
+import unittest
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import (
+    PackerConfiguration,
+    PackerConfigurationTuple,
+)
+from packutils.data.packing_variant import PackingVariant
+from packutils.solver.abstract_packer import AbstractPacker
+from packutils.solver.extreme_point_packer import ExtremePointPacker
+from packutils.solver.portfolio_packer import (
+    FAILED,
+    FINISHED,
+    TIMEOUT,
+    UNAVAILABLE,
+    PortfolioPacker,
+)
+from packutils.solver.rectangle_packer import SkylinePacker
+
+
+class SlowPacker(AbstractPacker):
+    def get_params(self) -> dict:
+        return {}
+
+    def pack_variant(self, order: Order) -> PackingVariant:
+        time.sleep(5)
+        return PackingVariant()
+
+    def is_packer_available(self) -> bool:
+        return True
+
+
+class FailingPacker(SlowPacker):
+    def pack_variant(self, order: Order) -> PackingVariant:
+        raise ValueError("failed")
+
+
+class UnavailablePacker(SlowPacker):
+    def is_packer_available(self) -> bool:
+        return False
+
+
+class TestPortfolioPacker(unittest.TestCase):
+    def setUp(self):
+        self.bins = [Bin(10, 10, 1)]
+        self.order = Order(
+            "order",
+            articles=[
+                Article("1", width=6, length=5, height=1, amount=2),
+                Article("2", width=4, length=5, height=1, amount=2),
+            ],
+        )
+
+    def test_race(self):
+        packer = PortfolioPacker(
+            packers=[
+                ExtremePointPacker(bins=self.bins),
+                SkylinePacker(bins=self.bins),
+                SlowPacker(bins=self.bins),
+                FailingPacker(bins=self.bins),
+                UnavailablePacker(bins=self.bins),
+            ],
+            deadline=1.0,
+        )
+
+        start = time.perf_counter()
+        results = packer.race(self.order, PackerConfiguration())
+        self.assertLess(time.perf_counter() - start, 4)
+
+        self.assertEqual(
+            [result.status for result in results],
+            [FINISHED, FINISHED, TIMEOUT, FAILED, UNAVAILABLE][: len(results)],
+        )
+        self.assertEqual(
+            set(result.name for result in results[:2]),
+            {"ExtremePointPacker", "SkylinePacker"},
+        )
+        self.assertEqual(results[2].name, "SlowPacker")
+        self.assertEqual(results[2].duration, 1.0)
+        self.assertEqual(results[3].error, "ValueError('failed')")
+        self.assertEqual(len(results[0].variant.unpacked_items), 0)
+        self.assertIsNotNone(results[0].score)
+
+    def test_pack_variant(self):
+        packer = PortfolioPacker(
+            packers=[SkylinePacker(bins=self.bins), SlowPacker(bins=self.bins)],
+            deadline=0.5,
+        )
+        variant = packer.pack_variant(self.order)
+        self.assertEqual(len(variant.bins[0].packed_items), 4)
+        self.assertEqual(packer.results[0].name, "SkylinePacker")
+
+        packer = PortfolioPacker(packers=[SlowPacker(bins=self.bins)], deadline=0.1)
+        self.assertIsNone(packer.pack_variant(self.order))
+
+
+    def test_reset_configuration_tuple(self):
+        packer = PortfolioPacker(packers=[SkylinePacker(bins=self.bins)])
+
+        packer.reset(PackerConfigurationTuple(padding_x=2, mirror_walls=True))
+        self.assertIsInstance(packer.config, PackerConfiguration)
+        self.assertEqual(packer.config.padding_x, 2)
+        self.assertTrue(packer.config.mirror_walls)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+import numpy as np
+
+from packutils.data.article import Article
+from packutils.data.bin import Bin
+from packutils.data.order import Order
+from packutils.data.packer_configuration import PackerConfiguration
+from packutils.solver.rectangle_packer import (
+    MaxRectsPacker,
+    SkylinePacker,
+    _FreeRectangles,
+    _RectanglePacker,
+    _Skyline,
+)
+
+
+class TestRectanglePacker(unittest.TestCase):
+    def setUp(self):
+        self.order = Order(
+            "order",
+            articles=[
+                Article("1", width=5, length=5, height=1, amount=2),
+                Article("2", width=10, length=5, height=1, amount=1),
+            ],
+        )
+
+    def test_pack_variant(self):
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            for heuristic in packer_class.SUPPORTED_HEURISTICS:
+                packer = packer_class(bins=[Bin(10, 10, 1)], heuristic=heuristic)
+                variant = packer.pack_variant(self.order, PackerConfiguration())
+
+                self.assertEqual(len(variant.unpacked_items), 0)
+                self.assertEqual(len(variant.bins), 1)
+                self.assertEqual(variant.bins[0].get_used_volume(True), 100)
+
+    def test_pack_variant_multiple_bins(self):
+        self.order.articles[0].amount = 7
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            packer = packer_class(bins=[Bin(10, 10, 1), Bin(10, 10, 1)])
+            variant = packer.pack_variant(self.order, PackerConfiguration())
+
+            self.assertEqual(len(variant.unpacked_items), 1)
+            self.assertEqual(
+                [len(bin.packed_items) for bin in variant.bins], [3, 4]
+            )
+
+    def test_pack_variant_rotation(self):
+        order = Order(
+            "order", articles=[Article("1", width=2, length=8, height=1, amount=1)]
+        )
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            packer = packer_class(bins=[Bin(8, 2, 1)])
+            variant = packer.pack_variant(order, PackerConfiguration())
+            self.assertEqual(len(variant.unpacked_items), 1)
+
+            packer = packer_class(bins=[Bin(8, 2, 1)], rotation=True)
+            variant = packer.pack_variant(order, PackerConfiguration())
+            self.assertEqual(len(variant.unpacked_items), 0)
+            item = variant.bins[0].packed_items[0]
+            self.assertEqual((item.width, item.length), (8, 2))
+
+    def test_pack_variant_rotation_padding(self):
+        order = Order(
+            "order", articles=[Article("1", width=2, length=1, height=8, amount=2)]
+        )
+        config = PackerConfiguration(padding_x=2)
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            packer = packer_class(
+                bins=[Bin(10, 1, 4)], rotation=True, heuristic="bottom_left"
+            )
+            variant = packer.pack_variant(order, config)
+            self.assertEqual(len(variant.unpacked_items), 0)
+            for item in variant.bins[0].packed_items:
+                self.assertEqual(item.dimensions, (10, 1, 2))
+
+    def test_pack_variant_stability(self):
+        order = Order(
+            "order",
+            articles=[
+                Article("1", width=2, length=1, height=4, amount=1),
+                Article("2", width=4, length=1, height=1, amount=1),
+            ],
+        )
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            packer = packer_class(bins=[Bin(4, 1, 6)], heuristic="bottom_left")
+
+            # the wide item can not be placed on the half supported top of the tall item
+            variant = packer.pack_variant(order, PackerConfiguration())
+            self.assertEqual([item.id for item in variant.unpacked_items], ["2"])
+
+            variant = packer.pack_variant(
+                order, PackerConfiguration(bin_stability_factor=0.5)
+            )
+            self.assertEqual(len(variant.unpacked_items), 0)
+            self.assertEqual(variant.bins[0].packed_items[1].position.z, 4)
+
+    def test_pack_variant_items_without_weight(self):
+        order = Order(
+            "order",
+            articles=[Article("1", width=5, length=5, height=1, weight=None, amount=2)],
+        )
+        for packer_class in (SkylinePacker, MaxRectsPacker):
+            packer = packer_class(bins=[Bin(10, 10, 1, max_weight=1)])
+            variant = packer.pack_variant(order, PackerConfiguration())
+            self.assertEqual(len(variant.bins[0].packed_items), 2)
+
+    def test_abstract_base(self):
+        with self.assertRaises(TypeError):
+            _RectanglePacker(bins=[Bin(10, 10, 1)])
+
+    def test_invalid_heuristic(self):
+        with self.assertRaises(ValueError):
+            SkylinePacker(bins=[Bin(10, 10, 1)], heuristic="best_area")
+        with self.assertRaises(ValueError):
+            MaxRectsPacker(bins=[Bin(10, 10, 10)])
+
+    def test_skyline(self):
+        skyline = _Skyline(10, 10, "bottom_left")
+        skyline.place(0, 0, 4, 3)
+        self.assertEqual(skyline.find(np.array([[6, 2]])), (0, 4, 0))
+        self.assertEqual(skyline.find(np.array([[7, 2]])), (0, 0, 3))
+        self.assertIsNone(skyline.find(np.array([[7, 8]])))
+
+    def test_free_rectangles(self):
+        free = _FreeRectangles(10, 10, "best_shortside")
+        free.place(0, 0, 4, 3)
+        # the maximal free rectangles right of and above the placed rectangle
+        self.assertEqual(
+            sorted(map(tuple, free.rectangles.tolist())), [(0, 3, 10, 7), (4, 0, 6, 10)]
+        )
+        self.assertEqual(free.find(np.array([[6, 10]])), (0, 4, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from packutils.data.bin import Bin
+from packutils.solver.extreme_point_packer import ExtremePointPacker
+from packutils.solver.registry import (
+    PACKERS,
+    create_packer,
+    get_packer_class,
+    get_packer_names,
+    register_packer,
+)
+
+
+class TestRegistry(unittest.TestCase):
+    def test_get_packer_class(self):
+        self.assertIs(get_packer_class("extreme_point"), ExtremePointPacker)
+        with self.assertRaises(ValueError):
+            get_packer_class("unknown")
+
+    def test_create_packer(self):
+        packer = create_packer("extreme_point", bins=[Bin(5, 5, 5)])
+        self.assertIsInstance(packer, ExtremePointPacker)
+        self.assertEqual(packer.reference_bins[0].width, 5)
+
+    def test_registered_packers_importable(self):
+        for name in get_packer_names():
+            self.assertTrue(callable(get_packer_class(name)), name)
+
+    def test_register_packer(self):
+        register_packer("custom", "packutils.solver.extreme_point_packer:ExtremePointPacker")
+        try:
+            self.assertIn("custom", get_packer_names())
+            self.assertIs(get_packer_class("custom"), ExtremePointPacker)
+        finally:
+            del PACKERS["custom"]
+            get_packer_class.cache_clear()
+
+
+if __name__ == "__main__":
+    unittest.main()